@@ -1,35 +1,109 @@
-from akutils.pandas_type_conversion import (
-    columns_to_float,
-    columns_to_int,
-    columns_to_date
-)
-from akutils.pandas_read_files import (
-    read_csv_in_chunks,
-    read_multiple_csv_from_dir,
-    read_multiple_xlsx_from_dir,
-    read_multiple_csv_from_zip,
-)
-from akutils.pandas_serie_cleaner import (
-    strip_columns,
-    remove_accent_from_cols,
-    capitalise_cols,
-    fillna_numerical_columns,
-    remove_empty_cols_from_df,
-    convert_datetimes_to_date,
-    map_col_and_insert_next,
-)
-from akutils.os import (
-    list_files_from_dir,
-    list_dir_from_dir,
-    remove_files_from_directory,
-    remove_dir,
-    create_new_dir,
-    warn
-)
-from akutils.utils_functions import (
-    timeit,
-    sanitize_function_args_from_locals
-)
-from akutils.console_color import (
-    print_orange
-)
+# Public API: {module: [names]}. Modules are only imported when one of their names is
+# first accessed (see akutils.__getattr__), so that `import akutils` stays cheap.
+API = {
+    "akutils.pandas_type_conversion": [
+        "columns_to_float",
+        "columns_to_int",
+        "columns_to_date",
+        "DateParseReport",
+    ],
+    "akutils.pandas_read_files": [
+        "read_csv_in_chunks",
+        "read_multiple_csv_from_dir",
+        "read_multiple_xlsx_from_dir",
+        "read_multiple_csv_from_zip",
+        "read_multiple_parquet_from_dir",
+        "file_source_lookup",
+    ],
+    "akutils.pandas_fwf": [
+        "read_fwf_in_chunks",
+        "read_multiple_fwf_from_dir",
+        "read_multiple_fwf_from_zip",
+    ],
+    "akutils.pandas_concat": [
+        "concat_dataframes",
+        "normalize_column_name",
+        "SchemaDriftReport",
+    ],
+    "akutils.pandas_dedup": [
+        "RowDeduplicator",
+    ],
+    "akutils.pandas_checkpoint": [
+        "IngestionCheckpoint",
+    ],
+    "akutils.pandas_sniff": [
+        "sniff_csv",
+        "sniff_bytes",
+        "SniffResult",
+    ],
+    "akutils.pandas_sample": [
+        "RowSampler",
+    ],
+    "akutils.pandas_write_files": [
+        "write_xlsx",
+        "write_csv_partitions",
+    ],
+    "akutils.pandas_chunksize": [
+        "ChunkSizer",
+        "ChunkStat",
+    ],
+    "akutils.pandas_compact": [
+        "compact_parquet_dir",
+        "CompactionReport",
+    ],
+    "akutils.pandas_aggregate": [
+        "StreamingAggregator",
+    ],
+    "akutils.pandas_profile": [
+        "profile_df",
+        "get_profile",
+        "invalidate_profile",
+        "ColumnProfile",
+        "DataFrameProfile",
+    ],
+    "akutils.pandas_serie_cleaner": [
+        "strip_columns",
+        "remove_accent_from_cols",
+        "capitalise_cols",
+        "fillna_numerical_columns",
+        "remove_empty_cols_from_df",
+        "convert_datetimes_to_date",
+        "map_col_and_insert_next",
+        "map_cols_and_insert_next",
+        "MapperIndex",
+        "MappingReport",
+    ],
+    "akutils.pandas_pipeline": [
+        "CleaningPipeline",
+    ],
+    "akutils.progress": [
+        "ProgressEvent",
+        "LoggingProgress",
+        "RichProgress",
+        "throttle",
+    ],
+    "akutils.fs_session": [
+        "FileSystemSession",
+        "get_session",
+        "set_session",
+    ],
+    "akutils.os": [
+        "list_files_from_dir",
+        "list_dir_from_dir",
+        "remove_files_from_directory",
+        "remove_dir",
+        "create_new_dir",
+        "file_fingerprint",
+        "is_local_path",
+        "warn",
+    ],
+    "akutils.utils_functions": [
+        "timeit",
+        "persist_cache",
+        "CacheInfo",
+        "sanitize_function_args_from_locals",
+    ],
+    "akutils.console_color": [
+        "print_orange",
+    ],
+}
@@ -1,11 +1,26 @@
-# Import API
-from akutils.__api__ import *
+# Lazy API: each subsystem (pandas, pyarrow, azure, rich...) is imported on first use
+from importlib import import_module
+from pathlib import Path
+from akutils.__api__ import API
+
+_NAME_TO_MODULE = {name: module for module, names in API.items() for name in names}
+__all__ = list(_NAME_TO_MODULE)
 
 # Get path to akutils pkg to import test fixtures
-from pathlib import Path
-from pkg_resources import resource_filename
+PATH_TO_AKUTILS_PKG = Path(__file__).parent
+
+
+def __getattr__(name: str):
+    if name not in _NAME_TO_MODULE:
+        raise AttributeError(f"module 'akutils' has no attribute '{name}'")
+    value = getattr(import_module(_NAME_TO_MODULE[name]), name)
+    globals()[name] = value  # next accesses skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
 
-PATH_TO_AKUTILS_PKG = Path(resource_filename(__name__, "/"))
 
 # module level doc-string
 __docformat__ = "restructuredtext"
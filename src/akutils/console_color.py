@@ -1,6 +1,13 @@
-from rich.console import Console
+from functools import lru_cache
 
-console = Console()
+
+@lru_cache(maxsize=None)
+def get_console():
+    """
+    Shared rich Console, rich is only imported on first print
+    """
+    from rich.console import Console
+    return Console()
 
 
 def print_orange(message: str, **kwargs):
@@ -12,4 +19,4 @@ def print_orange(message: str, **kwargs):
     warnings.warn = print_orange  # Override default warn
     warnings.warn(message="hello world")
     """
-    console.print(f"[yellow]{message}[/yellow]")
+    get_console().print(f"[yellow]{message}[/yellow]")
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar, TYPE_CHECKING, cast
+
+from akutils.os import _correct_azure_path, is_local_path
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem  # type: ignore
+    from upath import UPath
+
+_LOCAL = ("file",)  # filesystem key of local paths
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class FileSystemSession:
+    """
+    fsspec filesystems shared by all akutils operations, with a metadata cache and a
+    concurrency limit for bulk operations.
+
+    A single filesystem (and so a single pool of HTTP connections and a single
+    authentication) is kept per protocol, storage options and options given by the
+    url (e.g. the account of abfs://container@account...), i.e. per storage
+    account: paths of the same account reuse it, whatever the UPath object they
+    come from. Directory listings of remote filesystems are cached with the type,
+    size and modification time of each entry, so listing a directory then reading
+    or fingerprinting its files needs no request per file (local listings are not
+    cached: they are cheap and local files are often rewritten).
+
+    Parameters
+    ----------
+    max_concurrency : int, default 16
+        Maximum number of requests sent in parallel by bulk operations (rm, map)
+    cache_ttl : float, default 60.
+        Seconds a listing or a file info is cached, 0 disables the cache
+    batch_size : int, default 256
+        Number of paths per delete request of rm
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        # more parallel deletes and a longer lived metadata cache
+        ak.set_session(ak.FileSystemSession(max_concurrency=64, cache_ttl=300))
+        ak.remove_files_from_directory(dir_path, regex="*.parquet")
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        cache_ttl: float = 60.,
+        batch_size: int = 256,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.cache_ttl = cache_ttl
+        self.batch_size = batch_size
+        self._filesystems: dict[tuple, AbstractFileSystem] = {}
+        # {(filesystem key, fs path): (timestamp, entries / info)}
+        self._listings: dict[tuple, tuple[float, list[dict]]] = {}
+        self._infos: dict[tuple, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"FileSystemSession(filesystems={len(self._filesystems)}, "
+            f"cached_listings={len(self._listings)}, "
+            f"max_concurrency={self.max_concurrency}, cache_ttl={self.cache_ttl})"
+        )
+
+    def _resolve(self, path: str | Path | UPath) -> tuple[tuple, str]:
+        """
+        (filesystem key, path on the filesystem), the filesystem being registered on
+        first use
+        """
+        if is_local_path(path):
+            from fsspec.implementations.local import LocalFileSystem  # type: ignore
+
+            with self._lock:
+                fs = self._filesystems.setdefault(_LOCAL, LocalFileSystem())
+            return _LOCAL, fs._strip_protocol(str(path))
+
+        from fsspec import get_filesystem_class  # type: ignore
+        from upath import UPath
+
+        upath = path if isinstance(path, UPath) else UPath(path)
+        upath = cast(UPath, _correct_azure_path(upath))
+        # options the filesystem gets from the url (e.g. the azure account of
+        # abfs://container@account...), not the container / bucket: containers and
+        # buckets of an account share a filesystem
+        url_options = get_filesystem_class(upath.protocol)._get_kwargs_from_urls(
+            str(upath))
+        options = json.dumps(
+            {**url_options, **upath.storage_options}, sort_keys=True, default=str)
+        key = (upath.protocol, options)
+        with self._lock:
+            if key not in self._filesystems:
+                self._filesystems[key] = upath.fs
+        return key, upath.path.rstrip("/") or "/"
+
+    def filesystem(self, path: str | Path | UPath) -> tuple[AbstractFileSystem, str]:
+        """
+        (shared filesystem, path on this filesystem) of a local or remote path
+        """
+        key, fs_path = self._resolve(path)
+        return self._filesystems[key], fs_path
+
+    def _cached(self, cache: dict, key: tuple):
+        if key[0] == _LOCAL:
+            return None
+        hit = cache.get(key)
+        if hit is None or time.monotonic() - hit[0] > self.cache_ttl:
+            return None
+        return hit[1]
+
+    def ls(self, dir_path: str | Path | UPath, refresh: bool = False) -> list[dict]:
+        """
+        Entries of a directory (fsspec details: name, type, size...), from a single
+        listing request cached for cache_ttl seconds
+        """
+        key, fs_path = self._resolve(dir_path)
+        entries = None if refresh else self._cached(self._listings, (key, fs_path))
+        if entries is not None:
+            return entries
+        entries = self._filesystems[key].ls(fs_path, detail=True)
+        if key == _LOCAL:
+            return entries
+        now = time.monotonic()
+        with self._lock:
+            self._listings[(key, fs_path)] = (now, entries)
+            for entry in entries:
+                name = entry["name"].rstrip("/")
+                self._infos[(key, name)] = (now, entry)
+        return entries
+
+    def info(self, path: str | Path | UPath, refresh: bool = False) -> dict:
+        """
+        fsspec info of a file (name, type, size, modification time...), taken from
+        the cached listing of its directory when available
+        """
+        key, fs_path = self._resolve(path)
+        info = None if refresh else self._cached(self._infos, (key, fs_path))
+        if info is not None:
+            return info
+        info = self._filesystems[key].info(fs_path)
+        if key == _LOCAL:
+            return info
+        with self._lock:
+            self._infos[(key, fs_path)] = (time.monotonic(), info)
+        return info
+
+    def open(self, path: str | Path | UPath, mode: str = "rb", **kwargs):
+        """
+        Open a file with the shared filesystem of its storage account
+        """
+        fs, fs_path = self.filesystem(path)
+        return fs.open(fs_path, mode, **kwargs)
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """
+        func applied to each item, at most max_concurrency calls in parallel
+        (threads: the calls are expected to wait on I/O), results in items order
+        """
+        items = list(items)
+        if self.max_concurrency == 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        workers = min(self.max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def rm(
+        self,
+        paths: str | Path | Iterable[str | Path | UPath],
+        recursive: bool = False,
+    ):
+        """
+        Delete files (or directories with recursive=True) in bulk: paths are sent by
+        batches of batch_size (a single request on stores supporting batch deletes),
+        at most max_concurrency batches in parallel
+        """
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        by_filesystem: dict[tuple, list[str]] = {}
+        for path in paths:
+            key, fs_path = self._resolve(path)
+            by_filesystem.setdefault(key, []).append(fs_path)
+
+        batches = [
+            (key, fs_paths[i:i + self.batch_size])
+            for key, fs_paths in by_filesystem.items()
+            for i in range(0, len(fs_paths), self.batch_size)
+        ]
+
+        def remove_batch(batch: tuple[tuple, list[str]]):
+            key, fs_paths = batch
+            self._filesystems[key].rm(fs_paths, recursive=recursive)
+
+        try:
+            self.map(remove_batch, batches)
+        finally:
+            for key, fs_paths in by_filesystem.items():
+                self._invalidate(key, fs_paths, recursive)
+
+    def _invalidate(self, key: tuple, fs_paths: list[str], recursive: bool = False):
+        # the paths, their parent listings and, when recursive, everything below them
+        stale = set(fs_paths) | {p.rsplit("/", 1)[0] or "/" for p in fs_paths}
+        prefixes = tuple(p.rstrip("/") + "/" for p in fs_paths) if recursive else ()
+        with self._lock:
+            for cache in (self._listings, self._infos):
+                for cache_key in list(cache):
+                    cached_key, cached_path = cache_key
+                    if cached_key == key and (
+                        cached_path in stale
+                        or (prefixes and cached_path.startswith(prefixes))
+                    ):
+                        del cache[cache_key]
+
+    def invalidate(self, path: str | Path | UPath | None = None):
+        """
+        Drop the cached metadata of a path (its entries and its parent listing), or
+        of all paths
+        """
+        if path is None:
+            with self._lock:
+                self._listings.clear()
+                self._infos.clear()
+            return
+        key, fs_path = self._resolve(path)
+        self._invalidate(key, [fs_path], recursive=True)
+
+
+_SESSION: FileSystemSession | None = None
+
+
+def get_session() -> FileSystemSession:
+    """
+    Session used by the akutils functions (created on first use)
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = FileSystemSession()
+    return _SESSION
+
+
+def set_session(session: FileSystemSession | None) -> FileSystemSession | None:
+    """
+    Replace the session used by the akutils functions (None: a default session is
+    created on next use), the previous session is returned
+    """
+    global _SESSION
+    previous, _SESSION = _SESSION, session
+    return previous
@@ -1,13 +1,35 @@
-import os
+from __future__ import annotations
+
 import re
 import warnings
-from azure.core.exceptions import HttpResponseError
-from upath import UPath
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING
 
 from akutils.console_color import print_orange
 
+if TYPE_CHECKING:
+    from upath import UPath
+
+
+def _http_response_error() -> type[Exception]:
+    # azure is only imported when an exception is raised: an except clause evaluates
+    # its expression only when an exception reaches it
+    from azure.core.exceptions import HttpResponseError
+    return HttpResponseError
+
+
+def _is_missing_blob(exc: BaseException) -> bool:
+    """
+    Azure listing of a blob prefix that does not really exist (e.g. empty dir)
+    """
+    try:
+        return (
+            isinstance(exc, _http_response_error())
+            and getattr(exc, "status_code", None) == 404
+        )
+    except ImportError:
+        return False
+
 
 def _correct_azure_path(file_path: Path | UPath) -> Path | UPath:
     """
@@ -19,7 +41,7 @@ def _correct_azure_path(file_path: Path | UPath) -> Path | UPath:
     file_path = "abfs://u@lab.dfs.net/user/data/abfs:/u@lab.dfs.net/user/data/src"
     _correct_azure_path(file_path)
 
-    # Normal path
+    # Normal path (returned unchanged)
     file_path = "abfs://u@lab.dfs.net/user/data/src"
     _correct_azure_path(file_path)
 
@@ -34,12 +56,92 @@ def _correct_azure_path(file_path: Path | UPath) -> Path | UPath:
     path_str = str(file_path)
     # Look for a pattern like: abfs:/.../abfs:/... and fix it
     match = re.search(r"(abfs:/.*)(abfs:/.*)", path_str)
-    if match:
-        path_str = match.group(2)  # drop the second abfs:/...
-        path_str = re.sub(r'\babfs:/\b', 'abfs://', path_str)
+    if not match:
+        return file_path
+    from upath import UPath
+
+    path_str = match.group(2)  # drop the second abfs:/...
+    path_str = re.sub(r'\babfs:/\b', 'abfs://', path_str)
     return UPath(path_str)
 
 
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Network like errors worth a retry (not missing file or permission errors)
+    """
+    if isinstance(exc, (FileNotFoundError, PermissionError, IsADirectoryError)):
+        return False
+    try:
+        if isinstance(exc, _http_response_error()):
+            return getattr(exc, "status_code", None) not in (401, 403, 404)
+    except ImportError:
+        pass
+    return isinstance(exc, (OSError, TimeoutError))
+
+
+def is_local_path(file_path) -> bool:
+    """
+    Path of the local file system (str without protocol, Path or local UPath)
+    """
+    if isinstance(file_path, str):
+        return "://" not in file_path
+    return isinstance(file_path, Path) and not getattr(file_path, "protocol", "")
+
+
+def file_fingerprint(file_path: Path | UPath) -> tuple:
+    """
+    (path, size, modification time) of a local or remote file, used to detect that
+    a file changed (cache and checkpoint keys). The info of a remote file comes from
+    the cached listing of its directory when available (see ak.FileSystemSession)
+    """
+    if not is_local_path(file_path):
+        from akutils.fs_session import get_session
+
+        info = get_session().info(file_path)
+        modified = next(
+            (
+                info[key]
+                for key in ("mtime", "last_modified", "LastModified", "etag", "created")
+                if info.get(key) is not None
+            ),
+            None,
+        )
+        return (str(file_path), info.get("size"), str(modified))
+    stat = file_path.stat()
+    return (str(file_path), stat.st_size, stat.st_mtime)
+
+
+def _list_entries(
+    dir_path: Path | UPath,
+    entry_type: str,
+    regex: str,
+    case_sensitive: bool,
+) -> list[Path | UPath]:
+    """
+    Paths of the entries of a given type ('file' or 'directory') whose name matches
+    regex, from a single (cached) listing of the shared filesystem session: no
+    request per entry to get its type, no new filesystem per entry
+    """
+    from akutils.fs_session import get_session
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    dir_path = _correct_azure_path(dir_path)
+    try:
+        entries = get_session().ls(dir_path)
+    except Exception as error:
+        if not _is_missing_blob(error):
+            raise
+        return []
+    matched = []
+    for entry in entries:
+        if entry.get("type") != entry_type:
+            continue
+        name = entry["name"].rstrip("/").rsplit("/", 1)[-1]
+        if re.search(pattern=regex, string=name, flags=flags):
+            matched.append(dir_path / name)
+    return matched
+
+
 def list_files_from_dir(
     dir_path: Path | UPath,
     regex: str = r".*",
@@ -58,20 +160,7 @@ def list_files_from_dir(
     case_sensitive : bool, default False
         Allow to enable or disable case sensitive on regex match
     """
-    flags = 0 if case_sensitive else re.IGNORECASE
-    all_path: Generator[Path | UPath, None, None] = dir_path.glob("*")
-    matched_files = []
-    for path in all_path:
-        corrected_path = _correct_azure_path(path)
-        try:
-            if not corrected_path.is_file():
-                continue
-        except HttpResponseError:
-            # blob not really exist (e.g. empty dir)
-            continue
-        if re.search(pattern=regex, string=corrected_path.name, flags=flags):
-            matched_files.append(corrected_path)
-    return matched_files
+    return _list_entries(dir_path, "file", regex, case_sensitive)
 
 
 def list_dir_from_dir(
@@ -91,20 +180,7 @@ def list_dir_from_dir(
     case_sensitive : bool, default False
         Allow to enable or disable case sensitive on regex match
     """
-    flags = 0 if case_sensitive else re.IGNORECASE
-    all_path: Generator[Path | UPath, None, None] = dir_path.glob("*")
-    matched_dirs = []
-    for path in all_path:
-        corrected_path = _correct_azure_path(path)
-        try:
-            if not corrected_path.is_dir():
-                continue
-        except HttpResponseError:
-            # blob not really exist (e.g. empty dir)
-            continue
-        if re.search(pattern=regex, string=corrected_path.name, flags=flags):
-            matched_dirs.append(corrected_path)
-    return matched_dirs
+    return _list_entries(dir_path, "directory", regex, case_sensitive)
 
 
 def create_new_dir(
@@ -121,6 +197,8 @@ def create_new_dir(
     force : bool, default False
         Use force=True to delete the current directory if it already exists
     """
+    from upath import UPath
+
     if isinstance(dir_path, str):
         dir_path = UPath(dir_path)
     # if dir already exist and force disable : return error
@@ -132,6 +210,9 @@ def create_new_dir(
         remove_dir(dir_path)
     # create new dir
     UPath(dir_path).mkdir(parents=True, exist_ok=False)
+    if not is_local_path(dir_path):
+        from akutils.fs_session import get_session
+        get_session().invalidate(dir_path)
 
 
 def remove_dir(dir_path: str | Path | UPath):
@@ -143,6 +224,8 @@ def remove_dir(dir_path: str | Path | UPath):
     dir_path : str | Path | UPath
         Path of the new directory
     """
+    from upath import UPath
+
     if isinstance(dir_path, str):
         dir_path = UPath(dir_path)
 
@@ -151,6 +234,15 @@ def remove_dir(dir_path: str | Path | UPath):
     if not dir_path.is_dir():
         raise ValueError(f"Path '{dir_path}' is not a directory.")
 
+    if not is_local_path(dir_path):
+        from akutils.fs_session import get_session
+
+        # object stores: bulk deletes with the shared filesystem, not one request
+        # per blob and per (virtual) directory
+        print(f"REMOVE {dir_path}")
+        get_session().rm(dir_path, recursive=True)
+        return
+
     # Iterate over directory contents
     for item in dir_path.iterdir():
         try:
@@ -177,19 +269,25 @@ def remove_files_from_directory(
     regex: str = r"*.parquet"
 ):
     """
-    Create new directory.
+    Remove the files of a directory matching a glob pattern.
+
+    Files are deleted in bulk by the shared filesystem session (batched requests
+    on object stores, see ak.FileSystemSession)
 
     Parameters
     ----------
     dir_path : Path | UPath
         Path of the directory to be scanned
-    regex : str, default r".*"
-        Regex string to match the files to be removed.
+    regex : str, default r"*.parquet"
+        Glob pattern to match the files to be removed.
         Default behaviour lists only .parquet files founded in the directory
     """
-    file_list = UPath(dir_path).glob(regex)
-    for file in file_list:
-        os.remove(file)
+    from upath import UPath
+    from akutils.fs_session import get_session
+
+    file_list = list(UPath(dir_path).glob(regex))
+    if file_list:
+        get_session().rm(file_list)
 
 
 def warn(message: str):
@@ -0,0 +1,347 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+# merge rule of each partial statistic
+_PARTIAL_RULES = {
+    "sum": "sum",
+    "count": "sum",
+    "numeric_count": "sum",  # non-null values once converted to numbers (mean)
+    "size": "sum",
+    "min": "min",
+    "max": "max",
+}
+_NUMERIC_PARTIALS = ("sum", "numeric_count")
+# partial statistics needed by each aggregation
+_AGG_PARTIALS = {
+    "sum": ["sum"],
+    "count": ["count"],
+    "size": ["size"],
+    "min": ["min"],
+    "max": ["max"],
+    "mean": ["sum", "numeric_count"],
+    "nunique_approx": [],
+}
+_UINT64_MAX = np.uint64(0xFFFFFFFFFFFFFFFF)
+# partials of the chunks are buffered and merged into the state once they hold as
+# many entries (groups and HLL registers) as the state, and at least this number
+_MIN_REDUCE_SIZE = 100_000
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """
+    Number of leading zero bits of uint64 values (64 for 0), branchless
+    """
+    count = np.zeros(len(values), dtype=np.uint8)
+    values = values.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        top_zero = values <= (_UINT64_MAX >> np.uint64(shift))
+        count += top_zero.astype(np.uint8) * np.uint8(shift)
+        values = np.where(top_zero, values << np.uint64(shift), values)
+    return count + (values == 0)
+
+
+def _max_by_key(keys: np.ndarray, ranks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Highest rank of each key, keys sorted
+    """
+    order = np.lexsort((ranks, keys))
+    keys, ranks = keys[order], ranks[order]
+    last = np.append(keys[1:] != keys[:-1], True)
+    return keys[last], ranks[last]
+
+
+def _hll_estimate(
+    keys: np.ndarray, ranks: np.ndarray, nb_groups: int, precision: int
+) -> np.ndarray:
+    """
+    HyperLogLog cardinality estimate of each group from its sparse registers: keys
+    (group position * 2 ** precision + register) and ranks of non-zero registers
+    """
+    m = 2**precision
+    groups = (keys >> precision).astype(np.intp)
+    nb_zeros = m - np.bincount(groups, minlength=nb_groups)
+    inverse_sum = np.bincount(
+        groups, weights=np.power(2.0, -ranks.astype(np.float64)), minlength=nb_groups)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    raw = alpha * m**2 / (inverse_sum + nb_zeros)
+    # small cardinalities: linear counting
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / np.maximum(nb_zeros, 1))
+    estimate = np.where((raw <= 2.5 * m) & (nb_zeros > 0), linear, raw)
+    return np.round(estimate).astype(np.int64)
+
+
+class StreamingAggregator:
+    """
+    Group by aggregation computed chunk by chunk: each chunk is reduced to partial
+    aggregates merged into the running state, so the raw rows never need to be held
+    in memory. Aggregators of different chunks, files or processes can be combined
+    with merge.
+
+    Memory: the state holds one row per group (a few numbers per aggregation).
+    Partials of the chunks are buffered and merged into the state once they hold as
+    many entries as the state, so the buffer at most doubles the state and each
+    group is merged O(log(chunks)) times. nunique_approx registers are sparse: only
+    non-zero registers are kept, 9 bytes each, i.e. about 9 bytes per distinct value
+    of a small group and at most 9 * 2 ** hll_precision bytes per group (lower
+    hll_precision for many high cardinality groups).
+
+    Supported aggregations: 'sum', 'count' (non-null values), 'size' (rows),
+    'min', 'max', 'mean' and 'nunique_approx' (HyperLogLog, standard error about
+    1.04 / sqrt(2 ** hll_precision)). 'sum' and 'mean' convert string columns to
+    numbers (invalid values ignored).
+
+    Parameters
+    ----------
+    by : str | list
+        Group keys
+    aggs : dict
+        {output column: (column, aggregation)}, or {column: aggregation} and
+        {column: [aggregations]} (output columns '{column}_{aggregation}')
+    hll_precision : int, default 12
+        HyperLogLog registers per group and nunique_approx column: 2 ** precision
+        (12: 4096 registers, about 1.6% error)
+    dropna : bool, default True
+        Drop the rows whose group keys are missing
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        aggregator = ak.StreamingAggregator(
+            by="country",
+            aggs={
+                "amount": ["sum", "mean"],
+                "nb_rows": ("amount", "size"),
+                "nb_customers": ("customer_id", "nunique_approx"),
+            },
+        )
+        df = ak.read_multiple_csv_from_dir(dir_path, sep=";", aggregate=aggregator)
+    """
+
+    def __init__(
+        self,
+        by: str | list,
+        aggs: dict,
+        hll_precision: int = 12,
+        dropna: bool = True,
+    ):
+        if not 4 <= hll_precision <= 16:
+            raise ValueError("hll_precision must be between 4 and 16")
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.aggs = self._normalize_aggs(aggs)
+        self.hll_precision = hll_precision
+        self.dropna = dropna
+        self.n_rows = 0
+        self._stats: pd.DataFrame | None = None  # partial statistics per group
+        # sparse HLL registers per column: (keys, ranks), the key of a register being
+        # its group position in _stats * 2 ** hll_precision + its index
+        self._registers: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._pending: list[tuple[pd.DataFrame, dict]] = []  # partials not merged
+        self._pending_size = 0
+
+    def __repr__(self) -> str:
+        nb_groups = 0 if self._stats is None else len(self._stats)
+        return (
+            f"StreamingAggregator(by={self.by}, n_rows={self.n_rows}, "
+            f"groups={nb_groups}, pending_partials={len(self._pending)})"
+        )
+
+    @staticmethod
+    def _normalize_aggs(aggs: dict) -> list[tuple[str, str, str]]:
+        normalized = []
+        for name, spec in aggs.items():
+            if isinstance(spec, tuple):
+                column, func = spec
+                normalized.append((name, column, func))
+            elif isinstance(spec, list):
+                normalized.extend((f"{name}_{func}", name, func) for func in spec)
+            else:
+                normalized.append((name, name, spec))
+        for _, _, func in normalized:
+            if func not in _AGG_PARTIALS:
+                raise ValueError(
+                    f"Unknown aggregation: {func}, expected one of "
+                    f"{list(_AGG_PARTIALS)}")
+        return normalized
+
+    def _partial_columns(self) -> list[tuple[str, str]]:
+        # (column, partial statistic), in the column order of the partial state
+        return list(dict.fromkeys(
+            (column, stat)
+            for _, column, func in self.aggs
+            for stat in _AGG_PARTIALS[func]
+        ))
+
+    def _hll_columns(self) -> list[str]:
+        return list(dict.fromkeys(
+            column for _, column, func in self.aggs if func == "nunique_approx"))
+
+    def _hll_registers(
+        self, values: pd.Series, group_codes: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        precision = self.hll_precision
+        keep = values.notna().to_numpy() & (group_codes >= 0)
+        hashes = pd.util.hash_pandas_object(values[keep], index=False).to_numpy()
+        slots = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+        ranks = np.minimum(
+            _leading_zeros(hashes << np.uint64(precision)) + 1, 64 - precision + 1)
+        keys = (group_codes[keep].astype(np.int64) << precision) | slots
+        return _max_by_key(keys, ranks.astype(np.uint8))
+
+    def _size(self, stats: pd.DataFrame, registers: dict) -> int:
+        return len(stats) + sum(len(keys) for keys, _ in registers.values())
+
+    def _partial(self, df: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+        """
+        (partial statistics per group, HLL registers per column) of a chunk
+        """
+        partial_columns = self._partial_columns()
+        data = {}
+        for position, (column, stat) in enumerate(partial_columns):
+            values = df[column]
+            if stat in _NUMERIC_PARTIALS and not is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors="coerce")
+            data[position] = values
+        keys = [df[key] for key in self.by]
+        groups = pd.DataFrame(data, index=df.index).groupby(
+            keys, sort=False, dropna=self.dropna)
+        sizes = groups.size()
+        stats = pd.DataFrame(
+            {
+                position: (
+                    sizes if stat == "size"
+                    else groups[position].count() if stat == "numeric_count"
+                    else groups[position].agg(stat)
+                )
+                for position, (_, stat) in enumerate(partial_columns)
+            },
+            index=sizes.index,
+        )
+        registers = {}
+        hll_columns = self._hll_columns()
+        if hll_columns:
+            # rows of dropped (missing) keys: NaN group number
+            group_codes = groups.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+            for column in hll_columns:
+                registers[column] = self._hll_registers(df[column], group_codes)
+        return stats, registers
+
+    def _combine(self, stats: pd.DataFrame, registers: dict):
+        """
+        Buffer partial aggregates, merged into the state once the buffer is as large
+        as the state (amortized linear merge cost)
+        """
+        self._pending.append((stats, registers))
+        self._pending_size += self._size(stats, registers)
+        state_size = 0 if self._stats is None else self._size(
+            self._stats, self._registers)
+        if self._pending_size >= max(state_size, _MIN_REDUCE_SIZE):
+            self._reduce()
+
+    def _reduce(self):
+        """
+        Merge the buffered partials into the state: partial statistics grouped on
+        the group keys, registers aligned on the group positions of the new state
+        """
+        if not self._pending:
+            return
+        parts = self._pending
+        if self._stats is not None:
+            parts = [(self._stats, self._registers)] + parts
+        self._pending, self._pending_size = [], 0
+        if len(parts) == 1:
+            self._stats, self._registers = parts[0]
+            return
+        codes, groups = parts[0][0].index.append(
+            [stats.index for stats, _ in parts[1:]]).factorize(use_na_sentinel=False)
+        rules = {
+            position: _PARTIAL_RULES[stat]
+            for position, (_, stat) in enumerate(self._partial_columns())
+        }
+        merged = (
+            pd.concat([stats for stats, _ in parts], ignore_index=True)
+            .groupby(codes, sort=True).agg(rules) if rules
+            else pd.DataFrame(index=np.arange(len(groups)))
+        )
+        merged.index = groups
+        starts = np.cumsum([0] + [len(stats) for stats, _ in parts[:-1]])
+        precision = self.hll_precision
+        for column in self._hll_columns():
+            keys, ranks = [], []
+            for (_, registers), start in zip(parts, starts):
+                part_keys, part_ranks = registers[column]
+                positions = codes[start + (part_keys >> precision)].astype(np.int64)
+                keys.append((positions << precision) | (part_keys & (2**precision - 1)))
+                ranks.append(part_ranks)
+            self._registers[column] = _max_by_key(
+                np.concatenate(keys), np.concatenate(ranks))
+        self._stats = merged
+
+    def update(self, df: pd.DataFrame) -> "StreamingAggregator":
+        """
+        Merge the partial aggregates of a chunk into the running state
+        """
+        if len(df):
+            self.n_rows += len(df)
+            self._combine(*self._partial(df))
+        return self
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Chunk hook of the readers: the chunk is aggregated, no row is kept
+        """
+        self.update(df)
+        return df.iloc[:0]
+
+    def merge(self, other: "StreamingAggregator") -> "StreamingAggregator":
+        """
+        Merge the state of another aggregator with the same by and aggs (e.g.
+        computed in another process)
+        """
+        if (other.by, other.aggs, other.hll_precision) != (
+                self.by, self.aggs, self.hll_precision):
+            raise ValueError("Aggregators with different by, aggs or precision")
+        other._reduce()
+        if other._stats is not None:
+            self.n_rows += other.n_rows
+            self._combine(other._stats, other._registers)
+        return self
+
+    def result(self) -> pd.DataFrame:
+        """
+        Final aggregates, one row per group (group keys as columns)
+        """
+        self._reduce()
+        if self._stats is None:
+            return pd.DataFrame(columns=self.by + [name for name, _, _ in self.aggs])
+        stats = self._stats
+        positions = {
+            partial: position
+            for position, partial in enumerate(self._partial_columns())
+        }
+        result = pd.DataFrame(index=stats.index)
+        for name, column, func in self.aggs:
+            if func == "mean":
+                total = stats[positions[(column, "sum")]]
+                count = stats[positions[(column, "numeric_count")]]
+                result[name] = total / count.where(count > 0)
+            elif func == "nunique_approx":
+                result[name] = _hll_estimate(
+                    *self._registers[column], len(stats), self.hll_precision)
+            else:
+                result[name] = stats[positions[(column, func)]]
+        result.index.names = self.by
+        return result.reset_index()
+
+
+def _get_aggregator(
+    aggregate: StreamingAggregator | dict | None
+) -> StreamingAggregator | None:
+    if aggregate is None or isinstance(aggregate, StreamingAggregator):
+        return aggregate
+    return StreamingAggregator(**aggregate)
@@ -0,0 +1,108 @@
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
+from typing import Literal
+
+DtypeBackend = Literal["numpy_nullable", "pyarrow"]
+
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+
+def is_arrow_dtype(serie: pd.Series) -> bool:
+    """
+    Check if a pd.Series is backed by a pyarrow array
+    """
+    return isinstance(serie.dtype, pd.ArrowDtype)
+
+
+def arrow_type(serie: pd.Series) -> pa.DataType | None:
+    """
+    pyarrow type of an Arrow backed pd.Series, None for other series
+    """
+    dtype = serie.dtype
+    return dtype.pyarrow_dtype if isinstance(dtype, pd.ArrowDtype) else None
+
+
+def use_arrow(serie: pd.Series, dtype_backend: DtypeBackend | None = None) -> bool:
+    """
+    Arrow compute kernels are used when requested or when the serie already is Arrow
+    """
+    return dtype_backend == "pyarrow" or is_arrow_dtype(serie)
+
+
+def to_arrow(serie: pd.Series) -> pa.ChunkedArray:
+    """
+    Get the pyarrow ChunkedArray of a pd.Series (zero-copy for Arrow backed series)
+    """
+    if is_arrow_dtype(serie):
+        return serie.array.__arrow_array__()
+    try:
+        return pa.chunked_array([pa.array(serie, from_pandas=True)])
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # object column of mixed types: values as text, missing values kept
+        text = serie.astype(str).where(serie.notna(), None)
+        return pa.chunked_array([pa.array(text, type=pa.string(), from_pandas=True)])
+
+
+def to_arrow_string(serie: pd.Series) -> pa.ChunkedArray:
+    """
+    Get the pd.Series as a pyarrow string ChunkedArray, non string types are casted
+    """
+    array = to_arrow(serie)
+    if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        return array
+    return array.cast(pa.string())
+
+
+def to_arrow_str(serie: pd.Series) -> pa.ChunkedArray:
+    """
+    Get serie.astype(str) as a pyarrow string ChunkedArray: missing values are
+    written as text ("None", "nan", "<NA>"), as by the numpy path of the cleaners
+    """
+    if is_arrow_dtype(serie) or isinstance(serie.dtype, pd.StringDtype):
+        return pc.fill_null(to_arrow_string(serie), "<NA>")
+    return pa.chunked_array([pa.array(serie.astype(str), type=pa.string())])
+
+
+def from_arrow(array: pa.ChunkedArray | pa.Array, like: pd.Series) -> pd.Series:
+    """
+    Wrap a pyarrow array into an Arrow backed pd.Series sharing index and name of like
+    """
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(array), index=like.index, name=like.name)
+
+
+def dtype_to_arrow(dtype):
+    """
+    Translate the "string" dtype into its Arrow equivalent, for read_csv dtype arg
+    """
+    if isinstance(dtype, dict):
+        return {col: dtype_to_arrow(col_dtype) for col, col_dtype in dtype.items()}
+    if dtype in ("string", str, "str", object, "object"):
+        return ARROW_STRING
+    return dtype
+
+
+def unify_schemas(schemas: list[pa.Schema]) -> pa.Schema:
+    """
+    Common schema of Parquet files (e.g. int32 and int64 -> int64), the columns
+    without common type (e.g. int64 and string) are read as strings
+    """
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        pass
+    fields: dict = {}
+    for schema in schemas:
+        for field in schema:
+            if field.name not in fields:
+                fields[field.name] = field
+                continue
+            try:
+                fields[field.name] = pa.unify_schemas(
+                    [pa.schema([fields[field.name]]), pa.schema([field])],
+                    promote_options="permissive",
+                ).field(0)
+            except (pa.ArrowTypeError, pa.ArrowInvalid):
+                fields[field.name] = pa.field(field.name, pa.string())
+    return pa.schema(list(fields.values()), metadata=schemas[0].metadata)
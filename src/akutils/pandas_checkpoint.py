@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import shutil
+import pandas as pd
+from pathlib import Path
+
+from upath import UPath
+
+from akutils.os import file_fingerprint
+from akutils.utils_functions import _fingerprint, _Unhashable
+
+_MANIFEST = "manifest.json"
+
+
+def _read_args_key(read_args: dict | None) -> str:
+    """
+    Hash of the arguments a source is read with (read_csv arguments, chunk_func by
+    qualified name...), an argument without stable fingerprint never matches
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        _fingerprint(read_args or {}, digest)
+    except _Unhashable as error:
+        digest.update(f"{error}{os.getpid()}{id(read_args)}".encode())
+    return digest.hexdigest()
+
+
+class IngestionCheckpoint:
+    """
+    Local spill area of a multi-file ingestion, used to resume it after a failure.
+
+    Each chunk read (after chunk_func) is saved as a parquet file and recorded in a
+    manifest with the number of rows read so far and the byte offset following the
+    last record read. A rerun loads the completed files and chunks instead of
+    reading them again, and reopens a partially read file at this offset. A file is
+    read again from scratch when it changed since its checkpoint (size or
+    modification time) or when it is read with other arguments (read_csv
+    arguments, chunk_func...).
+
+    The checkpoint is kept after a successful ingestion (a rerun then only reads new
+    or modified files), call clear() to remove it.
+
+    Parameters
+    ----------
+    checkpoint_dir : str | Path
+        Local directory of the checkpoint, created if needed
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df = ak.read_multiple_csv_from_dir(
+            dir_path, sep=";", checkpoint="/tmp/sales_ingestion", retries=3)
+    """
+
+    def __init__(self, checkpoint_dir: str | Path):
+        self.path = Path(checkpoint_dir)
+        self.path.mkdir(parents=True, exist_ok=True)
+        manifest_path = self.path / _MANIFEST
+        self.manifest: dict = {}
+        if manifest_path.exists():
+            self.manifest = json.loads(manifest_path.read_text())
+
+    def __repr__(self) -> str:
+        nb_done = sum(entry["done"] for entry in self.manifest.values())
+        return (
+            f"IngestionCheckpoint('{self.path}', files_done={nb_done}, "
+            f"files_in_progress={len(self.manifest) - nb_done})"
+        )
+
+    def _save_manifest(self):
+        # atomic replace: a crash never leaves a truncated manifest
+        tmp_path = self.path / f"{_MANIFEST}.tmp"
+        tmp_path.write_text(json.dumps(self.manifest, indent=1))
+        os.replace(tmp_path, self.path / _MANIFEST)
+
+    def _chunk_dir(self, entry: dict) -> Path:
+        return self.path / entry["dir"]
+
+    def start(
+        self, source: str | Path | UPath, read_args: dict | None = None
+    ) -> tuple[list[pd.DataFrame], int, bool]:
+        """
+        (completed chunks, number of source rows they cover, file fully read) of a
+        source, its checkpoint is reset if the file changed or if it was read with
+        other arguments (read_args: read_csv arguments, chunk_func...)
+        """
+        key = str(source)
+        fingerprint = list(file_fingerprint(UPath(source)))
+        args_key = _read_args_key(read_args)
+        entry = self.manifest.get(key)
+        if entry is not None and (
+            entry["fingerprint"] != fingerprint
+            or entry.get("read_args") != args_key
+            # partially read file whose offset is unknown: read again
+            or (not entry["done"] and entry["rows_read"] and not entry.get("offsets"))
+        ):
+            shutil.rmtree(self._chunk_dir(entry), ignore_errors=True)
+            entry = None
+        if entry is None:
+            key_hash = hashlib.md5(key.encode()).hexdigest()[:12]
+            entry = {
+                "fingerprint": fingerprint,
+                "read_args": args_key,
+                "dir": f"{key_hash}_{UPath(source).stem}",
+                "chunks": 0,
+                "rows_read": 0,
+                "done": False,
+            }
+            self.manifest[key] = entry
+            self._save_manifest()
+        chunk_dir = self._chunk_dir(entry)
+        chunks = [
+            pd.read_parquet(chunk_dir / f"chunk_{i:06d}.parquet")
+            for i in range(entry["chunks"])
+        ]
+        return chunks, entry["rows_read"], entry["done"]
+
+    def resume_offsets(self, source: str | Path | UPath) -> tuple[int, int] | None:
+        """
+        (end of the header, end of the last record read) byte offsets of a partially
+        read source, None if not started
+        """
+        offsets = self.manifest[str(source)].get("offsets")
+        return None if offsets is None else tuple(offsets)
+
+    def save_chunk(
+        self,
+        source: str | Path | UPath,
+        chunk: pd.DataFrame,
+        rows_read: int,
+        offsets: tuple[int, int] | None = None,
+    ):
+        """
+        Save a processed chunk, rows_read being the number of source rows read so far
+        and offsets the byte offsets of the end of the header and of the last record
+        read
+        """
+        entry = self.manifest[str(source)]
+        chunk_dir = self._chunk_dir(entry)
+        chunk_dir.mkdir(exist_ok=True)
+        chunk_path = chunk_dir / f"chunk_{entry['chunks']:06d}.parquet"
+        chunk.to_parquet(chunk_path, index=False)
+        entry["chunks"] += 1
+        entry["rows_read"] = rows_read
+        entry["offsets"] = None if offsets is None else list(offsets)
+        self._save_manifest()
+
+    def mark_done(self, source: str | Path | UPath):
+        self.manifest[str(source)]["done"] = True
+        self._save_manifest()
+
+    def clear(self):
+        """
+        Remove the checkpoint directory
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+        self.manifest = {}
+
+
+def _get_checkpoint(
+    checkpoint: str | Path | IngestionCheckpoint | None
+) -> IngestionCheckpoint | None:
+    if checkpoint is None or isinstance(checkpoint, IngestionCheckpoint):
+        return checkpoint
+    return IngestionCheckpoint(checkpoint)
@@ -0,0 +1,174 @@
+import time
+from dataclasses import asdict, dataclass
+from typing import Iterator
+import pandas as pd
+
+from akutils.utils_functions import parse_bytes
+
+# rows of the first chunk, parsed to measure the bytes per row of the file
+PROBE_ROWS = 10_000
+# rows measured (evenly spaced) to estimate the memory of a chunk
+_SAMPLE_ROWS = 2_000
+
+
+@dataclass
+class ChunkStat:
+    """
+    A chunk read with an adaptive chunk size
+
+    Attributes
+    ----------
+    source : str
+        File (or zip member) name
+    chunk_index : int
+        Index of the chunk in the file
+    chunksize : int
+        Rows requested
+    rows : int
+        Rows read
+    bytes_per_row : float
+        Measured memory per row of the parsed chunk
+    seconds : float
+        Parsing time
+    """
+    source: str
+    chunk_index: int
+    chunksize: int
+    rows: int
+    bytes_per_row: float
+    seconds: float
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.rows * self.bytes_per_row)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.
+
+
+def _bytes_per_row(chunk: pd.DataFrame) -> float:
+    """
+    Memory per row of a chunk (strings included), measured on evenly spaced rows
+    """
+    step = max(len(chunk) // _SAMPLE_ROWS, 1)
+    sample = chunk.iloc[::step]
+    return float(sample.memory_usage(index=False, deep=True).sum()) / len(sample)
+
+
+class ChunkSizer:
+    """
+    Chunk size driven by a memory budget instead of a number of rows.
+
+    The first chunk (probe_rows rows) measures the memory per row of the parsed
+    data, each next chunk is sized so that it fits in max_chunk_bytes. The estimate
+    is updated after every chunk: it rises at once on wider rows and decays slowly
+    on narrower ones, so the budget holds on files whose rows widen as they go. An
+    instance shared across files (multi-file readers) starts each new file with the
+    size learned on the previous ones.
+
+    Parameters
+    ----------
+    max_chunk_bytes : int | str
+        Memory budget of a parsed chunk, e.g. "512MB"
+    min_rows : int, default 1_000
+        Smallest chunk size
+    max_rows : int, default None
+        Largest chunk size, default no limit
+    probe_rows : int, default PROBE_ROWS
+        Rows of the first chunk
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        sizer = ak.ChunkSizer("512MB")
+        df = ak.read_multiple_csv_from_dir(dir_path, sep=";", max_chunk_bytes=sizer)
+        sizer.to_frame()  # chunk sizes, bytes per row and rows/s of each chunk
+    """
+
+    def __init__(
+        self,
+        max_chunk_bytes: int | str,
+        min_rows: int = 1_000,
+        max_rows: int | None = None,
+        probe_rows: int = PROBE_ROWS,
+    ):
+        self.max_chunk_bytes = parse_bytes(max_chunk_bytes)
+        if self.max_chunk_bytes <= 0:
+            raise ValueError("max_chunk_bytes must be positive")
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.probe_rows = probe_rows
+        self.bytes_per_row: float | None = None
+        self.history: list[ChunkStat] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"ChunkSizer(max_chunk_bytes={self.max_chunk_bytes}, "
+            f"chunksize={self.next_size()}, chunks={len(self.history)})"
+        )
+
+    def next_size(self) -> int:
+        """
+        Rows of the next chunk
+        """
+        if self.bytes_per_row is None:
+            size = self.probe_rows
+        else:
+            size = int(self.max_chunk_bytes // max(self.bytes_per_row, 1.))
+        size = max(size, self.min_rows)
+        return min(size, self.max_rows) if self.max_rows else size
+
+    def record(
+        self, source: str, chunk: pd.DataFrame, chunksize: int, seconds: float
+    ):
+        """
+        Update the bytes per row estimate with a parsed chunk
+        """
+        if len(chunk) == 0:
+            return
+        bytes_per_row = _bytes_per_row(chunk)
+        if self.bytes_per_row is None or bytes_per_row >= self.bytes_per_row:
+            self.bytes_per_row = bytes_per_row
+        else:
+            self.bytes_per_row = (self.bytes_per_row + bytes_per_row) / 2
+        chunk_index = sum(stat.source == source for stat in self.history)
+        self.history.append(ChunkStat(
+            source, chunk_index, chunksize, len(chunk), bytes_per_row, seconds))
+
+    def iter_chunks(self, reader, source: str = "") -> Iterator[pd.DataFrame]:
+        """
+        Chunks of a pd.read_csv reader (TextFileReader), each sized by next_size
+        """
+        while True:
+            chunksize, start = self.next_size(), time.perf_counter()
+            try:
+                chunk = reader.get_chunk(chunksize)
+            except StopIteration:
+                return
+            self.record(source, chunk, chunksize, time.perf_counter() - start)
+            yield chunk
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        One row per chunk read: chosen chunk size, rows, memory and throughput
+        """
+        frame = pd.DataFrame(
+            [asdict(stat) for stat in self.history],
+            columns=list(ChunkStat.__dataclass_fields__),
+        )
+        frame["nbytes"] = [stat.nbytes for stat in self.history]
+        frame["rows_per_sec"] = [stat.rows_per_sec for stat in self.history]
+        return frame
+
+
+def _get_chunk_sizer(
+    max_chunk_bytes: int | str | ChunkSizer | None
+) -> ChunkSizer | None:
+    if max_chunk_bytes is None or isinstance(max_chunk_bytes, ChunkSizer):
+        return max_chunk_bytes
+    return ChunkSizer(max_chunk_bytes)
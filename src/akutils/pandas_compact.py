@@ -0,0 +1,211 @@
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+import pandas as pd
+import pyarrow.dataset as ds  # type: ignore
+from upath import UPath
+
+from akutils.fs_session import get_session
+from akutils.os import is_local_path, list_files_from_dir, warn
+from akutils.pandas_arrow import unify_schemas
+from akutils.utils_functions import parse_bytes, timeit
+
+JOURNAL_NAME = "_compaction.json"
+_STAGING_PREFIX = "_compaction-"
+
+
+@dataclass
+class CompactionReport:
+    """
+    Outcome of ak.compact_parquet_dir
+
+    Attributes
+    ----------
+    files_before : int
+        Parquet files compacted (files already big enough are not counted)
+    files_after : int
+        Files written in their place
+    bytes_before : int
+        Size of the compacted files
+    bytes_after : int
+        Size of the written files
+    rows : int
+        Rows rewritten
+    seconds : float
+        Duration of the compaction
+    """
+    files_before: int = 0
+    files_after: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    rows: int = 0
+    seconds: float = 0.
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "files": [self.files_before, self.files_after],
+                "bytes": [self.bytes_before, self.bytes_after],
+            },
+            index=pd.Index(["before", "after"], name="compaction"),
+        )
+
+
+def _recover(dir_path: UPath):
+    """
+    Finish a compaction interrupted after its journal was written: staged files
+    are moved in, compacted files still present are deleted. The staging
+    directories of compactions interrupted before their journal was written are
+    removed (the directory is left as it was)
+    """
+    session = get_session()
+    fs, fs_dir = session.filesystem(dir_path)
+    journal_path = f"{fs_dir}/{JOURNAL_NAME}"
+    if fs.exists(journal_path):
+        with fs.open(journal_path, "rb") as file:
+            journal = json.load(file)
+        warn(f"[WARNING] Resume the interrupted compaction {journal['token']}")
+        staging = f"{fs_dir}/{_STAGING_PREFIX}{journal['token']}"
+        for name in journal["new"]:
+            if fs.exists(f"{staging}/{name}"):
+                fs.mv(f"{staging}/{name}", f"{fs_dir}/{name}")
+        remaining = [
+            name for name in journal["old"] if fs.exists(f"{fs_dir}/{name}")]
+        session.rm([dir_path / name for name in remaining])
+        fs.rm(journal_path)
+    fs.invalidate_cache(fs_dir)
+    for staging in fs.glob(f"{fs_dir}/{_STAGING_PREFIX}*"):
+        fs.rm(staging, recursive=True)
+    session.invalidate(dir_path)
+
+
+@timeit
+def compact_parquet_dir(
+    dir_path: str | Path | UPath,
+    target_file_size: int | str = "256MB",
+    sort_by: str | list | None = None,
+    regex: str = r".*",
+    row_group_rows: int = 2**20,
+    compression: str = "snappy",
+) -> CompactionReport:
+    """
+    Rewrite the small Parquet files of a local or remote (UPath) directory into
+    files of about target_file_size, with a single schema (the common schema of
+    the files, missing columns filled with nulls, columns without common type
+    written as strings) and optionally a sort order.
+    Downstream scans then open a few big files instead of thousands of small ones.
+
+    The new files are written to a staging directory first. A journal listing the
+    new and old files is then written, the staged files are moved in and the old
+    files are deleted in bulk (see ak.FileSystemSession). Object stores have no
+    atomic rename of several files: a reader listing the directory during the swap
+    may see both versions, but an interrupted swap is finished by the next call
+    (the journal is replayed), so no row is lost or duplicated once it completes.
+    The staging directory of a compaction interrupted before the swap is removed
+    by the next call.
+
+    Parameters
+    ----------
+    dir_path : str | Path | UPath
+        Directory of the Parquet files
+    target_file_size : int | str, default "256MB"
+        Size of the written files, estimated from the compressed bytes per row of
+        the input files. Files already bigger are left untouched.
+    sort_by : str | list, default None
+        Columns the rows are sorted by, across all the written files. Only the
+        compacted (small) files are sorted: the files left untouched are not
+        merged in, so the directory as a whole is not sorted. Sorting loads the
+        compacted rows in memory, without it they are streamed.
+    regex : str, default r".*"
+        Regex string to select the files to compact
+    row_group_rows : int, default 2**20
+        Rows per row group of the written files
+    compression : str, default "snappy"
+        Parquet compression codec of the written files
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        report = ak.compact_parquet_dir(dir_path, target_file_size="512MB")
+        report.to_frame()
+    """
+    start = time.perf_counter()
+    session = get_session()
+    dir_path = dir_path if isinstance(dir_path, UPath) else UPath(dir_path)
+    _recover(dir_path)
+    target_bytes = parse_bytes(target_file_size)
+
+    files = [
+        file for file in list_files_from_dir(dir_path, regex=regex)
+        if file.suffix.lower() in (".parquet", ".pq")
+    ]
+    sizes = [session.info(file)["size"] for file in files]
+    small = [(file, size) for file, size in zip(files, sizes) if size < target_bytes]
+    if len(small) < 2:
+        return CompactionReport(seconds=time.perf_counter() - start)
+
+    fs, fs_dir = session.filesystem(dir_path)
+    local = is_local_path(dir_path)
+    paths = [session.filesystem(file)[1] for file, _ in small]
+    filesystem = None if local else fs
+    dataset = ds.dataset(paths, filesystem=filesystem, format="parquet")
+    schemas = session.map(lambda fragment: fragment.physical_schema,
+                          list(dataset.get_fragments()))
+    schema = unify_schemas(schemas)
+    dataset = ds.dataset(paths, schema=schema, filesystem=filesystem, format="parquet")
+    nb_rows = dataset.count_rows()
+    bytes_before = sum(size for _, size in small)
+    rows_per_file = max(int(target_bytes * nb_rows / max(bytes_before, 1)), 1)
+
+    data = dataset
+    if sort_by is not None:
+        keys = [sort_by] if isinstance(sort_by, str) else list(sort_by)
+        data = dataset.to_table().sort_by([(key, "ascending") for key in keys])
+
+    token = uuid.uuid4().hex[:8]
+    staging = f"{fs_dir}/{_STAGING_PREFIX}{token}"
+    rows_per_group = min(row_group_rows, rows_per_file)
+    written: list[str] = []
+    ds.write_dataset(
+        data,
+        staging,
+        filesystem=filesystem,
+        format="parquet",
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression=compression),
+        basename_template=f"compacted-{token}-{{i}}.parquet",
+        max_rows_per_file=rows_per_file,
+        min_rows_per_group=rows_per_group,
+        max_rows_per_group=rows_per_group,
+        preserve_order=sort_by is not None,
+        file_visitor=lambda written_file: written.append(written_file.path),
+    )
+    new_names = sorted(path.rsplit("/", 1)[-1] for path in written)
+    bytes_after = sum(fs.size(f"{staging}/{name}") for name in new_names)
+
+    # journal first: an interrupted swap is finished by the next call (_recover)
+    journal = {"token": token, "old": [file.name for file, _ in small],
+               "new": new_names}
+    with fs.open(f"{fs_dir}/{JOURNAL_NAME}", "wb") as file:
+        file.write(json.dumps(journal).encode())
+    session.map(
+        lambda name: fs.mv(f"{staging}/{name}", f"{fs_dir}/{name}"), new_names)
+    session.rm([file for file, _ in small])
+    fs.rm(staging, recursive=True)
+    fs.rm(f"{fs_dir}/{JOURNAL_NAME}")
+    session.invalidate(dir_path)
+
+    return CompactionReport(
+        files_before=len(small),
+        files_after=len(new_names),
+        bytes_before=bytes_before,
+        bytes_after=bytes_after,
+        rows=nb_rows,
+        seconds=time.perf_counter() - start,
+    )
@@ -0,0 +1,262 @@
+import re
+import numpy as np
+import pandas as pd
+from dataclasses import asdict, dataclass, field
+from pandas.core.dtypes.cast import find_common_type  # type: ignore
+from typing import Callable, Literal
+
+ColumnPolicy = Literal["fill", "drop", "error"]
+
+
+@dataclass
+class SchemaDriftReport:
+    """
+    Structured description of the schema drift found while concatenating frames.
+
+    Attributes
+    ----------
+    columns : list
+        Columns of the concatenated DataFrame, in output order
+    dtypes : dict
+        Output dtype of each column
+    missing : dict
+        For each source, the target columns it did not provide
+    extra : dict
+        For each source, the columns it provided on top of the target schema
+    renamed : dict
+        For each source, the {original: normalized} column names
+    upcast : dict
+        For each column read with several dtypes, the {source: dtype} seen
+    """
+    columns: list = field(default_factory=list)
+    dtypes: dict = field(default_factory=dict)
+    missing: dict = field(default_factory=dict)
+    extra: dict = field(default_factory=dict)
+    renamed: dict = field(default_factory=dict)
+    upcast: dict = field(default_factory=dict)
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.missing or self.extra or self.upcast)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        One row per (source, column, issue), handy to log or persist the report
+        """
+        rows = []
+        for issue, per_source in (("missing", self.missing), ("extra", self.extra)):
+            for source, cols in per_source.items():
+                rows += [[source, col, issue, None] for col in cols]
+        for col, per_source in self.upcast.items():
+            rows += [
+                [source, col, "upcast", f"{dtype} -> {self.dtypes.get(col)}"]
+                for source, dtype in per_source.items()
+            ]
+        return pd.DataFrame(rows, columns=["source", "column", "issue", "detail"])
+
+    def to_dict(self) -> dict:
+        """
+        JSON serializable version of the report (dtypes as strings)
+        """
+        report = asdict(self)
+        report["dtypes"] = {col: str(dtype) for col, dtype in self.dtypes.items()}
+        return report
+
+
+def normalize_column_name(name) -> str:
+    """
+    Default column-name normalization: strip, lower case and snake case
+    (e.g. ' Nb Sales ' -> 'nb_sales')
+    """
+    return re.sub(r"\s+", "_", str(name).strip()).lower()
+
+
+def _na_capable_dtype(dtype):
+    # numpy int/uint/bool can not hold missing values: upcast as pd.concat would do
+    if isinstance(dtype, np.dtype) and dtype.kind in "iub":
+        return find_common_type([dtype, np.dtype("float64")])
+    return dtype
+
+
+def _na_value(dtype):
+    if dtype.kind in "mM":
+        return np.datetime64("NaT") if dtype.kind == "M" else np.timedelta64("NaT")
+    return np.nan
+
+
+def _empty_extension_array(dtype, length: int):
+    # all-NA extension array built with a vectorized take (no python loop)
+    empty = dtype.construct_array_type()._from_sequence([], dtype=dtype)
+    return empty.take(np.full(length, -1, dtype=np.intp), allow_fill=True)
+
+
+def _apply_policy(policy: ColumnPolicy, kind: str, per_source: dict):
+    if policy not in ("fill", "drop", "error"):
+        raise ValueError(f"Unknown {kind}_columns policy: '{policy}'")
+    if policy == "error" and per_source:
+        raise ValueError(f"Columns {kind} from some sources: {per_source}")
+
+
+def concat_dataframes(
+    list_of_df: list[pd.DataFrame],
+    sources: list | None = None,
+    columns: list | None = None,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    normalize_columns: bool | Callable = False,
+    return_report: bool = False,
+) -> pd.DataFrame | tuple[pd.DataFrame, SchemaDriftReport]:
+    """
+    Concatenate DataFrames with heterogeneous schemas in a single allocation.
+
+    The target schema and the output dtype of each column are computed once. Each
+    output column is then allocated up front and filled frame by frame: there is no
+    intermediate reindexed copy of the input frames as with pd.concat.
+
+    Parameters
+    ----------
+    list_of_df : list[pd.DataFrame]
+        DataFrames to be concatenated (row wise, index is reset)
+    sources : list, default None
+        Name of each DataFrame used in the report, default 'file_1', 'file_2'...
+    columns : list, default None
+        Target schema. Default is the columns of the first DataFrame
+    missing_columns : {'fill', 'drop', 'error'}, default 'fill'
+        What to do when a DataFrame lacks a target column: fill it with missing
+        values, drop the column from the output or raise a ValueError
+    extra_columns : {'fill', 'drop', 'error'}, default 'fill'
+        What to do when a DataFrame has a column outside of the target schema: add it
+        to the output (union of schemas), ignore it or raise a ValueError
+    normalize_columns : bool | Callable, default False
+        Normalize column names before matching them. True uses
+        ak.normalize_column_name, a callable is applied to each column name
+    return_report : bool, default False
+        Also return the SchemaDriftReport
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df, report = ak.concat_dataframes(
+            [df_jan, df_feb],
+            sources=["jan.csv", "feb.csv"],
+            missing_columns="fill",
+            extra_columns="drop",
+            return_report=True
+        )
+        print(report.to_frame())
+    """
+    df, report = _concat_dataframes(
+        list_of_df, sources, columns, missing_columns, extra_columns, normalize_columns)
+    return (df, report) if return_report else df
+
+
+def _concat_dataframes(
+    list_of_df: list[pd.DataFrame],
+    sources: list | None = None,
+    columns: list | None = None,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    normalize_columns: bool | Callable = False,
+) -> tuple[pd.DataFrame, SchemaDriftReport]:
+    sources = (
+        [f"file_{i + 1}" for i in range(len(list_of_df))]
+        if sources is None else [str(source) for source in sources]
+    )
+    if len(sources) != len(list_of_df):
+        raise ValueError("sources and list_of_df must have the same length")
+    report = SchemaDriftReport()
+    for source, df in zip(sources, list_of_df):
+        duplicated = df.columns[df.columns.duplicated()].unique().tolist()
+        if duplicated:
+            raise ValueError(f"Duplicated column names in {source}: {duplicated}")
+
+    # Normalize column names (renaming only relabels the column axis, no data copy)
+    if normalize_columns:
+        normalizer = (
+            normalize_columns if callable(normalize_columns) else normalize_column_name
+        )
+        renamed_list = []
+        for source, df in zip(sources, list_of_df):
+            mapping = {col: normalizer(col) for col in df.columns}
+            if len(set(mapping.values())) != len(mapping):
+                raise ValueError(f"Column names collide after normalization: {source}")
+            renamed = {old: new for old, new in mapping.items() if old != new}
+            if renamed:
+                report.renamed[source] = renamed
+                df = df.rename(columns=renamed)
+            renamed_list.append(df)
+        list_of_df = renamed_list
+        if columns is not None:
+            columns = [normalizer(col) for col in columns]
+
+    # Compute target schema once
+    if not list_of_df:
+        return pd.DataFrame(), report
+    target = list(list_of_df[0].columns) if columns is None else list(columns)
+    target_set = set(target)
+    extra_cols: list = []
+    for source, df in zip(sources, list_of_df):
+        missing = [col for col in target if col not in df.columns]
+        extra = [col for col in df.columns if col not in target_set]
+        if missing:
+            report.missing[source] = missing
+        if extra:
+            report.extra[source] = extra
+            extra_cols += [col for col in extra if col not in extra_cols]
+    _apply_policy(missing_columns, "missing", report.missing)
+    _apply_policy(extra_columns, "extra", report.extra)
+
+    out_cols = list(target)
+    if missing_columns == "drop":
+        dropped = {col for cols in report.missing.values() for col in cols}
+        out_cols = [col for col in out_cols if col not in dropped]
+    if extra_columns == "fill":
+        out_cols += extra_cols
+
+    # Output dtype of each column
+    lengths = [len(df) for df in list_of_df]
+    for col in out_cols:
+        seen = {
+            source: df[col].dtype
+            for source, df in zip(sources, list_of_df) if col in df.columns
+        }
+        dtype = find_common_type(list(seen.values())) if seen else np.dtype(object)
+        if len(seen) < len(list_of_df):
+            dtype = _na_capable_dtype(dtype)
+        if len(set(map(str, seen.values()))) > 1:
+            report.upcast[col] = {src: str(dt) for src, dt in seen.items()}
+        report.dtypes[col] = dtype
+    report.columns = out_cols
+
+    # Allocate each output column once and fill it frame by frame
+    n_rows = sum(lengths)
+    arrays = {}
+    for col in out_cols:
+        dtype = report.dtypes[col]
+        if isinstance(dtype, np.dtype):
+            out = np.empty(n_rows, dtype=dtype)
+            start = 0
+            for df, length in zip(list_of_df, lengths):
+                stop = start + length
+                if col in df.columns:
+                    values = df[col].array
+                    if values.dtype != dtype:
+                        values = values.astype(dtype)
+                    out[start: stop] = values
+                else:
+                    out[start: stop] = _na_value(dtype)
+                start = stop
+        else:
+            pieces = [
+                df[col].array.astype(dtype, copy=False) if col in df.columns
+                else _empty_extension_array(dtype, length)
+                for df, length in zip(list_of_df, lengths)
+            ]
+            out = dtype.construct_array_type()._concat_same_type(pieces)
+        arrays[col] = out
+
+    return pd.DataFrame(arrays, columns=out_cols, copy=False), report
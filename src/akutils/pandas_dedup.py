@@ -0,0 +1,295 @@
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Literal
+from pandas.api.types import is_bool_dtype, is_float_dtype, is_integer_dtype
+from pandas.util import hash_array
+
+from akutils.utils_functions import parse_bytes
+
+DuplicateKeep = Literal["first", "last"]
+
+_NULL_HASH = np.uint64(0)
+_HASH_MULTIPLIER = np.uint64(1000003)
+# the two halves of the 128 bits row hash: hash_array key and seed of each half
+_HASH_KEYS = ("0123456789123456", "akutils_dedup_k2")
+_HASH_SEEDS = (np.uint64(0x345678), np.uint64(0x9E3779B97F4A7C15))
+
+
+def _isin_sorted(sorted_keys: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """
+    Membership of 128 bits keys (2 x n uint64) in keys sorted on their first half:
+    binary search on the first half, then the second half is compared on the
+    entries with the same first half (works on np.memmap)
+    """
+    found = np.zeros(keys.shape[1], dtype=bool)
+    if sorted_keys.shape[1] == 0:
+        return found
+    first, second = sorted_keys[0], sorted_keys[1]
+    # sorted needles: cache friendly binary search
+    order = np.argsort(keys[0])
+    idx = np.searchsorted(first, keys[0][order])
+    candidates = np.arange(len(order))
+    # more than one entry per first half only on 64 bits collisions
+    while len(candidates):
+        candidates = candidates[idx[candidates] < len(first)]
+        same = np.asarray(first[idx[candidates]]) == keys[0][order[candidates]]
+        candidates = candidates[same]
+        found[order[candidates]] |= (
+            np.asarray(second[idx[candidates]]) == keys[1][order[candidates]])
+        idx[candidates] += 1
+    return found
+
+
+def _hash_column(serie: pd.Series, hash_key: str = _HASH_KEYS[0]) -> np.ndarray:
+    """
+    uint64 hash of each value, independent of the dtype: 1, 1.0 and Int64 1 give
+    the same hash, as "a" stored as object, string or string[pyarrow], and all the
+    missing values (None, NaN, NA, NaT) give the same hash. Each hash_key gives an
+    independent hash.
+    """
+    dtype = serie.dtype
+    salt = np.uint64(int.from_bytes(hash_key.encode()[:8], "little"))
+    if is_bool_dtype(dtype) or is_integer_dtype(dtype):
+        values = serie.to_numpy(dtype=np.int64, na_value=0)
+        hashes = hash_array(values.view(np.uint64) ^ salt)
+    elif is_float_dtype(dtype):
+        values = serie.to_numpy(dtype=np.float64, na_value=np.nan)
+        hashes = hash_array(values.view(np.uint64) ^ salt)
+        is_int = np.isfinite(values) & (np.abs(values) < 2.**63)
+        is_int[is_int] = values[is_int] == np.round(values[is_int])
+        hashes[is_int] = hash_array(
+            values[is_int].astype(np.int64).view(np.uint64) ^ salt)
+    else:
+        hashes = hash_array(serie.to_numpy(dtype=object), hash_key=hash_key)
+    hashes[serie.isna().to_numpy(dtype=bool)] = _NULL_HASH
+    return hashes
+
+
+class _HashSet:
+    """
+    Set of 128 bits hashes (2 x n uint64 arrays) stored as runs sorted on their
+    first half: each added batch is a new run and runs of similar sizes are merged
+    (sorted merge, amortized O(log n) per hash). Past max_memory the runs are merged
+    and spilled to a .npy file.
+    """
+
+    def __init__(self, max_memory: int, spill: Callable[[np.ndarray], Path]):
+        self.max_memory = max_memory
+        self._spill = spill
+        self._runs: list[np.ndarray] = []
+        self.spilled: list[Path] = []
+
+    @property
+    def nbytes(self) -> int:
+        return sum(run.nbytes for run in self._runs)
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        seen = np.zeros(keys.shape[1], dtype=bool)
+        for run in self._runs:
+            seen |= _isin_sorted(run, keys)
+        for path in self.spilled:
+            seen |= _isin_sorted(np.load(path, mmap_mode="r"), keys)
+        return seen
+
+    def add(self, keys: np.ndarray):
+        """
+        Add hashes not already in the set
+        """
+        if keys.shape[1] == 0:
+            return
+        self._runs.append(keys[:, np.argsort(keys[0])])
+        # run sizes stay geometrically decreasing: O(log n) runs
+        while (
+            len(self._runs) > 1
+            and self._runs[-2].shape[1] <= 2 * self._runs[-1].shape[1]
+        ):
+            self._runs[-2:] = [_merge_sorted(*self._runs[-2:])]
+        if self.nbytes > self.max_memory:
+            merged = self._runs[0]
+            for run in self._runs[1:]:
+                merged = _merge_sorted(merged, run)
+            self.spilled.append(self._spill(merged))
+            self._runs = []
+
+
+def _merge_sorted(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    # the stable sort (timsort) of two sorted runs is a linear merge
+    keys = np.concatenate([left, right], axis=1)
+    return keys[:, np.argsort(keys[0], kind="stable")]
+
+
+class RowDeduplicator:
+    """
+    Streaming row deduplication across chunks and files.
+
+    Each row is reduced to a 128 bits hash (two independent 64 bits hashes), only
+    the hashes are kept in memory as sorted runs merged incrementally, so duplicates
+    are dropped chunk by chunk before concatenation instead of calling
+    drop_duplicates on the full frame. Rows are
+    hashed on the column names (not the column order) and on the values (not the
+    dtype), so the same row read from files with other column orders or dtypes
+    (int/float, object/string) is a duplicate. Once the seen hashes exceed
+    max_memory, they are spilled to disk (.npy files, memory mapped and binary
+    searched).
+
+    Rows are compared on their hashes, not on their values: the result is
+    probabilistic, two different rows are taken as duplicates if both their 64 bits
+    hashes collide (probability about n_rows**2 / 2**129, i.e. below 1e-20 for a
+    billion rows).
+
+    With keep="last", rows cannot be dropped before the end of the ingestion: each
+    chunk is deduplicated on its own and the rows overwritten by a later chunk are
+    dropped by finalize, right before concatenation, by a reverse pass over the
+    hashes of the emitted rows (16 bytes per row, spilled to disk past max_memory).
+
+    Parameters
+    ----------
+    subset : list, default None
+        Only consider those columns to identify duplicates, default all columns
+    keep : {'first', 'last'}, default 'first'
+        Which occurrence of a duplicated row is kept
+    max_memory : int | str, default "256MB"
+        Memory budget of the hashes before spilling them to disk
+    spill_dir : str | Path, default None
+        Directory of the spilled hashes, default a temporary directory
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df = ak.read_multiple_csv_from_dir(
+            dir_path, sep=";", deduplicate=ak.RowDeduplicator(subset=["order_id"]))
+    """
+
+    def __init__(
+        self,
+        subset: list | None = None,
+        keep: DuplicateKeep = "first",
+        max_memory: int | str = "256MB",
+        spill_dir: str | Path | None = None,
+    ):
+        if keep not in ("first", "last"):
+            raise ValueError(f"keep must be 'first' or 'last', got {keep!r}")
+        self.subset = subset
+        self.keep = keep
+        self.max_memory = parse_bytes(max_memory)
+        self.spill_dir = spill_dir
+        self.n_rows = 0
+        self.n_dropped = 0
+        self._seen = _HashSet(self.max_memory, self._spill)
+        # keep="last": hashes of the emitted rows, per chunk (array or spilled file)
+        self._pending: list[np.ndarray | Path] = []
+        self._pending_nbytes = 0
+        self._n_spilled = 0
+        self._tmp_dir: tempfile.TemporaryDirectory | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"RowDeduplicator(subset={self.subset!r}, keep={self.keep!r}, "
+            f"n_rows={self.n_rows}, n_dropped={self.n_dropped}, "
+            f"spilled_files={self._n_spilled})"
+        )
+
+    def hash_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        128 bits hash of each row (on subset columns if any) as a 2 x n uint64
+        array, the index is ignored. Columns are combined in subset order, else in
+        column name order.
+        """
+        positions: list
+        if self.subset is None:
+            positions = sorted(range(df.shape[1]), key=lambda i: str(df.columns[i]))
+        else:
+            positions = [df.columns.get_loc(col) for col in self.subset]
+        keys = np.empty((2, len(df)), dtype=np.uint64)
+        keys[0], keys[1] = _HASH_SEEDS
+        for position in positions:
+            serie = df.iloc[:, position]
+            for half, hash_key in enumerate(_HASH_KEYS):
+                keys[half] ^= _hash_column(serie, hash_key)
+                keys[half] *= _HASH_MULTIPLIER
+        return keys
+
+    def _spill(self, hashes: np.ndarray) -> Path:
+        if self.spill_dir is None:
+            if self._tmp_dir is None:
+                self._tmp_dir = tempfile.TemporaryDirectory(prefix="akutils_dedup_")
+            spill_dir = Path(self._tmp_dir.name)
+        else:
+            spill_dir = Path(self.spill_dir)
+            spill_dir.mkdir(parents=True, exist_ok=True)
+        path = spill_dir / f"hashes_{id(self)}_{self._n_spilled}.npy"
+        np.save(path, hashes)
+        self._n_spilled += 1
+        return path
+
+    def _add_pending(self, hashes: np.ndarray):
+        self._pending.append(hashes)
+        self._pending_nbytes += hashes.nbytes
+        if self._pending_nbytes > self.max_memory:
+            self._pending = [
+                self._spill(item) if isinstance(item, np.ndarray) else item
+                for item in self._pending
+            ]
+            self._pending_nbytes = 0
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop the rows of the chunk already seen (keep="first") or duplicated later
+        in the chunk (keep="last")
+        """
+        if len(df) == 0:
+            return df
+        keys = self.hash_rows(df)
+        self.n_rows += keys.shape[1]
+        mask = ~pd.DataFrame(keys.T).duplicated(keep=self.keep).to_numpy()
+        if self.keep == "first":
+            mask &= ~self._seen.contains(keys)
+            self._seen.add(keys[:, mask])
+        else:
+            self._add_pending(keys[:, mask])
+        self.n_dropped += int(len(mask) - mask.sum())
+        return df if mask.all() else df[mask]
+
+    def finalize(self, list_of_df: list[pd.DataFrame]) -> list[pd.DataFrame]:
+        """
+        keep="last": drop the rows overwritten by a later chunk. list_of_df holds the
+        filtered chunks (or their concatenation per file), in reading order.
+        """
+        if self.keep == "first" or not self._pending:
+            return list_of_df
+        pending, self._pending, self._pending_nbytes = self._pending, [], 0
+        n_pending = sum(
+            item.shape[1] if isinstance(item, np.ndarray)
+            else np.load(item, mmap_mode="r").shape[1]
+            for item in pending
+        )
+        if n_pending != sum(len(df) for df in list_of_df):
+            raise ValueError("finalize expects all the DataFrames returned by filter")
+        # reverse pass: a row is kept if its hash is not in a later chunk
+        later = _HashSet(self.max_memory, self._spill)
+        masks = []
+        for item in reversed(pending):
+            keys = item if isinstance(item, np.ndarray) else np.load(item)
+            mask = ~later.contains(keys)
+            later.add(keys[:, mask])
+            masks.append(mask)
+        keep_mask = np.concatenate(masks[::-1])
+        self.n_dropped += int(len(keep_mask) - keep_mask.sum())
+        result, start = [], 0
+        for df in list_of_df:
+            mask = keep_mask[start: start + len(df)]
+            start += len(df)
+            result.append(df if mask.all() else df[mask])
+        return result
+
+
+def _get_deduplicator(deduplicate: bool | RowDeduplicator) -> RowDeduplicator | None:
+    if isinstance(deduplicate, RowDeduplicator):
+        return deduplicate
+    return RowDeduplicator() if deduplicate else None
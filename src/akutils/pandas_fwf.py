@@ -0,0 +1,687 @@
+import codecs
+import re
+import zipfile
+from contextlib import nullcontext
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
+from pandas.io._util import _arrow_dtype_mapping  # type: ignore
+from pandas._typing import DtypeArg
+from upath import UPath
+
+from akutils.fs_session import get_session
+from akutils.os import is_local_path, list_files_from_dir, warn
+from akutils.pandas_aggregate import StreamingAggregator
+from akutils.pandas_arrow import DtypeBackend
+from akutils.pandas_chunksize import ChunkSizer, _get_chunk_sizer
+from akutils.pandas_dedup import RowDeduplicator
+from akutils.pandas_read_files import (
+    SourceEncoding,
+    _add_file_source,
+    _encode_file_source,
+    _file_size,
+    _finalize_chunk_filters,
+    _get_chunk_aggregator,
+    _get_chunk_filters,
+    _open_zip_member,
+    _zip_buffer,
+)
+from akutils.pandas_sample import RowSampler
+from akutils.progress import ProgressCallback, _FileProgress
+from akutils.utils_functions import _log_duration
+
+# {name: (start, end)} or {name: (start, end, dtype)}, or a list of
+# (name, start, end) / (name, start, end, dtype): 0 based byte offsets, end excluded
+FwfLayout = dict[str, tuple] | list[tuple]
+
+# bytes of the first read of a file, next reads are sized on the record length
+_FIRST_READ_BYTES = 2**20
+
+
+def _is_string_dtype(dtype) -> bool:
+    if isinstance(dtype, (pd.StringDtype, str)) and str(dtype) in ("string", "object"):
+        return True
+    return dtype is None or dtype is object
+
+
+def _parse_type(dtype) -> pa.DataType:
+    """
+    Arrow type the field text is cast to (string for the dtypes converted by pandas
+    afterwards, e.g. category)
+    """
+    if isinstance(dtype, pd.ArrowDtype):
+        return dtype.pyarrow_dtype
+    if _is_string_dtype(dtype):
+        return pa.string()
+    pandas_dtype = pd.api.types.pandas_dtype(dtype)
+    numpy_dtype = getattr(pandas_dtype, "numpy_dtype", pandas_dtype)  # Int64 -> int64
+    if isinstance(numpy_dtype, np.dtype) and numpy_dtype.kind in "iufbM":
+        return pa.from_numpy_dtype(numpy_dtype)
+    return pa.string()
+
+
+@dataclass
+class _FwfField:
+    name: str
+    start: int
+    end: int
+    dtype: object  # requested dtype
+    arrow_type: pa.DataType  # type the field is parsed into
+
+
+def _get_fields(layout: FwfLayout, dtype: DtypeArg | None) -> list[_FwfField]:
+    """
+    Fields of a layout, dtype (dict entries first) applied to the fields
+    """
+    specs = layout.items() if isinstance(layout, dict) else [
+        (spec[0], tuple(spec[1:])) for spec in layout]
+    fields = []
+    for name, spec in specs:
+        if len(spec) not in (2, 3) or not 0 <= spec[0] < spec[1]:
+            raise ValueError(
+                f"Invalid layout of '{name}': (start, end) or (start, end, dtype) "
+                "expected, with 0 <= start < end")
+        field_dtype = spec[2] if len(spec) == 3 else "string"
+        if isinstance(dtype, dict):
+            field_dtype = dtype.get(name, field_dtype)
+        elif len(spec) == 2:
+            field_dtype = dtype
+        if field_dtype is str or field_dtype == "str":
+            field_dtype = "object"  # as pd.read_csv: missing values stay NaN
+        fields.append(
+            _FwfField(name, spec[0], spec[1], field_dtype, _parse_type(field_dtype)))
+    if not fields:
+        raise ValueError("The layout has no field")
+    return fields
+
+
+def _single_byte(char: str, encoding: str) -> int:
+    encoded = char.encode(encoding)
+    if len(encoded) != 1:
+        raise ValueError(f"Only single byte encodings are supported, not {encoding}")
+    return encoded[0]
+
+
+class _FwfParser:
+    """
+    Converts raw records into a DataFrame: the bytes of each field are sliced out
+    of all the records at once (numpy), then trimmed and cast by Arrow compute
+    """
+
+    def __init__(
+        self,
+        fields: list[_FwfField],
+        encoding: str,
+        dtype_backend: DtypeBackend | None,
+    ):
+        self.fields, self.encoding, self.dtype_backend = fields, encoding, dtype_backend
+        self.width = max(field.end for field in fields)
+        # utf-8 (and ascii) bytes are cast to Arrow strings as they are
+        self.utf8 = codecs.lookup(encoding).name in ("utf-8", "ascii")
+        self.pad = _single_byte(" ", encoding)
+        self.newline = _single_byte("\n", encoding)
+        self.carriage_return = _single_byte("\r", encoding)
+
+    def _records_matrix(
+        self, buffer: np.ndarray, starts: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray | None:
+        """
+        (records, width) view of the buffer when the records are evenly spaced and
+        long enough for the layout, None otherwise
+        """
+        if not len(starts) or lengths.min() < self.width:
+            return None
+        stride = int(starts[1] - starts[0]) if len(starts) > 1 else self.width
+        if len(starts) > 2 and not (np.diff(starts) == stride).all():
+            return None
+        return np.lib.stride_tricks.as_strided(
+            buffer[starts[0]:], shape=(len(starts), self.width), strides=(stride, 1),
+            writeable=False)
+
+    def _gather(
+        self,
+        buffer: np.ndarray,
+        starts: np.ndarray,
+        lengths: np.ndarray,
+        field: _FwfField,
+    ) -> np.ndarray:
+        # records of uneven length: bytes past the end of a record are blanks
+        positions = np.arange(field.start, field.end)
+        index = np.minimum(starts[:, None] + positions, len(buffer) - 1)
+        inside = positions < lengths[:, None]
+        return np.where(inside, buffer[index], self.pad).astype(np.uint8, copy=False)
+
+    def _parse_field(self, raw: np.ndarray, field: _FwfField) -> pa.Array:
+        nb_rows, width = raw.shape
+        if self.utf8:
+            array = pa.FixedSizeBinaryArray.from_buffers(
+                pa.binary(width), nb_rows, [None, pa.py_buffer(raw)]
+            ).cast(pa.string())
+        else:
+            decoded = np.char.decode(raw.view(f"S{width}").ravel(), self.encoding)
+            array = pa.array(decoded, type=pa.string())
+        array = pc.utf8_trim_whitespace(array)
+        if pa.types.is_integer(field.arrow_type):
+            array = pc.utf8_ltrim(array, characters="+")  # not parsed by Arrow
+        # blank field: missing value
+        array = pc.if_else(
+            pc.greater(pc.binary_length(array), 0), array, pa.scalar(None, pa.string()))
+        if array.type == field.arrow_type:
+            return array
+        try:
+            return pc.cast(array, field.arrow_type)
+        except pa.ArrowInvalid as error:
+            raise ValueError(f"Column '{field.name}': {error}") from error
+
+    def _to_series(self, array: pa.Array, field: _FwfField) -> pd.Series:
+        if self.dtype_backend == "pyarrow":
+            series = array.to_pandas(types_mapper=pd.ArrowDtype)
+        elif self.dtype_backend == "numpy_nullable":
+            series = array.to_pandas(types_mapper=_arrow_dtype_mapping().get)
+        elif isinstance(field.dtype, pd.StringDtype) or field.dtype == "string":
+            series = array.to_pandas(types_mapper={pa.string(): pd.StringDtype()}.get)
+        else:
+            series = array.to_pandas()
+        # dtypes not parsed by Arrow (category...) or numpy dtypes of the default
+        # back-end (an int column with missing values raises as in pd.read_csv)
+        convert = self.dtype_backend is None or (
+            pa.types.is_string(field.arrow_type) and not _is_string_dtype(field.dtype))
+        if convert and field.dtype is not None and series.dtype != field.dtype:
+            series = series.astype(field.dtype)
+        return series
+
+    def parse(
+        self, buffer: np.ndarray, starts: np.ndarray, lengths: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        DataFrame of the records buffer[start: start + length]
+        """
+        matrix = self._records_matrix(buffer, starts, lengths)
+        columns = {}
+        for field in self.fields:
+            if matrix is not None:
+                raw = np.ascontiguousarray(matrix[:, field.start:field.end])
+            else:
+                raw = self._gather(buffer, starts, lengths, field)
+            columns[field.name] = self._to_series(self._parse_field(raw, field), field)
+        return pd.DataFrame(columns)
+
+
+class _FwfReader:
+    """
+    Records of a binary file read block by block and parsed chunk by chunk, with
+    the get_chunk / iteration interface of pd.read_csv readers (see ak.ChunkSizer)
+    """
+
+    def __init__(
+        self,
+        file,
+        parser: _FwfParser,
+        chunksize: int,
+        record_length: int | None = None,
+        skiprows: int = 0,
+        nrows: int | None = None,
+    ):
+        if record_length is not None and record_length < 1:
+            raise ValueError("record_length must be positive")
+        self.file, self.parser, self.chunksize = file, parser, chunksize
+        self.record_length, self.nrows = record_length, nrows
+        self.rows_read, self.bytes_read = 0, 0
+        self._tail, self._eof, self._read_size = b"", False, _FIRST_READ_BYTES
+        if skiprows:
+            self._records(skiprows)
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.get_chunk(self.chunksize)
+            except StopIteration:
+                return
+
+    def _read(self, size: int) -> bytes:
+        # a raw file may return less than size bytes before its end
+        parts = []
+        while size > 0:
+            data = self.file.read(size)
+            if not data:
+                break
+            parts.append(data)
+            size -= len(data)
+        data = b"".join(parts)
+        self.bytes_read += len(data)
+        return data
+
+    def _records(
+        self, size: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        (buffer, starts, lengths) of the next size records at most, None at the end
+        """
+        if self.record_length is not None:
+            data = self._read(size * self.record_length)
+            if not data:
+                return None
+            buffer = np.frombuffer(data, dtype=np.uint8)
+            starts = np.arange(0, len(buffer), self.record_length)
+            return buffer, starts, np.minimum(self.record_length, len(buffer) - starts)
+
+        while True:
+            buffer = np.frombuffer(self._tail, dtype=np.uint8)
+            ends: np.ndarray = np.flatnonzero(buffer == self.parser.newline)
+            if len(ends) >= size or self._eof:
+                break
+            # read about the bytes of the missing lines, at the current line length
+            line_bytes = len(buffer) / len(ends) if len(ends) else 0
+            read_size = int((size - len(ends)) * line_bytes * 1.1)
+            data = self._read(max(read_size, self._read_size))
+            self._eof = not data
+            self._tail += data
+        if self._eof and len(buffer) and (not len(ends) or ends[-1] < len(buffer) - 1):
+            ends = np.append(ends, len(buffer))  # last line without newline
+        if not len(ends):
+            return None
+        ends = ends[:size]
+        self._tail = self._tail[ends[-1] + 1:]
+        starts = np.empty_like(ends)
+        starts[0], starts[1:] = 0, ends[:-1] + 1
+        lengths = ends - starts
+        ends_with_cr = buffer[np.maximum(ends - 1, 0)] == self.parser.carriage_return
+        lengths -= (lengths > 0) & ends_with_cr
+        return buffer, starts, lengths
+
+    def get_chunk(self, size: int | None = None) -> pd.DataFrame:
+        size = size or self.chunksize
+        if self.nrows is not None:
+            size = min(size, self.nrows - self.rows_read)
+        while size > 0:
+            records = self._records(size)
+            if records is None:
+                break
+            buffer, starts, lengths = records
+            if self.record_length is None:
+                # blank lines are skipped, as by pd.read_fwf
+                starts, lengths = starts[lengths > 0], lengths[lengths > 0]
+                if not len(starts):
+                    continue
+            chunk = self.parser.parse(buffer, starts, lengths)
+            # index goes on from chunk to chunk, as in pd.read_csv readers
+            chunk.index = pd.RangeIndex(self.rows_read, self.rows_read + len(chunk))
+            self.rows_read += len(chunk)
+            return chunk
+        raise StopIteration
+
+
+@_log_duration
+def read_fwf_in_chunks(
+    filepath_or_buffer,
+    layout: FwfLayout,
+    chunk_func: Callable | None = None,
+    chunk_func_kwarg=None,
+    chunksize: int = 10**6,
+    max_chunk_bytes: int | str | ChunkSizer | None = None,
+    dtype: DtypeArg | None = "string",
+    dtype_backend: DtypeBackend | None = None,
+    record_length: int | None = None,
+    encoding: str = "utf-8",
+    skiprows: int = 0,
+    nrows: int | None = None,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    progress: ProgressCallback | None = None,
+    add_row_number: bool = False,
+    aggregate: StreamingAggregator | dict | None = None,
+) -> pd.DataFrame:
+    """
+    Read in chunks a fixed-width file (mainframe extract...) into DataFrame.
+
+    Unlike pd.read_fwf, records are not parsed line by line in Python: a block of
+    records is read as bytes, the byte range of each field is sliced out of all
+    the records at once (numpy) then trimmed and cast to its dtype by Arrow
+    compute. Only the fields of the layout are parsed, other bytes are skipped.
+    Blank fields are read as missing values, blank lines are skipped.
+
+    Parameters
+    ----------
+    filepath_or_buffer : str, path object or binary file-like object
+        Local or remote (Azure...) path, compressed files (.gz...) are decompressed
+    layout : dict | list
+        Fields of a record, as {name: (start, end)} or {name: (start, end, dtype)}
+        or as a list of (name, start, end) / (name, start, end, dtype) tuples.
+        start and end are 0 based byte offsets in the record, end excluded (as
+        colspecs of pd.read_fwf)
+    chunk_func : Callable, default None
+        The function will be applied to each chunk (e.g. filter, change type...)
+        first function arg should should be the chunk df
+    chunk_func_kwarg : dict, default None
+        Keyword arguments of chunk_func
+    chunksize : int, default 10**6
+        Number of records of each chunk
+    max_chunk_bytes : int | str | ak.ChunkSizer, default None
+        Memory budget of a parsed chunk (e.g. "512MB") replacing chunksize (see
+        ak.ChunkSizer)
+    dtype : dtype | dict, default "string"
+        dtype of the fields without dtype in the layout, a dict {name: dtype} wins
+        over the layout. Numeric, boolean and datetime (ISO 8601) fields are parsed
+        by Arrow, other dtypes (category...) are converted from strings by pandas
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Back-end data type applied to the resultant DataFrame. With "pyarrow", the
+        parsed Arrow arrays are used as they are
+    record_length : int, default None
+        Records of record_length bytes without line terminator (mainframe files
+        transferred in binary mode). By default records are lines, shorter lines
+        are padded with blanks
+    encoding : str, default "utf-8"
+        Single byte encoding of the file (utf-8, latin-1, cp1252, cp037 EBCDIC...),
+        positions of the layout are byte offsets
+    skiprows : int, default 0
+        Number of records (header...) skipped at the start of the file
+    nrows : int, default None
+        Number of records to read
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows chunk by chunk, after chunk_func (see
+        ak.RowDeduplicator). Rows are compared on 128 bits hashes: the result is
+        probabilistic, with a negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows (see ak.RowSampler)
+    progress : Callable, default None
+        Called with an ak.ProgressEvent when the file is opened, after each chunk
+        and when the file is read (see ak.LoggingProgress, ak.RichProgress)
+    add_row_number : bool, default False
+        Add a 'file_row' column (int64) with the position of each record in the
+        file (0 based, after skiprows and blank lines). chunk_func must then keep
+        the index of the rows it returns.
+    aggregate : ak.StreamingAggregator | dict, default None
+        Group by aggregation computed chunk by chunk, after chunk_func and
+        deduplicate: only the aggregates are kept in memory and returned (see
+        ak.StreamingAggregator)
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        layout = {
+            "account": (0, 10),
+            "country": (10, 30),
+            "amount": (30, 42, "float64"),
+            "booking_date": (42, 52, "datetime64[ns]"),
+        }
+        df = ak.read_fwf_in_chunks(file_path, layout, encoding="cp037")
+    """
+    if chunk_func_kwarg is None:
+        chunk_func_kwarg = {}
+    parser = _FwfParser(_get_fields(layout, dtype), encoding, dtype_backend)
+    deduplicator, sampler = _get_chunk_filters(deduplicate, sample)
+    aggregator = _get_chunk_aggregator(aggregate, deduplicator, sampler)
+    chunk_sizer = _get_chunk_sizer(max_chunk_bytes)
+
+    is_path = isinstance(filepath_or_buffer, (str, Path))
+    source = str(getattr(filepath_or_buffer, "name", filepath_or_buffer))
+    file_progress = _FileProgress(
+        progress,
+        source=source,
+        total_bytes=_file_size(filepath_or_buffer) if progress and is_path else None,
+    )
+    file_progress.start()
+    chunks: list[pd.DataFrame] = []
+    file = get_session().open(
+        filepath_or_buffer, "rb", compression="infer") if is_path else None
+    try:
+        reader = _FwfReader(
+            file or filepath_or_buffer, parser, chunksize, record_length, skiprows,
+            nrows)
+        chunk_iterator = reader if chunk_sizer is None else (
+            chunk_sizer.iter_chunks(reader, source))
+        for counter, chunk in enumerate(chunk_iterator):
+            nb_rows = len(chunk)
+            if chunk_func:
+                chunk = chunk_func(df=chunk, **chunk_func_kwarg)
+            for chunk_filter in (deduplicator, sampler):
+                if chunk_filter is not None:
+                    chunk = chunk_filter.filter(chunk)
+            if add_row_number:
+                chunk["file_row"] = chunk.index.to_numpy(dtype="int64")
+            if aggregator is not None:
+                aggregator.update(chunk)  # raw rows are not kept
+            else:
+                chunks.append(chunk)
+            if sampler is not None:
+                chunks = sampler.compact(chunks)  # rows evicted from the reservoir
+            file_progress.chunk(counter, nb_rows, reader.bytes_read)
+    finally:
+        if file is not None:
+            file.close()
+    file_progress.end(reader.bytes_read)
+    # filters shared with the caller (multi files readers) are finalized by it
+    chunks = _finalize_chunk_filters(
+        chunks,
+        deduplicator if deduplicator is not deduplicate else None,
+        sampler if sampler is not sample else None,
+    )
+    if aggregator is not None:
+        # an aggregator shared with the caller is only updated
+        return pd.DataFrame() if aggregator is aggregate else aggregator.result()
+    if not chunks:
+        return parser.parse(
+            np.empty(0, dtype=np.uint8), np.zeros(0, dtype=np.intp),
+            np.full(0, parser.width))
+    return pd.concat(chunks, axis=0, ignore_index=True)
+
+
+def _read_fwf_files(
+    files: list,
+    open_file: Callable,
+    layout: FwfLayout,
+    add_source: bool | SourceEncoding,
+    deduplicate: bool | RowDeduplicator,
+    sample: int | RowSampler | None,
+    aggregate: StreamingAggregator | dict | None,
+    max_chunk_bytes: int | str | ChunkSizer | None,
+    preview: int | None,
+    kwargs: dict,
+) -> pd.DataFrame:
+    """
+    Read the files (open_file(file): context manager of a path or of a binary
+    file) with shared chunk
+    filters, aggregator and chunk sizer, then concatenate them
+    """
+    deduplicator, sampler = _get_chunk_filters(deduplicate, sample)
+    aggregator = _get_chunk_aggregator(aggregate, deduplicator, sampler)
+    chunk_sizer = _get_chunk_sizer(max_chunk_bytes)
+    if preview:
+        kwargs.update(nrows=preview, chunksize=preview)
+    list_of_df: list[pd.DataFrame] = []
+    sources: list[str] = []
+    for file in files:
+        file_name = getattr(file, "name", str(file))
+        with open_file(file) as source:
+            _df = read_fwf_in_chunks(
+                source,
+                layout,
+                deduplicate=deduplicator or False,
+                sample=sampler,
+                aggregate=aggregator,
+                max_chunk_bytes=chunk_sizer,
+                **kwargs)
+        if add_source:
+            _add_file_source(
+                _df, file_name, add_source, len(sources), len(files),
+                kwargs.get("dtype_backend"))
+        list_of_df.append(_df)
+        sources.append(file_name)
+        if sampler is not None:
+            list_of_df = sampler.compact(list_of_df)
+    if aggregator is not None:
+        return aggregator.result()
+    list_of_df = _finalize_chunk_filters(list_of_df, deduplicator, sampler)
+    # same layout: the files have the same columns
+    df = pd.concat(list_of_df, axis=0, ignore_index=True)
+    return _encode_file_source(df, sources, add_source)
+
+
+@_log_duration
+def read_multiple_fwf_from_dir(
+    dir_path: Path | UPath,
+    layout: FwfLayout,
+    regex: str = r".*",
+    case_sensitive: bool = False,
+    allowed_extension: list = [".txt", ".dat", ".fwf", ".gz"],
+    add_source: bool | SourceEncoding = False,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    aggregate: StreamingAggregator | dict | None = None,
+    max_chunk_bytes: int | str | ChunkSizer | None = None,
+    preview: int | None = None,
+    **kwargs
+) -> pd.DataFrame:
+    """
+    From a given directory, lists, reads and concatenates into a DataFrame all
+    fixed-width files matching the requesting pattern (see ak.read_fwf_in_chunks).
+
+    Parameters
+    ----------
+    dir_path : Path | UPath
+        Path of the directory to be scanned
+    layout : dict | list
+        Fields of a record (see ak.read_fwf_in_chunks)
+    regex : str, default r".*"
+        Regex string to select from the directory only the files mathcing the pattern
+    case_sensitive : bool, default False
+        Allow to enable or disable case sensitive on regex match
+    allowed_extension : list, default [".txt", ".dat", ".fwf", ".gz"]
+    add_source : bool | {'category', 'index'}, default False
+        Add the file each row comes from (see ak.read_multiple_csv_from_dir)
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows across all files while reading (see ak.RowDeduplicator).
+        Rows are compared on 128 bits hashes: the result is probabilistic, with a
+        negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows across all files (see
+        ak.RowSampler)
+    aggregate : ak.StreamingAggregator | dict, default None
+        Group by aggregation computed chunk by chunk across all files (see
+        ak.StreamingAggregator): the aggregates are returned, one row per group
+    max_chunk_bytes : int | str | ak.ChunkSizer, default None
+        Memory budget of a parsed chunk replacing chunksize, the chunk size learned
+        on a file carries over to the next ones (see ak.ChunkSizer)
+    preview : int, default None
+        Only read the first n records of each file
+    **kwargs
+        Pass any argument allowed by ak.read_fwf_in_chunks (chunk_func, dtype,
+        record_length, encoding...)
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        layout = [("account", 0, 10), ("amount", 10, 22, "float64")]
+        df = ak.read_multiple_fwf_from_dir(dir_path, layout, regex=r"^EXTRACT")
+    """
+    file_matched = list_files_from_dir(
+        dir_path=dir_path, regex=regex, case_sensitive=case_sensitive)
+    allowed_extension = [ext.lower() for ext in allowed_extension]
+    files_allowed = [
+        file for file in file_matched
+        if file.suffix.lower() in allowed_extension
+    ]
+    if not files_allowed:
+        warn(f"No file found in {dir_path}: empty pd.DataFrame has been returned")
+        return pd.DataFrame()
+    return _read_fwf_files(
+        files_allowed, nullcontext, layout, add_source, deduplicate, sample,
+        aggregate, max_chunk_bytes, preview, kwargs)
+
+
+@_log_duration
+def read_multiple_fwf_from_zip(
+    zip_path: Path | UPath | BytesIO,
+    layout: FwfLayout,
+    regex: str = r".*",
+    case_sensitive: bool = False,
+    allowed_extension: list = [".txt", ".dat", ".fwf"],
+    add_source: bool | SourceEncoding = False,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    aggregate: StreamingAggregator | dict | None = None,
+    max_chunk_bytes: int | str | ChunkSizer | None = None,
+    preview: int | None = None,
+    **kwargs
+) -> pd.DataFrame:
+    """
+    From a given zip, lists, reads and concatenates into a DataFrame all
+    fixed-width files matching the requesting pattern (see ak.read_fwf_in_chunks).
+    Uncompressed (STORED) members of a local zip are read in place.
+
+    Parameters
+    ----------
+    zip_path : Path | UPath | BytesIO
+        Local or remote (Azure...) zip
+    layout : dict | list
+        Fields of a record (see ak.read_fwf_in_chunks)
+    regex : str, default r".*"
+        Regex string to select the zip members matching the pattern
+    case_sensitive : bool, default False
+        Allow to enable or disable case sensitive on regex match
+    allowed_extension : list, default [".txt", ".dat", ".fwf"]
+    add_source : bool | {'category', 'index'}, default False
+        Add the member each row comes from (see ak.read_multiple_csv_from_zip)
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows across all members while reading (see
+        ak.RowDeduplicator). Rows are compared on 128 bits hashes: the result is
+        probabilistic, with a negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows across all members (see
+        ak.RowSampler)
+    aggregate : ak.StreamingAggregator | dict, default None
+        Group by aggregation computed chunk by chunk across all members (see
+        ak.StreamingAggregator): the aggregates are returned, one row per group
+    max_chunk_bytes : int | str | ak.ChunkSizer, default None
+        Memory budget of a parsed chunk replacing chunksize (see ak.ChunkSizer)
+    preview : int, default None
+        Only read the first n records of each member
+    **kwargs
+        Pass any argument allowed by ak.read_fwf_in_chunks (chunk_func, dtype,
+        record_length, encoding...)
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        layout = {"account": (0, 10), "amount": (10, 22, "float64")}
+        df = ak.read_multiple_fwf_from_zip(zip_path, layout, add_source=True)
+    """
+    if isinstance(zip_path, Path) and not is_local_path(zip_path):
+        with get_session().open(zip_path, "rb") as f:
+            zip_path = BytesIO(f.read())
+
+    with _zip_buffer(zip_path) as zip_buffer, zipfile.ZipFile(zip_path, "r") as zip_ref:
+        flags = 0 if case_sensitive else re.IGNORECASE
+        allowed_extension = [ext.lower() for ext in allowed_extension]
+        files_allowed = [
+            file for file in zip_ref.namelist()
+            if re.search(regex, file, flags=flags)
+            and UPath(file).suffix.lower() in allowed_extension
+        ]
+        if not files_allowed:
+            warn(f"No files matching pattern '{regex}' found in {zip_path}")
+            return pd.DataFrame()
+
+        def open_member(file_name: str):
+            return _open_zip_member(zip_ref, file_name, zip_buffer)
+
+        return _read_fwf_files(
+            files_allowed, open_member, layout, add_source, deduplicate, sample,
+            aggregate, max_chunk_bytes, preview, kwargs)
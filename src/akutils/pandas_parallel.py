@@ -0,0 +1,102 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # type: ignore
+
+# Blocks smaller than this are converted in the calling process: shipping them to a
+# worker would cost more than the conversion itself
+MIN_BLOCK_ROWS = 50_000
+# More blocks than workers, so that a slow block does not leave the others idle
+_BLOCKS_PER_JOB = 4
+_SCHEMA = pa.schema([("values", pa.large_string())])
+
+
+def _get_n_jobs(n_jobs: int) -> int:
+    """
+    Number of worker processes, negative values count back from the number of CPUs
+    (-1: all CPUs, -2: all but one...)
+    """
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0")
+    if n_jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _run_block(func: Callable, data: pa.Buffer, kwargs: dict) -> np.ndarray:
+    # worker side: Arrow IPC batch -> str Series, as the single process path
+    batch = pa.ipc.read_record_batch(data, _SCHEMA)
+    strings = pd.Series(batch.column(0).to_numpy(zero_copy_only=False), dtype=object)
+    return func(strings, **kwargs)
+
+
+class RowBlockExecutor:
+    """
+    Runs a conversion of string values by row blocks in worker processes.
+
+    Blocks are shipped to the workers as Arrow IPC record batches (raw string
+    buffers, no pickled Python objects), each worker returns a numpy array and the
+    results are reassembled in row order. The process pool is started on first use
+    and shared by all the conversions run in the executor context. Workers are
+    spawned, not forked: forking a process running pyarrow threads can deadlock
+    (scripts must then guard their entry point with if __name__ == "__main__").
+
+    Parameters
+    ----------
+    n_jobs : int, default 1
+        Number of worker processes (-1: all CPUs), 1 converts in the calling process
+    min_block_rows : int, default None
+        Minimum number of rows of a block (default MIN_BLOCK_ROWS), smaller frames
+        are converted in the calling process
+    """
+
+    def __init__(self, n_jobs: int = 1, min_block_rows: int | None = None):
+        self.n_jobs = _get_n_jobs(n_jobs)
+        self.min_block_rows = min_block_rows or MIN_BLOCK_ROWS
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "RowBlockExecutor":
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def map(
+        self,
+        func: Callable[..., np.ndarray],
+        strings: np.ndarray | pd.Series,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        func(str Series, **kwargs) applied by row blocks, results concatenated in
+        row order
+        """
+        nb_rows = len(strings)
+        nb_blocks = min(self.n_jobs * _BLOCKS_PER_JOB, nb_rows // self.min_block_rows)
+        if self.n_jobs == 1 or nb_blocks < 2:
+            return func(pd.Series(strings), **kwargs)
+
+        array = pa.array(strings, type=pa.large_string(), from_pandas=True)
+        bounds = np.linspace(0, nb_rows, nb_blocks + 1).astype(int)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        futures = [
+            self._pool.submit(
+                _run_block,
+                func,
+                pa.RecordBatch.from_arrays(
+                    [array.slice(start, stop - start)], schema=_SCHEMA
+                ).serialize(),
+                kwargs,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        return np.concatenate([future.result() for future in futures])
@@ -0,0 +1,190 @@
+import pandas as pd
+import yaml  # type: ignore
+from dataclasses import dataclass, field
+from pathlib import Path
+from upath import UPath
+from pandas.api.types import is_object_dtype, is_string_dtype
+from typing import Callable, cast
+
+from akutils.os import warn
+from akutils.pandas_arrow import is_arrow_dtype
+from akutils.pandas_profile import invalidate_profile
+from akutils.pandas_serie_cleaner import (
+    _capitalise_serie,
+    _remove_accent_serie,
+    _strip_serie,
+    strip_columns,
+    remove_accent_from_cols,
+    capitalise_cols,
+    fillna_numerical_columns,
+    remove_empty_cols_from_df,
+    convert_datetimes_to_date,
+    map_cols_and_insert_next,
+)
+from akutils.pandas_type_conversion import (
+    columns_to_float,
+    columns_to_int,
+    columns_to_date,
+)
+
+
+# op name: (akutils function, vectorized serie kernel if the op can be fused)
+STEPS: dict[str, tuple[Callable, Callable | None]] = {
+    "strip": (strip_columns, _strip_serie),
+    "remove_accent": (remove_accent_from_cols, _remove_accent_serie),
+    "capitalise": (capitalise_cols, _capitalise_serie),
+    "to_float": (columns_to_float, None),
+    "to_int": (columns_to_int, None),
+    "to_date": (columns_to_date, None),
+    "fillna_numerical": (fillna_numerical_columns, None),
+    "remove_empty_cols": (remove_empty_cols_from_df, None),
+    "datetimes_to_date": (convert_datetimes_to_date, None),
+    "map": (map_cols_and_insert_next, None),
+}
+
+
+@dataclass
+class Stage:
+    """
+    Group of pipeline steps run together. A fused stage chains the vectorized kernels
+    of its string steps on each column, written back once, other stages run a single
+    akutils function.
+    """
+    steps: list = field(default_factory=list)
+    fused: bool = False
+
+    def columns(self, df: pd.DataFrame | None = None) -> dict:
+        """
+        {column: [op, ...]} of a fused stage, in step order ("*" for all columns)
+        """
+        ops_per_col: dict = {}
+        for step in self.steps:
+            cols = step.get("cols")
+            if cols is None:
+                cols = ["*"] if df is None else list(df.columns)
+            for col in cols:
+                ops_per_col.setdefault(col, []).append(step["op"])
+        return ops_per_col
+
+
+class CleaningPipeline:
+    """
+    Declarative cleaning pipeline compiled into fused stages.
+
+    Consecutive string steps (strip, remove_accent, capitalise) are fused: their
+    vectorized kernels (pandas .str or Arrow compute) are chained on each column,
+    which is written back to the DataFrame once instead of once per step. Other
+    steps run as is, in order. The pipeline is
+    callable, so it can be used per chunk as read_csv_in_chunks chunk_func.
+
+    Parameters
+    ----------
+    steps : list[dict]
+        Ordered steps, each a dict with an 'op' key (see akutils.pandas_pipeline.STEPS)
+        and the arguments of the matching akutils function
+
+    Exemple
+    -------
+
+    .. code-block:: yaml
+
+        # cleaning.yaml
+        steps:
+          - op: strip
+          - op: remove_accent
+            cols: [city, country]
+          - op: capitalise
+            cols: [country]
+          - op: to_float
+            col_list: [amount]
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        pipeline = ak.CleaningPipeline.from_yaml("cleaning.yaml")
+        print(pipeline.explain())
+        df = ak.read_csv_in_chunks(file_path, sep=";", chunk_func=pipeline)
+    """
+
+    def __init__(self, steps: list[dict]):
+        self.steps = []
+        for step in steps:
+            step = dict(step)
+            if step.get("op") not in STEPS:
+                raise ValueError(f"Unknown pipeline op: {step.get('op')}")
+            self.steps.append(step)
+        self.stages = self._compile()
+
+    @classmethod
+    def from_yaml(cls, path: str | Path | UPath) -> "CleaningPipeline":
+        """
+        Load a pipeline from a YAML file with a 'steps' list
+        """
+        with UPath(path).open("r") as f:
+            config = yaml.safe_load(f)
+        return cls(config["steps"])
+
+    def _compile(self) -> list[Stage]:
+        stages: list[Stage] = []
+        for step in self.steps:
+            fusable = STEPS[step["op"]][1] is not None
+            if fusable and stages and stages[-1].fused:
+                stages[-1].steps.append(step)
+            else:
+                stages.append(Stage(steps=[step], fused=fusable))
+        return stages
+
+    def explain(self) -> str:
+        """
+        Describe the compiled stages and, for fused stages, the steps of each column
+        """
+        lines = []
+        for i, stage in enumerate(self.stages, start=1):
+            if stage.fused:
+                lines.append(f"Stage {i}: fused, single write back per column")
+                for col, ops in stage.columns().items():
+                    lines.append(f"    {col}: {' -> '.join(ops)}")
+            else:
+                step = stage.steps[0]
+                args = ", ".join(f"{k}={v!r}" for k, v in step.items() if k != "op")
+                lines.append(f"Stage {i}: {step['op']}({args})")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"CleaningPipeline(\n{self.explain()}\n)"
+
+    def __call__(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        for stage in self.stages:
+            if stage.fused:
+                df = self._run_fused(df, stage)
+            else:
+                df = self._run_step(df, stage)
+        return df
+
+    @staticmethod
+    def _run_step(df: pd.DataFrame, stage: Stage) -> pd.DataFrame:
+        step = dict(stage.steps[0])
+        function = STEPS[step.pop("op")][0]
+        return function(df, **step)
+
+    @staticmethod
+    def _run_fused(df: pd.DataFrame, stage: Stage) -> pd.DataFrame:
+        for col, ops in stage.columns(df).items():
+            if col not in df.columns:
+                warn(f"column not found in DataFrame: {col}")
+                continue
+            is_text = is_string_dtype(df[col]) or is_object_dtype(df[col])
+            # strip is skipped on non string columns until a step casts them to str
+            while ops and ops[0] == "strip" and not is_text:
+                ops = ops[1:]
+            if len(ops) > 1 and all(op == "strip" for op in ops):
+                ops = ["strip"]  # strip is idempotent
+            if not ops:
+                continue
+            serie, arrow = df[col], is_arrow_dtype(df[col])
+            for op in ops:
+                serie = cast(Callable, STEPS[op][1])(serie, arrow)
+            df[col] = serie  # single write back per column
+            invalidate_profile(df, [col])
+        return df
@@ -0,0 +1,273 @@
+import re
+import weakref
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field, asdict
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_extension_array_dtype,
+    is_numeric_dtype,
+    is_object_dtype,
+    is_string_dtype,
+)
+
+# instance attribute (not df.attrs): pandas does not propagate it to derived frames
+_PROFILE_ATTR = "_akutils_profile"
+
+# shapes detected on the distinct values of string columns
+_NUMERIC_SHAPE = re.compile(r"^\s*[+-]?[\d\s ]*[.,]?\d+\s*%?\s*$")
+_DATE_SHAPE = re.compile(
+    r"^\s*(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\d{1,2}[-/]\d{1,2}[-/]\d{2,4})([ T].*)?$")
+
+
+@dataclass
+class ColumnProfile:
+    """
+    Statistics of a DataFrame column. Statistics not computed are None.
+
+    Attributes
+    ----------
+    dtype : str
+        dtype of the column when profiled
+    n_rows : int
+        Number of rows of the column
+    null_count : int
+        Number of missing values
+    empty_count : int
+        Number of empty strings ("")
+    all_null : bool
+        Column only contains missing values
+    all_empty : bool
+        Column only contains empty strings (missing values of extension dtypes are
+        skipped, as with (serie == "").all())
+    cardinality : int
+        Number of distinct non missing values
+    min, max
+        Smallest and largest non missing values
+    is_ascii : bool
+        All string values are pure ASCII
+    shape : str
+        Detected shape: 'numeric', 'date', 'string', 'bool' or 'other'
+    """
+    dtype: str
+    n_rows: int
+    null_count: int | None = None
+    empty_count: int | None = None
+    all_null: bool | None = None
+    all_empty: bool | None = None
+    cardinality: int | None = None
+    min: object = None
+    max: object = None
+    is_ascii: bool | None = None
+    shape: str | None = None
+
+    @property
+    def is_empty(self) -> bool | None:
+        if self.all_null is None:
+            return None
+        return bool(self.all_null or self.all_empty)
+
+
+@dataclass
+class DataFrameProfile:
+    """
+    Profile of a DataFrame, cached on the DataFrame object by ak.profile_df.
+
+    The profile only applies to the profiled DataFrame object, derived frames
+    (df.fillna(), df[cols]...) must be profiled again. The statistics of a column
+    are dropped when it is replaced (df[col] = ...), a column modified in place
+    (df.loc[...] = ...) must be invalidated (see ak.invalidate_profile).
+    """
+    n_rows: int
+    columns: dict = field(default_factory=dict)
+    # weak reference to the data of each profiled column, see _column_data
+    data: dict = field(default_factory=dict, repr=False)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            [asdict(profile) for profile in self.columns.values()],
+            index=pd.Index(list(self.columns), name="column"),
+        )
+
+
+def _column_data(serie: pd.Series):
+    """
+    Array holding the data of a column (root of the numpy views, extension array):
+    a new object when the column is replaced
+    """
+    if isinstance(serie.dtype, np.dtype):
+        values: np.ndarray = serie.to_numpy(copy=False)
+        while isinstance(values.base, np.ndarray):
+            values = values.base
+        return values
+    return serie.array
+
+
+def _same_data(profile: DataFrameProfile, df: pd.DataFrame, col) -> bool:
+    data_ref = profile.data.get(col)
+    return data_ref is not None and data_ref() is _column_data(df[col])
+
+
+def _skip_na_on_compare(serie: pd.Series) -> bool:
+    # (serie == "") gives <NA> on extension dtypes, skipped by .all()
+    return is_extension_array_dtype(serie.dtype)
+
+
+def _scan_emptiness(serie: pd.Series, block_size: int = 2**16) -> tuple[bool, bool]:
+    """
+    (all_null, all_empty) of a serie, scanned block by block: the scan stops as soon
+    as the column is known to be non-empty
+    """
+    all_null, all_empty = True, True
+    check_empty = is_string_dtype(serie.dtype) or is_object_dtype(serie.dtype)
+    all_empty = check_empty
+    for start in range(0, max(len(serie), 1), block_size):
+        block = serie.iloc[start: start + block_size]
+        all_null = all_null and bool(block.isna().all())
+        all_empty = all_empty and bool((block == "").all())
+        if not (all_null or all_empty):
+            break
+    return all_null, all_empty
+
+
+def _profile_column(serie: pd.Series) -> ColumnProfile:
+    """
+    All the statistics are derived from a single factorization of the column: the
+    row-level pass builds the codes, everything else runs on the distinct values
+    """
+    n_rows = len(serie)
+    profile = ColumnProfile(dtype=str(serie.dtype), n_rows=n_rows)
+    codes, uniques = pd.factorize(serie, use_na_sentinel=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    profile.null_count = int(n_rows - counts.sum())
+    profile.cardinality = len(uniques)
+    profile.all_null = profile.null_count == n_rows
+
+    values = pd.Series(uniques, dtype=uniques.dtype)
+    if is_string_dtype(serie.dtype) or is_object_dtype(serie.dtype):
+        is_str = values.map(lambda value: isinstance(value, str)).to_numpy(bool)
+        is_empty = values.eq("").to_numpy(dtype=bool, na_value=False)
+        profile.empty_count = int(counts[is_empty].sum())
+        non_null = n_rows - (profile.null_count if _skip_na_on_compare(serie) else 0)
+        profile.all_empty = profile.empty_count == non_null
+        strings = values[is_str]
+        profile.is_ascii = bool(strings.map(str.isascii).all())
+        if len(strings) == len(values) and len(strings):
+            profile.min, profile.max = strings.min(), strings.max()
+        filled = strings[strings != ""]
+        if len(filled) and filled.str.match(_NUMERIC_SHAPE).all():
+            profile.shape = "numeric"
+        elif len(filled) and filled.str.match(_DATE_SHAPE).all():
+            profile.shape = "date"
+        else:
+            profile.shape = "string" if is_str.all() else "other"
+    else:
+        profile.empty_count = 0
+        profile.all_empty = False
+        if len(values):
+            profile.min, profile.max = values.min(), values.max()
+        if is_bool_dtype(serie.dtype):
+            profile.shape = "bool"
+        elif is_numeric_dtype(serie.dtype):
+            profile.shape = "numeric"
+        elif is_datetime64_any_dtype(serie.dtype):
+            profile.shape = "date"
+        else:
+            profile.shape = "other"
+    return profile
+
+
+def get_profile(df: pd.DataFrame) -> DataFrameProfile | None:
+    """
+    Return the profile cached on the DataFrame, None if missing or outdated
+    """
+    profile = vars(df).get(_PROFILE_ATTR)
+    if profile is None or profile.n_rows != len(df):
+        return None
+    return profile
+
+
+def get_column_profile(df: pd.DataFrame, col) -> ColumnProfile | None:
+    """
+    Return the cached profile of a column, None if missing or outdated (column
+    replaced or dtype changed)
+    """
+    profile = get_profile(df)
+    column_profile = None if profile is None else profile.columns.get(col)
+    if profile is None or column_profile is None:
+        return None
+    if column_profile.dtype != str(df[col].dtype) or not _same_data(profile, df, col):
+        return None
+    return column_profile
+
+
+def invalidate_profile(df: pd.DataFrame, cols: list | None = None):
+    """
+    Drop cached statistics of modified columns (all columns if cols is None).
+    akutils cleaners and converters call it on the columns they modify, call it
+    after modifying profiled columns by other means.
+    """
+    profile = get_profile(df)
+    if profile is None:
+        return
+    if cols is None:
+        del vars(df)[_PROFILE_ATTR]
+        return
+    for col in cols:
+        profile.columns.pop(col, None)
+        profile.data.pop(col, None)
+
+
+def profile_df(
+    df: pd.DataFrame,
+    cols: list | None = None,
+    emptiness_only: bool = False,
+    cache: bool = True
+) -> DataFrameProfile:
+    """
+    Profile DataFrame columns in a single vectorized pass per column.
+
+    Computes null count, empty-string count, cardinality, min/max, whether the
+    string values are pure ASCII and the detected shape (numeric, date...). With
+    cache=True the profile is cached on the DataFrame (see ak.get_profile), cleaners
+    and converters only read it where an outdated value can not lose data and never
+    cache implicitly: ak.remove_accent_from_cols skips pure ASCII columns,
+    ak.columns_to_float/int/date skip all-null columns (checked on the data) and
+    only convert the distinct values of low cardinality columns.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to be profiled
+    cols : list, default None
+        Columns to be profiled, default all columns
+    emptiness_only : bool, default False
+        Only find empty columns: the scan of a column stops as soon as it is known to
+        be non-empty
+    cache : bool, default True
+        Cache the profile on the DataFrame (merged with the statistics already cached)
+    """
+    profile = get_profile(df) if cache else None
+    if profile is None:
+        profile = DataFrameProfile(n_rows=len(df))
+    cols = list(df.columns) if cols is None else cols
+    for col in cols:
+        cached = get_column_profile(df, col) if cache else None
+        if cached is not None and (emptiness_only or cached.null_count is not None):
+            continue
+        serie = df[col]
+        if emptiness_only:
+            column_profile = ColumnProfile(dtype=str(serie.dtype), n_rows=len(serie))
+            column_profile.all_null, column_profile.all_empty = _scan_emptiness(serie)
+        else:
+            column_profile = _profile_column(serie)
+        profile.columns[col] = column_profile
+        if cache:
+            try:
+                profile.data[col] = weakref.ref(_column_data(serie))
+            except TypeError:  # no weak reference: the statistics are not reused
+                profile.data.pop(col, None)
+    if cache:
+        object.__setattr__(df, _PROFILE_ATTR, profile)
+    return profile
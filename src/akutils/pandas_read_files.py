@@ -1,43 +1,545 @@
+import codecs
+import csv
+import mmap
+import numpy as np
 import pandas as pd
-import fsspec  # type: ignore
+import pyarrow as pa  # type: ignore
+import pyarrow.dataset as ds  # type: ignore
+import pyarrow.parquet as pq  # type: ignore
 import re
+import struct
+import time
 import zipfile
-from io import TextIOWrapper, BytesIO
+from contextlib import contextmanager
+from io import BufferedReader, BytesIO, RawIOBase
 from upath import UPath
-from upath.implementations.cloud import AzurePath
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator, Literal
+from pandas.io._util import _arrow_dtype_mapping  # type: ignore
+from pandas.io.common import infer_compression  # type: ignore
 from pandas._typing import (
     FilePath,
     ReadCsvBuffer,
     DtypeArg
 )
 from akutils.utils_functions import (
-    timeit,
+    _log_duration,
     contruct_function_args_from_locals,
 )
-from akutils.os import list_files_from_dir, warn
-
-
-def _warn_column_mismatch(list_of_df):
-    for i, df in enumerate(list_of_df[1:], start=1):
-        diff = set(df.columns) ^ set(list_of_df[0].columns)
-        if diff:
-            extra = set(df.columns) - set(list_of_df[0].columns)
-            missing = set(list_of_df[0].columns) - set(df.columns)
-            warn(
-                f"[WARNING] Columns mismatch for file_{i + 1}: "
-                f"missing={missing or '{}'}, extra={extra or '{}'}"
-            )
+from akutils.pandas_aggregate import StreamingAggregator, _get_aggregator
+from akutils.os import (
+    list_files_from_dir,
+    warn,
+    file_fingerprint,
+    is_local_path,
+    _is_transient_error,
+)
+from akutils.fs_session import get_session
+from akutils.pandas_arrow import (
+    ARROW_STRING,
+    DtypeBackend,
+    dtype_to_arrow,
+    unify_schemas,
+)
+from akutils.pandas_chunksize import ChunkSizer, _get_chunk_sizer
+from akutils.pandas_checkpoint import IngestionCheckpoint, _get_checkpoint
+from akutils.pandas_concat import (
+    ColumnPolicy,
+    SchemaDriftReport,
+    _apply_policy,
+    _concat_dataframes,
+)
+from akutils.pandas_dedup import RowDeduplicator, _get_deduplicator
+from akutils.pandas_sample import RowSampler, _get_sampler
+from akutils.pandas_sniff import sniff_csv
+from akutils.progress import ProgressCallback, _FileProgress
+
+SourceEncoding = Literal["category", "index"]
+
+
+def _concat_files(
+    list_of_df: list[pd.DataFrame],
+    sources: list,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    normalize_columns: bool | Callable = False,
+) -> pd.DataFrame:
+    """
+    Concatenate the DataFrames read from each file (see ak.concat_dataframes) and
+    attach the SchemaDriftReport to the result as a JSON serializable dict
+    (df.attrs["schema_drift"], kept by df.to_parquet)
+    """
+    df, report = _concat_dataframes(
+        list_of_df,
+        sources=sources,
+        missing_columns=missing_columns,
+        extra_columns=extra_columns,
+        normalize_columns=normalize_columns,
+    )
+    if report.has_drift:
+        warn(
+            f"[WARNING] Schema drift found in {len(report.missing | report.extra)} "
+            "file(s), see df.attrs['schema_drift']"
+        )
+    df.attrs["schema_drift"] = report.to_dict()
+    return df
+
+
+def _get_chunk_filters(
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+) -> tuple[RowDeduplicator | None, RowSampler | None]:
+    deduplicator, sampler = _get_deduplicator(deduplicate), _get_sampler(sample)
+    if sampler is not None and deduplicator is not None and deduplicator.keep == "last":
+        raise ValueError("sample cannot be combined with deduplicate keep='last'")
+    return deduplicator, sampler
+
+
+def _get_chunk_aggregator(
+    aggregate: StreamingAggregator | dict | None,
+    deduplicator: RowDeduplicator | None,
+    sampler: RowSampler | None,
+) -> StreamingAggregator | None:
+    aggregator = _get_aggregator(aggregate)
+    if aggregator is not None and (
+        sampler is not None
+        or (deduplicator is not None and deduplicator.keep == "last")
+    ):
+        # rows kept by these filters are only known once all chunks are read
+        raise ValueError(
+            "aggregate cannot be combined with sample or deduplicate keep='last'")
+    return aggregator
+
+
+def _finalize_chunk_filters(list_of_df: list[pd.DataFrame], *chunk_filters):
+    # drop the rows filtered out by later chunks (see RowDeduplicator, RowSampler)
+    for chunk_filter in chunk_filters:
+        if chunk_filter is not None:
+            list_of_df = chunk_filter.finalize(list_of_df)
+    return list_of_df
+
+
+# bytes of a blank line, skipped by pd.read_csv (skip_blank_lines=True)
+_BLANK_BYTES = np.frombuffer(b" \t\r\n", dtype=np.uint8)
+
+ResumeSettings = tuple[int, int, bytes | None, bool]
+
+
+def _resume_settings(read_csv_args: dict) -> ResumeSettings:
+    """
+    (skiprows, number of header records, quote byte, skip blank lines) used to find
+    the byte offset of the records read by pd.read_csv. Resuming a file (retries,
+    checkpoint) requires arguments where a record ends on a newline outside quotes.
+    """
+    unsupported = [
+        arg for arg in ("comment", "escapechar", "lineterminator", "skipfooter")
+        if read_csv_args.get(arg)
+    ]
+    encoding = codecs.lookup(read_csv_args.get("encoding") or "utf-8").name
+    if encoding.startswith(("utf-16", "utf-32")):
+        unsupported.append(f"encoding={encoding}")
+    if isinstance(read_csv_args.get("compression"), dict):
+        unsupported.append("compression options")
+    skiprows = read_csv_args.get("skiprows") or 0
+    header = read_csv_args.get("header", "infer")
+    if header == "infer":
+        header = None if read_csv_args.get("names") is not None else 0
+    if not isinstance(skiprows, int) or not (header is None or isinstance(header, int)):
+        unsupported.append("skiprows or header other than int")
+    if unsupported:
+        raise ValueError(
+            f"Resuming a file (retries, checkpoint) does not support {unsupported}")
+    quotechar = read_csv_args.get("quotechar") or '"'
+    quoting = read_csv_args.get("quoting") or csv.QUOTE_MINIMAL
+    quote = None if quoting == csv.QUOTE_NONE else quotechar.encode()
+    n_header = 0 if header is None else header + 1
+    return skiprows, n_header, quote, read_csv_args.get("skip_blank_lines", True)
+
+
+class _RecordScanner(RawIOBase):
+    """
+    Binary stream read by pd.read_csv, recording the byte offset where each record
+    ends (newline outside quotes, blank lines skipped as by pd.read_csv), so that a
+    file can be reopened right after its last record read. A resumed file is read
+    from its first bytes up to the end of the header (prefix), followed by the file
+    positioned after the last record read (offset).
+    """
+
+    def __init__(
+        self,
+        file,
+        settings: ResumeSettings,
+        prefix: bytes = b"",
+        offset: int = 0,
+    ):
+        self.file = file
+        self._skip_lines, self._n_header, quote, self._skip_blank = settings
+        self._quote = None if quote is None else quote[0]
+        self._prefix, self._offset = prefix, offset
+        self._position = 0  # bytes returned to the parser
+        self._in_quote, self._line_content = False, 0
+        self._records_start: int | None = 0 if self._skip_lines == 0 else None
+        self._header_end: int | None = None
+        self._ends: list[np.ndarray] = []  # end offsets of the records not queried
+        self._first_record = 0  # index of the first record of _ends
+
+    def readable(self) -> bool:
+        return True
+
+    def _file_offset(self, position: int) -> int:
+        if position <= len(self._prefix):
+            return position
+        return position - len(self._prefix) + self._offset
+
+    def tell(self) -> int:
+        return self._file_offset(self._position)
+
+    def readinto(self, buffer) -> int:
+        start = self._file_offset(self._position)
+        if self._position < len(self._prefix):
+            data = self._prefix[self._position: self._position + len(buffer)]
+        else:
+            data = self.file.read(len(buffer))
+        nbytes = len(data)
+        buffer[:nbytes] = data
+        self._position += nbytes
+        if nbytes:
+            self._scan(np.frombuffer(data, dtype=np.uint8), start)
+        elif self._line_content:  # last record without final newline
+            self._ends.append(np.array([start], dtype=np.int64))
+            self._line_content = 0
+        return nbytes
+
+    def _scan(self, buf: np.ndarray, start: int):
+        if self._skip_lines:
+            # skiprows counts physical lines
+            newlines = np.flatnonzero(buf == 10)
+            if len(newlines) < self._skip_lines:
+                self._skip_lines -= len(newlines)
+                return
+            first = int(newlines[self._skip_lines - 1]) + 1
+            self._skip_lines, self._records_start = 0, start + first
+            buf, start = buf[first:], start + first
+        is_newline = buf == 10
+        if self._quote is not None:
+            in_quote = (np.cumsum(buf == self._quote) + self._in_quote) % 2 == 1
+            if len(buf):
+                self._in_quote = bool(in_quote[-1])
+            is_newline &= ~in_quote
+        newlines = np.flatnonzero(is_newline)
+        content = np.cumsum(~np.isin(buf, _BLANK_BYTES))
+        if len(newlines) == 0:
+            self._line_content += int(content[-1]) if len(buf) else 0
+            return
+        line_content = np.diff(content[newlines], prepend=0)
+        line_content[0] += self._line_content
+        self._line_content = int(content[-1] - content[newlines[-1]])
+        if self._skip_blank:
+            newlines = newlines[line_content > 0]
+        self._ends.append(start + newlines.astype(np.int64) + 1)
+
+    def _record_end(self, index: int) -> int | None:
+        ends = np.concatenate(self._ends) if self._ends else np.empty(0, np.int64)
+        position = index - self._first_record
+        if not 0 <= position < len(ends):
+            return None
+        self._ends, self._first_record = [ends[position:]], index
+        return int(ends[position])
+
+    def resume_offsets(self, nb_rows: int) -> tuple[int, int] | None:
+        """
+        (end of the header, end of the last record read) once nb_rows data rows
+        were read from this stream, None if the records could not be found
+        """
+        if self._header_end is None:
+            self._header_end = (
+                self._records_start if self._n_header == 0
+                else self._record_end(self._n_header - 1))
+        data_end = self._record_end(self._n_header + nb_rows - 1)
+        if self._header_end is None or data_end is None:
+            return None
+        return self._header_end, data_end
+
+
+@contextmanager
+def _open_csv(
+    read_csv_args: dict,
+    settings: ResumeSettings | None,
+    rows_read: int = 0,
+    offsets: tuple[int, int] | None = None,
+) -> Iterator[tuple[dict, _RecordScanner | None]]:
+    """
+    (pd.read_csv arguments, record scanner). With resume settings the file is
+    opened as a _RecordScanner, positioned after the rows_read first rows (offsets:
+    end of the header, end of the last record read)
+    """
+    if settings is None:
+        with _open_remote(read_csv_args) as read_csv_args:
+            yield read_csv_args, None
+        return
+    path = read_csv_args["filepath_or_buffer"]
+    compression = infer_compression(
+        str(path), read_csv_args.get("compression", "infer"))
+    with get_session().open(path, "rb", compression=compression) as file:
+        prefix, offset = b"", 0
+        if offsets is not None:
+            header_end, offset = offsets
+            prefix = file.read(header_end)
+            file.seek(offset)  # range request / forward decompression, not parsed
+        scanner = _RecordScanner(file, settings, prefix, offset)
+        read_csv_args = {
+            **read_csv_args,
+            "filepath_or_buffer": BufferedReader(scanner),
+            "compression": None,
+        }
+        read_csv_args.pop("memory_map", None)
+        if read_csv_args.get("nrows") is not None:
+            read_csv_args["nrows"] -= rows_read
+        yield read_csv_args, scanner
+
+
+def _iter_csv_chunks(
+    read_csv_args: dict,
+    chunk_sizer: ChunkSizer | None,
+    source: str,
+    settings: ResumeSettings | None,
+    rows_read: int = 0,
+    offsets: tuple[int, int] | None = None,
+    retries: int = 0,
+    retry_backoff: float = 1.0,
+) -> Iterator[tuple[pd.DataFrame, object, tuple[int, int] | None]]:
+    """
+    (chunk, reader, resume offsets) of a file read by pd.read_csv. On a transient
+    read error the file is reopened at the byte offset following the last chunk
+    yielded (see _RecordScanner), errors raised by the caller while handling a chunk
+    are not retried.
+    """
+    attempt = 0
+    while True:
+        try:
+            with _open_csv(read_csv_args, settings, rows_read, offsets) as (
+                    args, scanner), pd.read_csv(**args) as reader:
+                rows_opened = rows_read
+                chunk_iterator = reader if chunk_sizer is None else (
+                    chunk_sizer.iter_chunks(reader, source))
+                for chunk in chunk_iterator:
+                    if len(chunk) == 0 and rows_read:
+                        continue  # resumed at the end of the file: header only
+                    rows_read += len(chunk)
+                    if scanner is not None:
+                        offsets = scanner.resume_offsets(rows_read - rows_opened)
+                    yield chunk, reader, offsets
+                    attempt = 0
+            return
+        except Exception as error:
+            resumable = settings is not None and (offsets is not None or not rows_read)
+            if attempt >= retries or not resumable or not _is_transient_error(error):
+                raise
+            attempt += 1
+            delay = retry_backoff * 2 ** (attempt - 1)
+            warn(f"{error!r} after {rows_read} rows, retry {attempt}/{retries} "
+                 f"in {delay}s")
+            time.sleep(delay)
+
+
+# zip local file header (see zipfile.structFileHeader), followed by the file name
+# (field 10) and the extra field (field 11) lengths, then by the member data
+_ZIP_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_ZIP_LOCAL_SIGNATURE = b"PK\003\004"
+
+# compressed files are decompressed as a stream, only plain files are memory mapped
+_COMPRESSED_SUFFIXES = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar", ".tgz", ".7z")
+
+
+def _use_memory_map(filepath_or_buffer, read_csv_args: dict) -> bool:
+    if "memory_map" in read_csv_args or not is_local_path(filepath_or_buffer):
+        return False
+    no_compression = read_csv_args.get("compression", "infer") in ("infer", None)
+    suffix = Path(filepath_or_buffer).suffix.lower()
+    return no_compression and suffix not in _COMPRESSED_SUFFIXES
+
+
+class _MemoryViewReader(RawIOBase):
+    """
+    Binary file-like object reading a memoryview in place (e.g. a mmap slice)
+    """
+
+    def __init__(self, view: memoryview, name: str = ""):
+        self._view, self._position, self.name = view, 0, name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        start = (0, self._position, len(self._view))[whence]
+        self._position = max(0, start + offset)
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        size = max(0, min(len(buffer), len(self._view) - self._position))
+        buffer[:size] = self._view[self._position: self._position + size]
+        self._position += size
+        return size
+
+    def close(self):
+        self._view.release()  # the mmap can only be closed once views are released
+        super().close()
+
+
+@contextmanager
+def _zip_buffer(zip_path: Path | UPath | BytesIO) -> Iterator[memoryview | None]:
+    """
+    Whole zip as a memoryview (mmap of a local file, buffer of a BytesIO) so that
+    STORED members are read in place, None when not available
+    """
+    if isinstance(zip_path, BytesIO):
+        with zip_path.getbuffer() as view:
+            yield view
+    elif is_local_path(zip_path) and Path(zip_path).stat().st_size:
+        with open(zip_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    yield view
+    else:
+        yield None
+
+
+def _open_zip_member(
+    zip_ref: zipfile.ZipFile, file_name: str, zip_buffer: memoryview | None
+):
+    """
+    Binary file object of a zip member: STORED (uncompressed) members are read in
+    place from the zip buffer, others are decompressed as a stream by zipfile
+    """
+    info = zip_ref.getinfo(file_name)
+    is_encrypted = info.flag_bits & 0x1
+    if zip_buffer is None or info.compress_type != zipfile.ZIP_STORED or is_encrypted:
+        return zip_ref.open(info)
+    start = info.header_offset
+    fields = _ZIP_LOCAL_HEADER.unpack_from(zip_buffer, start)
+    if fields[0] != _ZIP_LOCAL_SIGNATURE:
+        return zip_ref.open(info)
+    start += _ZIP_LOCAL_HEADER.size + fields[10] + fields[11]
+    return _MemoryViewReader(
+        zip_buffer[start: start + info.compress_size], name=info.filename)
+
+
+def _bytes_read(reader) -> int | None:
+    # position of the binary handle pd.read_csv reads from (pandas internals)
+    try:
+        handle = reader.handles.handle
+        return getattr(handle, "buffer", handle).tell()
+    except Exception:
+        return None
+
+
+@contextmanager
+def _open_remote(read_csv_args: dict) -> Iterator[dict]:
+    """
+    pd.read_csv arguments where a remote path is replaced by a file opened with the
+    shared filesystem session (pooled connections of its storage account) instead
+    of a filesystem created by pandas for each file
+    """
+    path = read_csv_args["filepath_or_buffer"]
+    if not isinstance(path, (str, Path)) or is_local_path(path):
+        yield read_csv_args
+        return
+    # pandas only infers the compression from a path, not from a file object
+    compression = infer_compression(
+        str(path), read_csv_args.get("compression", "infer"))
+    with get_session().open(path, "rb") as file:
+        yield {**read_csv_args, "filepath_or_buffer": file, "compression": compression}
+
 
+def _file_size(filepath_or_buffer) -> int | None:
+    try:
+        return file_fingerprint(UPath(filepath_or_buffer))[1]
+    except Exception:
+        return None
 
-@timeit
+
+def _add_file_source(
+    df: pd.DataFrame,
+    file_name: str,
+    add_source: bool | SourceEncoding,
+    file_index: int,
+    nb_files: int,
+    dtype_backend=None,
+):
+    if add_source in ("category", "index"):
+        # a few bytes per row, decoded once all the files are concatenated
+        index_dtype = "int16" if nb_files <= np.iinfo(np.int16).max else "int32"
+        df["file_index"] = np.full(len(df), file_index, dtype=index_dtype)
+        return
+    # keep the source column in Arrow memory as the rest of the frame
+    dtype = ARROW_STRING if dtype_backend == "pyarrow" else None
+    df["file_source"] = pd.Series(file_name, index=df.index, dtype=dtype)
+
+
+def _encode_file_source(
+    df: pd.DataFrame, sources: list, add_source: bool | SourceEncoding
+) -> pd.DataFrame:
+    if add_source == "category" and "file_index" in df.columns:
+        df["file_source"] = pd.Categorical.from_codes(
+            df.pop("file_index"), categories=pd.Index(sources, dtype=object))
+    elif add_source == "index":
+        df.attrs["file_index"] = [str(source) for source in sources]
+    return df
+
+
+def file_source_lookup(df: pd.DataFrame) -> pd.Series:
+    """
+    File name of each file index of a DataFrame read with add_source="index" (from
+    df.attrs["file_index"]) or add_source="category" (categories of file_source)
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df = ak.read_multiple_csv_from_dir(dir_path, sep=";", add_source="index")
+        lookup = ak.file_source_lookup(df)
+        df["file_index"].map(lookup)  # file name of each row, when needed
+    """
+    if "file_index" in df.attrs:
+        sources = df.attrs["file_index"]
+    elif isinstance(df.get("file_source", pd.Series()).dtype, pd.CategoricalDtype):
+        sources = list(df["file_source"].cat.categories)
+    else:
+        raise ValueError(
+            "No file index lookup: read the files with add_source='index' or "
+            "add_source='category'")
+    return pd.Series(
+        sources, index=pd.RangeIndex(len(sources), name="file_index"),
+        name="file_source", dtype=object)
+
+
+@_log_duration
 def read_csv_in_chunks(
     filepath_or_buffer: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str],
     chunk_func: Callable | None = None,
     chunk_func_kwarg=None,
     chunksize: int = 10**6,
+    max_chunk_bytes: int | str | ChunkSizer | None = None,
     dtype: DtypeArg | None = "string",
+    dtype_backend: DtypeBackend | None = None,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    sniff: bool = False,
+    checkpoint: str | Path | IngestionCheckpoint | None = None,
+    retries: int = 0,
+    retry_backoff: float = 1.0,
+    progress: ProgressCallback | None = None,
+    add_row_number: bool = False,
+    aggregate: StreamingAggregator | dict | None = None,
     **kwargs
 ) -> pd.DataFrame:
     """
@@ -53,6 +555,57 @@ def read_csv_in_chunks(
     chunk_func : Callable, default None
         The function will be applied to each chunk (e.g. filter, change type...)
         first function arg should should be the chunk df
+    chunksize : int, default 10**6
+        Number of rows of each chunk
+    max_chunk_bytes : int | str | ak.ChunkSizer, default None
+        Memory budget of a parsed chunk (e.g. "512MB") replacing chunksize: the
+        bytes per row are measured on a first small chunk and the chunk size is
+        adjusted after each chunk (see ak.ChunkSizer, whose to_frame reports the
+        chosen sizes and the throughput)
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Back-end data type applied to the resultant DataFrame. With "pyarrow", data
+        stays in Arrow memory ("string" dtype is read as string[pyarrow]) and the
+        chunks are concatenated zero-copy as pyarrow ChunkedArray
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows chunk by chunk, after chunk_func (see ak.RowDeduplicator
+        to deduplicate on a subset of columns or keep the last occurrence). A
+        RowDeduplicator instance can be shared across calls, with keep="last" its
+        finalize must then be called on the results. Rows are compared on 128 bits
+        hashes: the result is probabilistic, with a negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows (see ak.RowSampler): the rows
+        evicted from the sample are dropped after each chunk, so the memory usage
+        is bounded by the sample size
+    sniff : bool, default False
+        Detect encoding, delimiter, decimal separator and header row from the first
+        bytes of the file (see ak.sniff_csv), arguments passed explicitly win
+    checkpoint : str | Path | ak.IngestionCheckpoint, default None
+        Local directory where processed chunks are saved: a rerun resumes at the
+        byte offset following the last completed chunk (see ak.IngestionCheckpoint
+        and retries for the supported arguments)
+    retries : int, default 0
+        Number of retries on transient read errors (network, timeout...), errors
+        raised by chunk_func are not retried. The file is reopened at the byte
+        offset following the last completed chunk (previous records are not read
+        again, quoted fields may span several lines). Not supported with comment,
+        escapechar, lineterminator, skipfooter, utf-16/32 encodings and non int
+        skiprows or header.
+    retry_backoff : float, default 1.0
+        Delay in seconds before the first retry, doubled at each new retry
+    progress : Callable, default None
+        Called with an ak.ProgressEvent when the file is opened, after each chunk
+        and when the file is read (rows, bytes read, rows/s...). Nothing is printed
+        by default, see ak.LoggingProgress, ak.RichProgress and ak.throttle
+    add_row_number : bool, default False
+        Add a 'file_row' column (int64) with the position of each row in the file
+        (0 based data rows), kept by filtering, resumed reads and retries.
+        chunk_func must then keep the index of the rows it returns.
+    aggregate : ak.StreamingAggregator | dict, default None
+        Group by aggregation computed chunk by chunk, after chunk_func and
+        deduplicate: only the aggregates are kept in memory and returned, one row
+        per group. A dict is passed to ak.StreamingAggregator (by, aggs...). An
+        ak.StreamingAggregator instance can be shared across calls: it is only
+        updated (an empty DataFrame is returned), its result() gives the aggregates
     **kwargs
         Pass any argument allowed by pd.read_csv and/or by the custom chunk function
 
@@ -78,27 +631,122 @@ def read_csv_in_chunks(
     """
     if chunk_func_kwarg is None:
         chunk_func_kwarg = {}
-    print(f"File: {filepath_or_buffer}")
+    if dtype_backend == "pyarrow":
+        dtype = dtype_to_arrow(dtype)
+    if sniff and isinstance(filepath_or_buffer, (str, Path)):
+        kwargs = sniff_csv(filepath_or_buffer).read_csv_kwargs(kwargs)
     locals_args = locals()  # get all args passed in the function
     read_csv_args = contruct_function_args_from_locals(pd.read_csv, locals_args)
+    if dtype_backend is None:
+        read_csv_args.pop("dtype_backend", None)
+    if _use_memory_map(filepath_or_buffer, read_csv_args):
+        read_csv_args["memory_map"] = True  # parse the OS page cache in place
+    deduplicator, sampler = _get_chunk_filters(deduplicate, sample)
+    checkpoint = _get_checkpoint(checkpoint)
+    is_path = isinstance(filepath_or_buffer, (str, Path))
+    if checkpoint is not None and not is_path:
+        raise ValueError("checkpoint requires a file path, not a buffer")
+    aggregator = _get_chunk_aggregator(aggregate, deduplicator, sampler)
+    chunk_sizer = _get_chunk_sizer(max_chunk_bytes)
+    if checkpoint is not None and (deduplicator or sampler or aggregator):
+        raise ValueError(
+            "checkpoint cannot be combined with deduplicate, sample or aggregate")
 
-    df = pd.DataFrame()
-    counter = 0
-    for chunk in pd.read_csv(**read_csv_args):
-        print(f"Chunk number => {counter}")
-        chunk = chunk_func(df=chunk, **chunk_func_kwarg) if chunk_func else chunk
-        df = pd.concat([df, chunk], axis=0, ignore_index=True)
+    chunks: list[pd.DataFrame] = []
+    rows_read, done, offsets = 0, False, None
+    if checkpoint is not None:
+        # chunks saved with other arguments are not reused
+        checkpoint_args = {
+            key: value for key, value in read_csv_args.items()
+            if key not in ("filepath_or_buffer", "chunksize", "memory_map")
+        }
+        checkpoint_args.update(
+            chunk_func=chunk_func,
+            chunk_func_kwarg=chunk_func_kwarg,
+            add_row_number=add_row_number,
+        )
+        chunks, rows_read, done = checkpoint.start(
+            str(filepath_or_buffer), checkpoint_args)
+        offsets = checkpoint.resume_offsets(str(filepath_or_buffer))
+    # byte offsets of the records are only tracked when the file may be reopened
+    resumable = is_path and (checkpoint is not None or retries > 0)
+    counter = len(chunks)
+    file_progress = _FileProgress(
+        progress,
+        source=str(getattr(filepath_or_buffer, "name", filepath_or_buffer)),
+        total_bytes=_file_size(filepath_or_buffer) if progress and is_path else None,
+    )
+    file_progress.start()
+    bytes_read = None
+    file_chunks = () if done else _iter_csv_chunks(
+        read_csv_args,
+        chunk_sizer,
+        file_progress.source,
+        _resume_settings(read_csv_args) if resumable else None,
+        rows_read,
+        offsets,
+        retries,
+        retry_backoff,
+    )
+    for chunk, reader, offsets in file_chunks:
+        nb_rows = len(chunk)
+        if add_row_number:
+            # index restarts at 0 when the file is reopened (resume)
+            chunk.index = pd.RangeIndex(rows_read, rows_read + nb_rows)
+        if chunk_func:
+            chunk = chunk_func(df=chunk, **chunk_func_kwarg)
+        for chunk_filter in (deduplicator, sampler):
+            if chunk_filter is not None:
+                chunk = chunk_filter.filter(chunk)
+        if add_row_number:
+            chunk["file_row"] = chunk.index.to_numpy(dtype="int64")
+        if aggregator is not None:
+            aggregator.update(chunk)  # raw rows are not kept
+        else:
+            chunks.append(chunk)
+        if sampler is not None:
+            chunks = sampler.compact(chunks)  # rows evicted from the reservoir
+        rows_read += nb_rows
+        if progress is not None:
+            bytes_read = _bytes_read(reader)
+            file_progress.chunk(counter, nb_rows, bytes_read)
         counter += 1
+        if checkpoint is not None:
+            checkpoint.save_chunk(str(filepath_or_buffer), chunk, rows_read, offsets)
+    if checkpoint is not None:
+        checkpoint.mark_done(str(filepath_or_buffer))
+    file_progress.end(bytes_read)
+    # filters shared with the caller (multi files readers) are finalized by it
+    chunks = _finalize_chunk_filters(
+        chunks,
+        deduplicator if deduplicator is not deduplicate else None,
+        sampler if sampler is not sample else None,
+    )
+    if aggregator is not None:
+        # an aggregator shared with the caller is only updated
+        return pd.DataFrame() if aggregator is aggregate else aggregator.result()
+    # single concat: Arrow backed chunks are only referenced (ChunkedArray)
+    df = pd.concat(chunks, axis=0, ignore_index=True) if chunks else pd.DataFrame()
     return df
 
 
-@timeit
+@_log_duration
 def read_multiple_csv_from_zip(
     zip_path: Path | UPath | BytesIO,
     regex: str = r".*",
     case_sensitive: bool = False,
     allowed_extension: list = [".csv", ".txt", ".dsv", ".gz", ".zip", ".tar", "7z"],
-    add_source: bool = False,
+    add_source: bool | SourceEncoding = False,
+    add_row_number: bool = False,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    normalize_columns: bool | Callable = False,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    aggregate: StreamingAggregator | dict | None = None,
+    max_chunk_bytes: int | str | ChunkSizer | None = None,
+    preview: int | None = None,
+    sniff: bool = False,
     **kwargs
 ):
     """
@@ -118,17 +766,57 @@ def read_multiple_csv_from_zip(
     case_sensitive : bool, default False
         Allow to enable or disable case sensitive on regex match
     allowed_extension : list, default [".csv", ".txt", ".dsv", ".gz", ".zip", ".tar"]
+    add_source : bool | {'category', 'index'}, default False
+        Add the file each row comes from: True adds a 'file_source' column with
+        the file name, 'category' stores it as a categorical column (a small int
+        per row), 'index' adds a 'file_index' column (int16) whose file names are
+        in df.attrs['file_index'] (see ak.file_source_lookup)
+    add_row_number : bool, default False
+        Add a 'file_row' column with the position of each row in its file (0 based
+        data rows, before any filtering)
+    missing_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files lacking columns of the first file (see ak.concat_dataframes)
+    extra_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files with columns not in the first file (see ak.concat_dataframes)
+    normalize_columns : bool | Callable, default False
+        Normalize column names before concatenation (see ak.concat_dataframes)
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows across all files while reading, before concatenation
+        (see ak.RowDeduplicator to deduplicate on a subset of columns or keep the
+        last occurrence). Rows are compared on 128 bits hashes: the result is
+        probabilistic, with a negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows across all files (see
+        ak.RowSampler): the rows evicted from the sample are dropped after each
+        chunk and file, the memory usage is bounded by about twice the sample size
+    aggregate : ak.StreamingAggregator | dict, default None
+        Group by aggregation computed chunk by chunk across all files (see
+        ak.StreamingAggregator, a dict is passed to it): the aggregates are
+        returned, one row per group, the raw rows are never held in memory
+    max_chunk_bytes : int | str | ak.ChunkSizer, default None
+        Memory budget of a parsed chunk (e.g. "512MB") replacing chunksize, the
+        chunk size learned on a file carries over to the next ones (see
+        ak.ChunkSizer)
+    preview : int, default None
+        Only read the first n rows of each file
+    sniff : bool, default False
+        Detect encoding, delimiter, decimal separator and header row of each file
+        from its first bytes (see ak.sniff_csv), arguments passed explicitly win.
+        Files of mixed dialects are then read in a single call.
     **kwargs
         Pass any argument allowed by pd.read_csv and/or by the custom chunk function
+        (e.g. dtype_backend="pyarrow" to keep the data in Arrow memory) and by
+        ak.read_csv_in_chunks (e.g. progress=ak.LoggingProgress() to report the
+        progress of each file)
     """
 
-    # Handle Azure zip
-    if type(zip_path) is AzurePath:
-        with fsspec.open(zip_path, 'r') as f:
+    # Handle remote zip (Azure...)
+    if isinstance(zip_path, Path) and not is_local_path(zip_path):
+        with get_session().open(zip_path, "rb") as f:
             zip_path = BytesIO(f.read())
 
     # Get first mathing zip from a directory
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+    with _zip_buffer(zip_path) as zip_buffer, zipfile.ZipFile(zip_path, 'r') as zip_ref:
         # Get list of file names in the archive
         file_list = zip_ref.namelist()
 
@@ -146,39 +834,67 @@ def read_multiple_csv_from_zip(
         if not files_allowed:
             warn(f"No files matching pattern '{regex}' found in {zip_path}")
 
-        if len(files_allowed) > 1:
-            print(
-                f"[INFO] Multiple files matching pattern '{regex}' "
-                f"found in {zip_path.name}."
-                f"\nTry to concat those {len(files_allowed)}"
-            )
-
-        # Get encoding
-        encoding = kwargs.get("encoding") if kwargs.get("encoding") else "utf-8"
-
         # Load files
-        list_of_df = []
+        deduplicator, sampler = _get_chunk_filters(deduplicate, sample)
+        aggregator = _get_chunk_aggregator(aggregate, deduplicator, sampler)
+        chunk_sizer = _get_chunk_sizer(max_chunk_bytes)
+        if preview:
+            kwargs.update(nrows=preview, chunksize=preview)
+        list_of_df: list[pd.DataFrame] = []
+        sources: list[str] = []
         for file_name in files_allowed:
-            print(f"=> from ZIP READ: {file_name}")
-            with zip_ref.open(file_name) as file:
-                text_file = TextIOWrapper(file, encoding=encoding)
-                _df = read_csv_in_chunks(filepath_or_buffer=text_file, **kwargs)
+            # binary handle: decoding is left to the parser (native for utf-8)
+            with _open_zip_member(zip_ref, file_name, zip_buffer) as file:
+                file_kwargs = kwargs
+                if sniff:
+                    info = zip_ref.getinfo(file_name)
+                    sniffed = sniff_csv(
+                        file, cache_key=(file_name, info.CRC, info.file_size))
+                    file_kwargs = sniffed.read_csv_kwargs(kwargs)
+                _df = read_csv_in_chunks(
+                    filepath_or_buffer=file,
+                    deduplicate=deduplicator or False,
+                    sample=sampler,
+                    aggregate=aggregator,
+                    max_chunk_bytes=chunk_sizer,
+                    add_row_number=add_row_number,
+                    **file_kwargs)
                 if add_source:
-                    _df["file_source"] = file.name
+                    _add_file_source(
+                        _df, file.name, add_source, len(sources),
+                        len(files_allowed), kwargs.get("dtype_backend"))
                 list_of_df.append(_df)
+                sources.append(file_name)
+                if sampler is not None:
+                    list_of_df = sampler.compact(list_of_df)
 
-        _warn_column_mismatch(list_of_df)
-        df = pd.concat(list_of_df, axis=0, ignore_index=True)
-    return df
+        if aggregator is not None:
+            return aggregator.result()
+        list_of_df = _finalize_chunk_filters(list_of_df, deduplicator, sampler)
+        df = _concat_files(
+            list_of_df, sources, missing_columns, extra_columns, normalize_columns)
+    return _encode_file_source(df, sources, add_source)
 
 
-@timeit
+@_log_duration
 def read_multiple_csv_from_dir(
     dir_path: Path | UPath,
     regex: str = r".*",
     case_sensitive: bool = False,
     allowed_extension: list = [".csv", ".txt", ".dsv", ".gz", ".zip", ".tar", "7z"],
-    add_source: bool = False,
+    add_source: bool | SourceEncoding = False,
+    add_row_number: bool = False,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    normalize_columns: bool | Callable = False,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    aggregate: StreamingAggregator | dict | None = None,
+    max_chunk_bytes: int | str | ChunkSizer | None = None,
+    preview: int | None = None,
+    sniff: bool = False,
+    checkpoint: str | Path | IngestionCheckpoint | None = None,
+    retries: int = 0,
     **kwargs
 ):
     """
@@ -198,8 +914,54 @@ def read_multiple_csv_from_dir(
     case_sensitive : bool, default False
         Allow to enable or disable case sensitive on regex match
     allowed_extension : list, default [".csv", ".txt", ".dsv", ".gz", ".zip", ".tar"]
+    add_source : bool | {'category', 'index'}, default False
+        Add the file each row comes from: True adds a 'file_source' column with
+        the file name, 'category' stores it as a categorical column (a small int
+        per row), 'index' adds a 'file_index' column (int16) whose file names are
+        in df.attrs['file_index'] (see ak.file_source_lookup)
+    add_row_number : bool, default False
+        Add a 'file_row' column with the position of each row in its file (0 based
+        data rows, before any filtering)
+    missing_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files lacking columns of the first file (see ak.concat_dataframes)
+    extra_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files with columns not in the first file (see ak.concat_dataframes)
+    normalize_columns : bool | Callable, default False
+        Normalize column names before concatenation (see ak.concat_dataframes)
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows across all files while reading, before concatenation
+        (see ak.RowDeduplicator to deduplicate on a subset of columns or keep the
+        last occurrence). Rows are compared on 128 bits hashes: the result is
+        probabilistic, with a negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows across all files (see
+        ak.RowSampler): the rows evicted from the sample are dropped after each
+        chunk and file, the memory usage is bounded by about twice the sample size
+    aggregate : ak.StreamingAggregator | dict, default None
+        Group by aggregation computed chunk by chunk across all files (see
+        ak.StreamingAggregator, a dict is passed to it): the aggregates are
+        returned, one row per group, the raw rows are never held in memory
+    max_chunk_bytes : int | str | ak.ChunkSizer, default None
+        Memory budget of a parsed chunk (e.g. "512MB") replacing chunksize, the
+        chunk size learned on a file carries over to the next ones (see
+        ak.ChunkSizer)
+    preview : int, default None
+        Only read the first n rows of each file
+    sniff : bool, default False
+        Detect encoding, delimiter, decimal separator and header row of each file
+        from its first bytes (see ak.sniff_csv), arguments passed explicitly win.
+        Files of mixed dialects are then read in a single call.
+    checkpoint : str | Path | ak.IngestionCheckpoint, default None
+        Local directory where completed files and chunks are saved: a rerun after a
+        failure resumes where the previous run stopped (see ak.IngestionCheckpoint)
+    retries : int, default 0
+        Number of retries, with exponential backoff (retry_backoff argument), on
+        transient errors: the file is reopened after its last completed chunk
     **kwargs
         Pass any argument allowed by pd.read_csv and/or by the custom chunk function
+        (e.g. dtype_backend="pyarrow" to keep the data in Arrow memory) and by
+        ak.read_csv_in_chunks (e.g. progress=ak.LoggingProgress() to report the
+        progress of each file)
     """
     # Lists all files matching regex
     file_matched = list_files_from_dir(
@@ -211,29 +973,61 @@ def read_multiple_csv_from_dir(
         if file.suffix.lower() in allowed_extension
     ]
 
-    list_of_df = []
+    list_of_df: list[pd.DataFrame] = []
+    sources: list[str] = []
     if len(files_allowed) == 0:
         warn(
             f"No file found in {dir_path}: empty pd.DataFrame has been returned")
         return pd.DataFrame
+    deduplicator, sampler = _get_chunk_filters(deduplicate, sample)
+    aggregator = _get_chunk_aggregator(aggregate, deduplicator, sampler)
+    chunk_sizer = _get_chunk_sizer(max_chunk_bytes)
+    checkpoint = _get_checkpoint(checkpoint)
+    if preview:
+        kwargs.update(nrows=preview, chunksize=preview)
     for file in files_allowed:
-        print(f"READ: {file.name}")
-        _df = read_csv_in_chunks(filepath_or_buffer=file, **kwargs)
+        _df = read_csv_in_chunks(
+            filepath_or_buffer=file,
+            deduplicate=deduplicator or False,
+            sample=sampler,
+            aggregate=aggregator,
+            max_chunk_bytes=chunk_sizer,
+            sniff=sniff,
+            checkpoint=checkpoint,
+            retries=retries,
+            add_row_number=add_row_number,
+            **kwargs)
         if add_source:
-            _df["file_source"] = file.name
+            _add_file_source(
+                _df, file.name, add_source, len(sources), len(files_allowed),
+                kwargs.get("dtype_backend"))
         list_of_df.append(_df)
-    _warn_column_mismatch(list_of_df)
-    df = pd.concat(list_of_df, axis=0, ignore_index=True)
-    return df
+        sources.append(file.name)
+        if sampler is not None:
+            list_of_df = sampler.compact(list_of_df)
+    if aggregator is not None:
+        return aggregator.result()
+    list_of_df = _finalize_chunk_filters(list_of_df, deduplicator, sampler)
+    df = _concat_files(
+        list_of_df, sources, missing_columns, extra_columns, normalize_columns)
+    return _encode_file_source(df, sources, add_source)
 
 
-@timeit
+@_log_duration
 def read_multiple_xlsx_from_dir(
     dir_path: Path | UPath,
     regex: str = r".*",
     case_sensitive: bool = False,
     allowed_extension: list = [".xlsx", ".xls", ".xlsm", ".xlsb"],
-    add_source: bool = False,
+    add_source: bool | SourceEncoding = False,
+    add_row_number: bool = False,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    normalize_columns: bool | Callable = False,
+    deduplicate: bool | RowDeduplicator = False,
+    sample: int | RowSampler | None = None,
+    preview: int | None = None,
+    progress: ProgressCallback | None = None,
     **kwargs
 ):
     """
@@ -252,8 +1046,35 @@ def read_multiple_xlsx_from_dir(
     case_sensitive : bool, default False
         Allow to enable or disable case sensitive on regex match
     allowed_extension : list, default [".xlsx", ".xls", ".xlsm", ".xlsb"]
+    add_source : bool | {'category', 'index'}, default False
+        Add the file each row comes from: True adds a 'file_source' column with
+        the file name, 'category' stores it as a categorical column (a small int
+        per row), 'index' adds a 'file_index' column (int16) whose file names are
+        in df.attrs['file_index'] (see ak.file_source_lookup)
+    add_row_number : bool, default False
+        Add a 'file_row' column with the position of each row in its file (0 based
+        data rows, before any filtering)
+    missing_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files lacking columns of the first file (see ak.concat_dataframes)
+    extra_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files with columns not in the first file (see ak.concat_dataframes)
+    normalize_columns : bool | Callable, default False
+        Normalize column names before concatenation (see ak.concat_dataframes)
+    deduplicate : bool | ak.RowDeduplicator, default False
+        Drop duplicated rows across all files while reading, before concatenation
+        (see ak.RowDeduplicator). Rows are compared on 128 bits hashes: the result
+        is probabilistic, with a negligible collision risk
+    sample : int | ak.RowSampler, default None
+        Only keep a uniform random sample of n rows across all files (see
+        ak.RowSampler)
+    preview : int, default None
+        Only read the first n rows of each file
+    progress : Callable, default None
+        Called with an ak.ProgressEvent when each file is opened and read (see
+        ak.LoggingProgress, ak.RichProgress)
     **kwargs
         Pass any argument allowed by pd.read_excel
+        (e.g. dtype_backend="pyarrow" to keep the data in Arrow memory)
     """
     # Lists all files matching regex
     file_matched = list_files_from_dir(
@@ -265,17 +1086,264 @@ def read_multiple_xlsx_from_dir(
         if file.suffix.lower() in allowed_extension
     ]
 
-    list_of_df = []
+    list_of_df: list[pd.DataFrame] = []
+    sources: list[str] = []
     if len(files_allowed) == 0:
         warn(
             f"No file found in {dir_path}: empty pd.DataFrame has been returned")
         return pd.DataFrame
+    deduplicator, sampler = _get_chunk_filters(deduplicate, sample)
+    if preview:
+        kwargs["nrows"] = preview
     for file in files_allowed:
-        print(f"READ: {file.name}")
+        file_progress = _FileProgress(progress, source=file.name)
+        file_progress.start()
         _df = pd.read_excel(io=file, **kwargs)
+        file_progress.chunk(0, len(_df))
+        file_progress.end()
+        for chunk_filter in (deduplicator, sampler):
+            if chunk_filter is not None:
+                _df = chunk_filter.filter(_df)
+        if add_row_number:
+            _df["file_row"] = _df.index.to_numpy(dtype="int64")
         if add_source:
-            _df["file_source"] = file.name
+            _add_file_source(
+                _df, file.name, add_source, len(sources), len(files_allowed),
+                kwargs.get("dtype_backend"))
         list_of_df.append(_df)
-    _warn_column_mismatch(list_of_df)
-    df = pd.concat(list_of_df, axis=0, ignore_index=True)
-    return df
+        sources.append(file.name)
+        if sampler is not None:
+            list_of_df = sampler.compact(list_of_df)
+    list_of_df = _finalize_chunk_filters(list_of_df, deduplicator, sampler)
+    df = _concat_files(
+        list_of_df, sources, missing_columns, extra_columns, normalize_columns)
+    return _encode_file_source(df, sources, add_source)
+
+
+def _parquet_target_schema(
+    schemas: list[pa.Schema],
+    sources: list[str],
+    columns: list | None,
+    missing_columns: ColumnPolicy,
+    extra_columns: ColumnPolicy,
+) -> tuple[pa.Schema, SchemaDriftReport]:
+    """
+    Schema the dataset is read with (all the columns of all the files, with common
+    types: filters may use columns outside of the projection) and drift report of
+    the selected columns, with the column policies of ak.concat_dataframes,
+    computed from the Parquet footers only
+    """
+    report = SchemaDriftReport()
+    target = list(columns) if columns is not None else [
+        name for name in schemas[0].names if not name.startswith("__index_level_")]
+    extra_cols: list = []
+    for source, schema in zip(sources, schemas):
+        missing = [col for col in target if col not in schema.names]
+        extra = [
+            col for col in schema.names
+            if col not in target and not col.startswith("__index_level_")
+        ]
+        if missing:
+            report.missing[source] = missing
+        # a projection ignores the other columns: they are not drift
+        if extra and columns is None:
+            report.extra[source] = extra
+            extra_cols += [col for col in extra if col not in extra_cols]
+    _apply_policy(missing_columns, "missing", report.missing)
+    _apply_policy(extra_columns, "extra", report.extra)
+
+    out_cols = list(target)
+    if missing_columns == "drop":
+        dropped = {col for cols in report.missing.values() for col in cols}
+        out_cols = [col for col in out_cols if col not in dropped]
+    if extra_columns == "fill":
+        out_cols += extra_cols
+
+    # common type of the files, e.g. int32 and int64 -> int64, int64 and string ->
+    # string
+    unified = unify_schemas(schemas)
+    fields = list(unified)
+    for col in out_cols:
+        seen = {
+            source: str(schema.field(col).type)
+            for source, schema in zip(sources, schemas) if col in schema.names
+        }
+        if not seen:  # projected column found in no file
+            fields.append(pa.field(col, pa.null()))
+        if len(set(seen.values())) > 1:
+            report.upcast[col] = seen
+        report.dtypes[col] = unified.field(col).type if seen else pa.null()
+    report.columns = out_cols
+    # pandas metadata of the first file: dtypes (string...) restored by to_pandas
+    return pa.schema(fields, metadata=schemas[0].metadata), report
+
+
+def _iter_parquet_batches(
+    scanner, sources: list[str], positions: dict, add_source: bool | SourceEncoding
+) -> Iterator[pa.RecordBatch]:
+    for tagged in scanner.scan_batches():
+        batch = tagged.record_batch
+        if add_source:
+            source = pa.DictionaryArray.from_arrays(
+                pa.array(np.zeros(batch.num_rows, dtype=np.int16)),
+                pa.array([sources[positions[tagged.fragment.path]]]),
+            )
+            batch = batch.append_column("file_source", source)
+        yield batch
+
+
+@_log_duration
+def read_multiple_parquet_from_dir(
+    dir_path: Path | UPath,
+    regex: str = r".*",
+    case_sensitive: bool = False,
+    allowed_extension: list = [".parquet", ".pq"],
+    columns: list | None = None,
+    filters: ds.Expression | list | None = None,
+    add_source: bool | SourceEncoding = False,
+    missing_columns: ColumnPolicy = "fill",
+    extra_columns: ColumnPolicy = "fill",
+    dtype_backend: DtypeBackend | None = None,
+    use_threads: bool = True,
+    iterator: bool = False,
+    batch_size: int = 2**17,
+) -> pd.DataFrame | Iterator[pa.RecordBatch]:
+    """
+    From a given directory, lists, reads and concatenates into a DataFrame all
+    Parquet files matching the requesting pattern.
+
+    The files are scanned as a single pyarrow dataset: they are read in parallel by
+    multiple threads, only the selected columns are read (projection) and the row
+    groups whose statistics (min / max) can not match filters are skipped without
+    being read. Schema drift between files is handled from the file footers, as by
+    ak.read_multiple_csv_from_dir (df.attrs["schema_drift"]).
+
+    Parameters
+    ----------
+    dir_path : Path | UPath
+        Path of the directory to be scanned
+    regex : str, default r".*"
+        Regex string to select from the directory only the files mathcing the pattern
+        Default behaviour lists all files founded in the directory
+    case_sensitive : bool, default False
+        Allow to enable or disable case sensitive on regex match
+    allowed_extension : list, default [".parquet", ".pq"]
+    columns : list, default None
+        Only read these columns, default all columns of the first file
+    filters : pyarrow Expression | list, default None
+        Rows to keep, as a pyarrow expression (e.g. ds.field("year") >= 2024) or in
+        the pd.read_parquet format (e.g. [("year", ">=", 2024)])
+    add_source : bool | {'category', 'index'}, default False
+        Add the file each row comes from: True adds a 'file_source' column with
+        the file name, 'category' stores it as a categorical column (a small int
+        per row), 'index' adds a 'file_index' column (int16) whose file names are
+        in df.attrs['file_index'] (see ak.file_source_lookup)
+    missing_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files lacking columns of the first file (see ak.concat_dataframes)
+    extra_columns : {'fill', 'drop', 'error'}, default 'fill'
+        Policy for files with columns not in the first file (see ak.concat_dataframes)
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Back-end data type applied to the resultant DataFrame, with "pyarrow" the
+        data stays in Arrow memory (no conversion)
+    use_threads : bool, default True
+        Read and decode the files with multiple threads
+    iterator : bool, default False
+        Return a lazy iterator of pyarrow RecordBatch instead of a DataFrame: the
+        files are read as the batches are consumed (add_source then appends a
+        dictionary encoded 'file_source' column)
+    batch_size : int, default 2**17
+        Maximum rows of a RecordBatch
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df = ak.read_multiple_parquet_from_dir(
+            dir_path,
+            columns=["country", "amount"],
+            filters=[("year", ">=", 2024)],
+            add_source="category",
+        )
+    """
+    file_matched = list_files_from_dir(
+        dir_path=dir_path, regex=regex, case_sensitive=case_sensitive)
+    allowed_extension = [ext.lower() for ext in allowed_extension]
+    files_allowed = [
+        file for file in file_matched
+        if file.suffix.lower() in allowed_extension
+    ]
+    if len(files_allowed) == 0:
+        warn(
+            f"No file found in {dir_path}: empty pd.DataFrame has been returned")
+        return iter([]) if iterator else pd.DataFrame()
+
+    filesystem = None
+    if is_local_path(dir_path):
+        paths = [str(file) for file in files_allowed]
+    else:
+        # the shared filesystem of the storage account (see ak.FileSystemSession)
+        filesystem = get_session().filesystem(dir_path)[0]
+        paths = [get_session().filesystem(file)[1] for file in files_allowed]
+    sources = [file.name for file in files_allowed]
+    parquet_format = ds.ParquetFileFormat(
+        default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+            pre_buffer=filesystem is not None))  # coalesced remote reads
+    dataset = ds.dataset(paths, filesystem=filesystem, format=parquet_format)
+    fragments = list(dataset.get_fragments())
+    positions = {fragment.path: i for i, fragment in enumerate(fragments)}
+    # footers only, fetched in parallel on remote storages
+    schemas = get_session().map(lambda fragment: fragment.physical_schema, fragments)
+    schema, report = _parquet_target_schema(
+        schemas, sources, columns, missing_columns, extra_columns)
+    if report.has_drift:
+        warn(
+            f"[WARNING] Schema drift found in {len(report.missing | report.extra)} "
+            "file(s), see df.attrs['schema_drift']"
+        )
+
+    if isinstance(filters, list):
+        filters = pq.filters_to_expression(filters)
+    dataset = ds.dataset(
+        paths, schema=schema, filesystem=filesystem, format=parquet_format)
+    scanner = dataset.scanner(
+        columns=report.columns,
+        filter=filters,
+        batch_size=batch_size,
+        use_threads=use_threads,
+    )
+    if iterator:
+        return _iter_parquet_batches(scanner, sources, positions, add_source)
+
+    batches, file_indices = [], []
+    for tagged in scanner.scan_batches():
+        batches.append(tagged.record_batch)
+        file_indices.append(
+            np.full(tagged.record_batch.num_rows, positions[tagged.fragment.path]))
+    table = pa.Table.from_batches(batches, schema=scanner.projected_schema)
+    if dtype_backend == "pyarrow":
+        df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    elif dtype_backend == "numpy_nullable":
+        df = table.to_pandas(types_mapper=_arrow_dtype_mapping().get)
+    else:
+        df = table.to_pandas()
+    # a named index stored in the files (df.to_parquet) is restored as a column
+    named = [name for name in df.index.names if name is not None]
+    if named:
+        df = df.reset_index(level=named)
+    df = df.reset_index(drop=True)
+
+    if add_source:
+        file_index = (
+            np.concatenate(file_indices) if file_indices else np.empty(0, dtype=int))
+        index_dtype = "int16" if len(sources) <= np.iinfo(np.int16).max else "int32"
+        if add_source is True:
+            dtype = ARROW_STRING if dtype_backend == "pyarrow" else None
+            df["file_source"] = pd.Series(
+                np.array(sources, dtype=object)[file_index], dtype=dtype)
+        else:
+            df["file_index"] = file_index.astype(index_dtype)
+    df.attrs["schema_drift"] = report.to_dict()
+    return _encode_file_source(df, sources, add_source)
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+class RowSampler:
+    """
+    Uniform random sample of n rows across chunks and files (reservoir sampling).
+
+    The reservoir only holds row ids: each chunk is reduced to its rows entering the
+    reservoir (vectorized Algorithm R), and the rows evicted by later chunks are
+    dropped by compact, called by the readers after each chunk and each file, and
+    by finalize. The readers hold at most about 2 * n rows (the sample of the
+    previous files and of the current one) plus the rows of the current chunk
+    entering the reservoir, whatever the size of the files.
+
+    Parameters
+    ----------
+    n : int
+        Number of rows of the sample (all rows if less are read)
+    random_state : int | np.random.Generator, default None
+        Seed for a reproducible sample
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df = ak.read_multiple_csv_from_dir(dir_path, sep=";", sample=1000)
+    """
+
+    def __init__(self, n: int, random_state: int | np.random.Generator | None = None):
+        if n < 1:
+            raise ValueError(f"Sample size must be positive, got {n}")
+        self.n = n
+        self.n_rows = 0
+        self._rng = np.random.default_rng(random_state)
+        self._reservoir = np.full(n, -1, dtype=np.int64)
+        # ids of the rows returned by filter and still held by the caller
+        self._held: np.ndarray = np.empty(0, dtype=np.int64)
+
+    def __repr__(self) -> str:
+        return f"RowSampler(n={self.n}, n_rows={self.n_rows})"
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Keep the rows of the chunk entering the reservoir
+        """
+        nb_rows = len(df)
+        if nb_rows == 0:
+            return df
+        ids = self.n_rows + np.arange(nb_rows, dtype=np.int64)
+        self.n_rows += nb_rows
+        # row number t (1-based) replaces a random slot with probability n / t
+        slots = self._rng.integers(0, ids + 1)
+        slots = np.where(ids < self.n, ids, slots)
+        candidates = np.flatnonzero(slots < self.n)[::-1]
+        # several rows of the chunk may fall in the same slot: the last one wins
+        _, last = np.unique(slots[candidates], return_index=True)
+        winners = candidates[last]
+        self._reservoir[slots[winners]] = ids[winners]
+        mask = np.zeros(nb_rows, dtype=bool)
+        mask[winners] = True
+        self._held = np.concatenate([self._held, ids[mask]])
+        return df[mask]
+
+    def compact(self, list_of_df: list[pd.DataFrame]) -> list[pd.DataFrame]:
+        """
+        Drop the rows evicted from the reservoir so far. list_of_df holds the last
+        filtered chunks (or their concatenation per file), in reading order.
+        """
+        nb_rows = sum(len(df) for df in list_of_df)
+        if nb_rows > len(self._held):
+            raise ValueError("compact expects DataFrames returned by filter")
+        start = len(self._held) - nb_rows
+        keep_mask = np.isin(self._held[start:], self._reservoir)
+        if keep_mask.all():
+            return list_of_df
+        self._held = np.concatenate(
+            [self._held[:start], self._held[start:][keep_mask]])
+        result, position = [], 0
+        for df in list_of_df:
+            mask = keep_mask[position: position + len(df)]
+            position += len(df)
+            result.append(df if mask.all() else df[mask])
+        return result
+
+    def finalize(self, list_of_df: list[pd.DataFrame]) -> list[pd.DataFrame]:
+        """
+        Drop the rows evicted from the reservoir by later chunks. list_of_df holds
+        all the filtered chunks (or their concatenation per file), in reading order.
+        """
+        if not len(self._held):
+            return list_of_df
+        if len(self._held) != sum(len(df) for df in list_of_df):
+            raise ValueError("finalize expects all the DataFrames returned by filter")
+        result = self.compact(list_of_df)
+        self._held = np.empty(0, dtype=np.int64)
+        return result
+
+
+def _get_sampler(sample: int | RowSampler | None) -> RowSampler | None:
+    if sample is None or isinstance(sample, RowSampler):
+        return sample
+    return RowSampler(sample)
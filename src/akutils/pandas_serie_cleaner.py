@@ -1,21 +1,75 @@
+import numpy as np
 import pandas as pd
+from dataclasses import dataclass, field
 from pandas.api.types import (
     is_string_dtype,
     is_object_dtype,
     is_float_dtype,
     is_integer_dtype,
-    is_datetime64_dtype
+    is_datetime64_dtype,
+    is_extension_array_dtype
 )
-from typing import Optional
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
+from typing import Literal, Optional
+from pandas._typing import ArrayLike
 from akutils.os import warn
+from akutils.pandas_profile import (
+    get_column_profile,
+    invalidate_profile,
+    profile_df
+)
+from akutils.pandas_arrow import (
+    DtypeBackend,
+    use_arrow,
+    to_arrow,
+    to_arrow_str,
+    to_arrow_string,
+    from_arrow
+)
+
+DateEngine = Literal["object", "date32", "normalize"]
 
 # https://pandas.pydata.org/pandas-docs/stable/user_guide/indexing.html#returning-a-view-versus-a-copy
 pd.options.mode.copy_on_write = True
 
 
+# Vectorized kernels of the string cleaners (Arrow compute or pandas .str), chained
+# on a single serie by the fused stages of ak.CleaningPipeline
+def _capitalise_serie(serie: pd.Series, arrow: bool) -> pd.Series:
+    if arrow:
+        return from_arrow(pc.utf8_upper(to_arrow_str(serie)), like=serie)
+    return serie.astype(str).fillna("").str.upper()
+
+
+def _remove_accent_serie(serie: pd.Series, arrow: bool) -> pd.Series:
+    if arrow:
+        array = pc.utf8_normalize(to_arrow_str(serie), "NFKD")
+        array = pc.replace_substring_regex(array, r"[^\x00-\x7F]", "")
+        return from_arrow(array, like=serie)
+    return (
+        serie
+        .astype(str)
+        .fillna("")
+        .str.normalize('NFKD')
+        .str.encode('ascii', errors='ignore')
+        .str.decode('utf-8')
+    )
+
+
+def _strip_serie(serie: pd.Series, arrow: bool) -> pd.Series:
+    """
+    Missing values are kept, other non string values become NaN
+    """
+    if arrow:
+        return from_arrow(pc.utf8_trim_whitespace(to_arrow_string(serie)), like=serie)
+    return serie.where(serie.isna(), serie.str.strip())
+
+
 def capitalise_cols(
     df: pd.DataFrame,
-    cols: list
+    cols: list,
+    dtype_backend: DtypeBackend | None = None
 ) -> pd.DataFrame:
     """
     Converts selected DataFrame columns to uppercase.
@@ -26,23 +80,22 @@ def capitalise_cols(
         DataFrame to be modified
     cols : list
         List of column names to be capitalized
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Use "pyarrow" to run on Arrow compute kernels, Arrow backed columns always do
     """
     for col in cols:
         if col not in df.columns:
             warn(f"column not found in DataFrame: {col}")
             continue
-        df[col] = (
-            df[col]
-            .astype(str)
-            .fillna("")
-            .str.upper()
-        )
+        df[col] = _capitalise_serie(df[col], use_arrow(df[col], dtype_backend))
+    invalidate_profile(df, cols)
     return df
 
 
 def remove_accent_from_cols(
     df: pd.DataFrame,
-    cols: list
+    cols: list,
+    dtype_backend: DtypeBackend | None = None
 ) -> pd.DataFrame:
     """
     Remove accents and special characters from selected DataFrame columns
@@ -56,25 +109,28 @@ def remove_accent_from_cols(
         DataFrame to be modified
     cols : list
         List of column names for which special accents and brackets should be removed
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Use "pyarrow" to run on Arrow compute kernels, Arrow backed columns always do
     """
     for col in cols:
         if col not in df.columns:
             warn(f"column not found in DataFrame: {col}")
             continue
-        df[col] = (
-            df[col]
-            .astype(str)
-            .fillna("")
-            .str.normalize('NFKD')
-            .str.encode('ascii', errors='ignore')
-            .str.decode('utf-8')
-        )
+        arrow = use_arrow(df[col], dtype_backend)
+        profile = None if arrow else get_column_profile(df, col)
+        if profile is not None and profile.is_ascii and profile.shape == "string":
+            # pure ASCII strings: normalize/encode/decode would be a no-op
+            df[col] = df[col].astype(str).fillna("")
+            continue
+        df[col] = _remove_accent_serie(df[col], arrow)
+    invalidate_profile(df, cols)
     return df
 
 
 def strip_columns(
     df: pd.DataFrame,
-    cols: Optional[list] = None
+    cols: Optional[list] = None,
+    dtype_backend: DtypeBackend | None = None
 ) -> pd.DataFrame:
     """
     Strip selected DataFrame columns.
@@ -85,6 +141,8 @@ def strip_columns(
         DataFrame to be modified
     cols : list, default None
         List of column names to be striped
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Use "pyarrow" to run on Arrow compute kernels, Arrow backed columns always do
     """
     cols = list(df.columns) if not cols else cols
     for column in cols:
@@ -93,8 +151,8 @@ def strip_columns(
             continue
         if (not is_string_dtype(df[column])) & (not is_object_dtype(df[column])):
             continue
-        mask_empty = (~df[column].isna())
-        df.loc[mask_empty, column] = df.loc[mask_empty, column].str.strip()
+        df[column] = _strip_serie(df[column], use_arrow(df[column], dtype_backend))
+    invalidate_profile(df, cols)
     return df
 
 
@@ -102,39 +160,254 @@ def fillna_numerical_columns(
     df: pd.DataFrame,
     filler: int = 0
 ) -> pd.DataFrame:
+    """
+    Fill the missing values of numerical columns, dtypes are kept.
+
+    Only the columns holding missing values are replaced, one at a time: complete
+    columns are not copied, and the extra memory is bounded by one column instead of
+    a copy of all the numerical columns.
+    """
+    # numpy integer columns can not hold missing values
     numerical_cols = [
-        col for col in df
-        if (is_float_dtype(df[col]) | is_integer_dtype(df[col]))
+        col for col, dtype in df.dtypes.items()
+        if (
+            is_float_dtype(dtype)
+            | (is_integer_dtype(dtype) & is_extension_array_dtype(dtype))
+        )
     ]
-    df[numerical_cols] = df[numerical_cols].fillna(filler)
+    filled_cols = []
+    for col in numerical_cols:
+        serie = df[col]
+        if not serie.hasnans:
+            continue
+        # Arrow and nullable columns stay in their own memory (fill_null)
+        df[col] = serie.fillna(filler)
+        filled_cols.append(col)
+    invalidate_profile(df, filled_cols)
     return df
 
 
 def remove_empty_cols_from_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove columns containing only missing values or only empty strings.
+
+    Each column is scanned block by block until it is known to be non-empty (a
+    cached profile is not trusted: it is not cached on df either).
+    """
+    profile = profile_df(df, emptiness_only=True, cache=False)
     filled_cols = [
         col for col in df.columns
-        if (
-            (~(df[col].isna().all()))
-            & (~((df[col] == "").all()))
-        )
+        if not profile.columns[col].is_empty
     ]
     return df[filled_cols]
 
 
-def convert_datetimes_to_date(df: pd.DataFrame) -> pd.DataFrame:
+def convert_datetimes_to_date(
+    df: pd.DataFrame,
+    engine: DateEngine = "object"
+) -> pd.DataFrame:
+    """
+    Truncate the datetime columns to dates.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to be converted
+    engine : {'object', 'date32', 'normalize'}, default 'object'
+        'object': numpy datetime columns become datetime.date objects (one Python
+        object per row, no vectorized operation afterwards), Arrow timestamps
+        become date32.
+        'date32': all datetime columns become date32[pyarrow] (4 bytes per row).
+        'normalize': times are set to midnight, dtypes are kept (datetime64 or
+        Arrow timestamp).
+    """
+    if engine not in ("object", "date32", "normalize"):
+        raise ValueError(f"Unknown engine: {engine}")
     cols_datetime = [
-        col for col in df
-        if is_datetime64_dtype(df[col])
+        col for col, dtype in df.dtypes.items()
+        if is_datetime64_dtype(dtype)
     ]
     for col in cols_datetime:
-        df[col] = df[col].dt.date
+        if engine == "object":
+            df[col] = df[col].dt.date
+        elif engine == "normalize":
+            df[col] = df[col].dt.normalize()
+        else:
+            array = to_arrow(df[col]).cast(pa.date32(), safe=False)
+            df[col] = from_arrow(array, like=df[col])
+    # Arrow timestamps are truncated without leaving Arrow memory
+    cols_arrow_timestamp = [
+        col for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype)
+        and pa.types.is_timestamp(dtype.pyarrow_dtype)
+    ]
+    for col in cols_arrow_timestamp:
+        array = to_arrow(df[col])
+        if engine == "normalize":
+            array = pc.floor_temporal(array, unit="day")
+        else:
+            array = array.cast(pa.date32(), safe=False)
+        df[col] = from_arrow(array, like=df[col])
+    invalidate_profile(df, cols_datetime + cols_arrow_timestamp)
     return df
 
 
+class MapperIndex:
+    """
+    Hash index of a mapper, built once and reusable across calls and chunks.
+
+    Values are mapped through their factorized codes: only the unique values of a
+    column are looked up in the hash table, then the result is a vectorized take.
+
+    Parameters
+    ----------
+    mapper : dict | pd.Series
+        {value: mapped value} dictionary, or pd.Series indexed by value
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        country_index = ak.MapperIndex({"FR": "France", "DE": "Germany"})
+        df = ak.read_csv_in_chunks(
+            file_path,
+            chunk_func=ak.map_cols_and_insert_next,
+            chunk_func_kwarg={"mappers": {"country_code": country_index}},
+        )
+    """
+
+    index: pd.Index
+    values: np.ndarray
+
+    def __init__(self, mapper: "dict | pd.Series | MapperIndex"):
+        if isinstance(mapper, MapperIndex):
+            mapper = pd.Series(mapper.values, index=mapper.index)
+        serie = pd.Series(mapper) if isinstance(mapper, dict) else mapper
+        if not serie.index.is_unique:
+            raise ValueError("MapperIndex keys must be unique")
+        self.index = pd.Index(serie.index)
+        self.values = serie.to_numpy()
+        # keys mapped to a missing value are unknown, as with serie.map(dict)
+        # (last item: position -1 of the keys not found)
+        self._missing = np.append(np.asarray(pd.isna(self.values), dtype=bool), False)
+        self.index.get_indexer(self.index[:1])  # build the hash table once
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def map(
+        self,
+        serie: pd.Series,
+        default_value=np.nan
+    ) -> tuple[ArrayLike, int, np.ndarray]:
+        """
+        Map a serie, returns the mapped values, the number of rows without mapping
+        and the distinct values without mapping
+        """
+        codes, uniques = pd.factorize(serie, use_na_sentinel=True)
+        positions = self.index.get_indexer(uniques)
+        positions[self._missing[positions]] = -1
+        indexer = np.where(codes >= 0, positions[codes], -1)
+        new_values = pd.api.extensions.take(
+            self.values, indexer, allow_fill=True, fill_value=default_value)
+        unknown_values = np.asarray(uniques)[positions == -1]
+        if (codes == -1).any():
+            unknown_values = np.append(unknown_values, np.nan)
+        return new_values, int((indexer == -1).sum()), unknown_values
+
+
+@dataclass
+class MappingReport:
+    """
+    Unknown values found by ak.map_cols_and_insert_next.
+
+    Attributes
+    ----------
+    nb_unknown : dict
+        For each mapped column, the number of rows without mapping
+    unknown_values : dict
+        For each mapped column, the distinct values without mapping
+    """
+    nb_unknown: dict = field(default_factory=dict)
+    unknown_values: dict = field(default_factory=dict)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({
+            "nb_unknown": pd.Series(self.nb_unknown, dtype="int64"),
+            "unknown_values": pd.Series(self.unknown_values, dtype=object),
+        })
+
+
+def map_cols_and_insert_next(
+    df: pd.DataFrame,
+    mappers: dict,
+    suffixe: str = "_lib",
+    default_value: str = "unknown",
+    return_report: bool = False,
+) -> pd.DataFrame | tuple[pd.DataFrame, MappingReport]:
+    """
+    Maps several columns, each with its own mapper, and inserts each mapped column
+    next to its source in a single block operation.
+
+    Each mapper is indexed once (see ak.MapperIndex): a dict shared by several
+    columns is indexed only once, and a MapperIndex can be reused across calls and
+    chunks (e.g. as read_csv_in_chunks chunk_func).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to be modified
+    mappers : dict
+        {column name: mapper}, a mapper being a dict, a pd.Series or a MapperIndex
+    suffixe : str, default "_lib"
+        Suffixe of the mapped columns. Existing mapped columns are replaced
+    default_value : str, default "unknown"
+        Value of the rows without mapping
+    return_report : bool, default False
+        Also return the MappingReport with unknown values statistics
+    """
+    report = MappingReport()
+    indexes: dict[int, MapperIndex] = {}
+    new_cols = {}
+    for col_to_map, mapper in mappers.items():
+        if col_to_map not in df.columns:
+            raise KeyError(f"Column '{col_to_map}' not found in the DataFrame.")
+        if not isinstance(df.columns.get_loc(col_to_map), int):
+            raise ValueError(f"Column '{col_to_map}' is not unique in the DataFrame.")
+        if not isinstance(mapper, MapperIndex):
+            if id(mapper) not in indexes:
+                indexes[id(mapper)] = MapperIndex(mapper)
+            mapper = indexes[id(mapper)]
+        new_values, nb_unknown, unknown_values = mapper.map(
+            df[col_to_map], default_value)
+        new_cols[f"{col_to_map}{suffixe}"] = new_values
+        if nb_unknown:
+            report.nb_unknown[col_to_map] = nb_unknown
+            report.unknown_values[col_to_map] = list(unknown_values)
+
+    if report.nb_unknown:
+        warn(f"[WARNING] Unknown values: {report.nb_unknown}")
+
+    # Insert all the mapped columns at once, each one next to its source column
+    kept_cols = [col for col in df.columns if col not in new_cols]
+    order = []
+    for col in kept_cols:
+        order.append(col)
+        if col in mappers:
+            order.append(f"{col}{suffixe}")
+    df = pd.concat(
+        [df[kept_cols], pd.DataFrame(new_cols, index=df.index, copy=False)], axis=1
+    )[order]
+    return (df, report) if return_report else df
+
+
 def map_col_and_insert_next(
     df: pd.DataFrame,
     col_to_map: str,
-    mapper: dict,
+    mapper: dict | MapperIndex,
     suffixe: str = "_lib",
     default_value: str = "unknown",
     value_location: str | None = None,
@@ -142,6 +415,8 @@ def map_col_and_insert_next(
     """
     Maps a column using a dictionary, inserts it next to the source,
     and warns about missing mappings.
+
+    See ak.map_cols_and_insert_next to map several columns at once.
     """
     if col_to_map not in df.columns:
         raise KeyError(f"Column '{col_to_map}' not found in the DataFrame.")
@@ -149,11 +424,10 @@ def map_col_and_insert_next(
     value_location = col_to_map if value_location is None else value_location
     mapped_col = f"{col_to_map}{suffixe}"
 
-    new_values = df[col_to_map].map(mapper)
-
-    nb_inconnu = new_values.isna().sum()
+    if not isinstance(mapper, MapperIndex):
+        mapper = MapperIndex(mapper)
+    new_values, nb_inconnu, _ = mapper.map(df[col_to_map], default_value)
     if nb_inconnu > 0:
-        new_values = new_values.fillna(default_value)
         warn(f"[WARNING] Unknown values in {value_location}: {nb_inconnu}")
 
     if mapped_col in df.columns:
@@ -163,5 +437,9 @@ def map_col_and_insert_next(
     if not isinstance(idx, int):
         raise ValueError(f"Column '{col_to_map}' is not unique in the DataFrame.")
 
-    df.insert(loc=idx + 1, column=mapped_col, value=new_values)
+    df.insert(
+        loc=idx + 1,
+        column=mapped_col,
+        value=pd.Series(new_values, index=df.index, copy=False)
+    )
     return df
@@ -0,0 +1,231 @@
+import codecs
+import re
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from upath import UPath
+
+from akutils.fs_session import get_session
+from akutils.os import file_fingerprint
+
+SNIFF_NBYTES = 2**16
+SNIFF_DELIMITERS = (";", ",", "\t", "|")
+SNIFF_CACHE_SIZE = 1024
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_QUOTED = re.compile(r'"[^"]*"')
+_NUMBER = re.compile(r"^\s*[+-]?(\d+([.,]\d*)?|[.,]\d+)\s*$")
+_COMMA_DECIMAL = re.compile(r"^\s*[+-]?\d+,\d+\s*$")
+_DOT_DECIMAL = re.compile(r"^\s*[+-]?\d+\.\d+\s*$")
+
+# {source key: SniffResult}, the key includes size and modification time (or CRC),
+# least recently used entries are dropped past SNIFF_CACHE_SIZE
+_SNIFF_CACHE: OrderedDict = OrderedDict()
+
+
+@dataclass
+class SniffResult:
+    """
+    CSV dialect detected from the first bytes of a file
+
+    Attributes
+    ----------
+    encoding : str
+        'utf-8', 'utf-8-sig' / 'utf-16' / 'utf-32' (BOM found), else 'cp1252' or
+        'latin-1'
+    bom : bool
+        The file starts with a byte order mark
+    sep : str | None
+        Delimiter, None if no delimiter was found (single column)
+    decimal : str
+        Decimal separator of the numeric fields
+    skiprows : int
+        Number of preamble lines before the header row
+    has_header : bool
+        The first row is a header (False when all its fields are numbers)
+    trailing_sep : bool
+        The data lines end with the delimiter (one field more than the header),
+        read with index_col=False
+    """
+    encoding: str = "utf-8"
+    bom: bool = False
+    sep: str | None = None
+    decimal: str = "."
+    skiprows: int = 0
+    has_header: bool = True
+    trailing_sep: bool = False
+
+    def read_csv_kwargs(self, explicit: dict | None = None) -> dict:
+        """
+        pd.read_csv arguments of the detected dialect, merged with the explicit
+        arguments (they win, the delimiter is not used when sep or delimiter is given)
+        """
+        explicit = {} if explicit is None else explicit
+        kwargs: dict = {"encoding": self.encoding, "decimal": self.decimal}
+        if self.sep is not None and not {"sep", "delimiter"} & set(explicit):
+            kwargs["sep"] = self.sep
+        if self.skiprows:
+            kwargs["skiprows"] = self.skiprows
+        if not self.has_header:
+            kwargs["header"] = None
+        if self.trailing_sep:
+            kwargs["index_col"] = False  # the empty last field is not an index
+        return {**kwargs, **explicit}
+
+
+def _detect_encoding(prefix: bytes) -> tuple[str, bool]:
+    for bom, encoding in _BOMS:
+        if prefix.startswith(bom):
+            return encoding, True
+    for encoding in ("utf-8", "cp1252"):
+        try:
+            # final=False: the prefix may end in the middle of a character
+            codecs.getincrementaldecoder(encoding)().decode(prefix, final=False)
+            return encoding, False
+        except UnicodeDecodeError:
+            continue
+    return "latin-1", False
+
+
+def _detect_delimiter(lines: list[str]) -> tuple[str | None, list[int]]:
+    """
+    Delimiter found the same number of times on most lines (quoted fields ignored),
+    with the number of occurences per line
+    """
+    best, best_score, best_counts = None, (0., 0), [0] * len(lines)
+    unquoted = [_QUOTED.sub("", line) for line in lines]
+    for delimiter in SNIFF_DELIMITERS:
+        counts = [line.count(delimiter) for line in unquoted]
+        mode, nb_lines = Counter(counts).most_common(1)[0]
+        if mode == 0:
+            continue
+        score = (nb_lines / len(lines), mode)
+        if score > best_score:
+            best, best_score, best_counts = delimiter, score, counts
+    return best, best_counts
+
+
+def sniff_bytes(prefix: bytes, complete: bool = False) -> SniffResult:
+    """
+    Detect the CSV dialect of a file from its first bytes
+
+    Parameters
+    ----------
+    prefix : bytes
+        First bytes of the file
+    complete : bool, default False
+        The prefix is the whole file (its last line is not truncated)
+    """
+    encoding, bom = _detect_encoding(prefix)
+    text = prefix.decode(encoding, errors="replace")
+    lines = text.splitlines()
+    if not complete and len(lines) > 1:
+        lines = lines[:-1]  # truncated line
+    lines = [line for line in lines if line.strip()][:100]
+    result = SniffResult(encoding=encoding, bom=bom)
+    if not lines:
+        return result
+
+    sep, counts = _detect_delimiter(lines)
+    result.sep = sep
+    if sep is None:
+        return result
+    mode = Counter(counts).most_common(1)[0][0]
+    # preamble: lines that can not be a header, i.e. with less fields than the data
+    # lines minus one (a header has one field less when the data lines end with the
+    # delimiter)
+    result.skiprows = next(
+        i for i, count in enumerate(counts) if count >= max(mode - 1, 1))
+    rows = [line.split(sep) for line in lines[result.skiprows:]]
+    result.has_header = not all(_NUMBER.match(field) for field in rows[0])
+    data_lines = lines[result.skiprows + result.has_header:]
+    result.trailing_sep = (
+        result.has_header
+        and counts[result.skiprows] == mode - 1
+        and 2 * sum(line.rstrip().endswith(sep) for line in data_lines)
+        > len(data_lines)
+    )
+
+    fields = [field for row in rows[1:] for field in row]
+    nb_comma = sum(bool(_COMMA_DECIMAL.match(field)) for field in fields)
+    nb_dot = sum(bool(_DOT_DECIMAL.match(field)) for field in fields)
+    if sep != "," and nb_comma > nb_dot:
+        result.decimal = ","
+    return result
+
+
+def _source_key(source) -> tuple | None:
+    """
+    Cache key of a file: path, size and modification time
+    """
+    try:
+        return file_fingerprint(source)
+    except Exception:
+        return None
+
+
+def sniff_csv(
+    source: str | Path | UPath | IO[bytes],
+    nbytes: int = SNIFF_NBYTES,
+    cache_key: tuple | None = None,
+) -> SniffResult:
+    """
+    Detect encoding, BOM, delimiter, decimal separator and header row of a delimited
+    file from its first nbytes only.
+
+    Results of files are cached (the key includes size and modification time, the
+    last SNIFF_CACHE_SIZE files are kept), so the files of a directory read several
+    times are only sniffed once. The cache is per file, not per directory: the
+    files of a directory may have different dialects (e.g. exports of several
+    tools), each one is sniffed on its first read.
+
+    Parameters
+    ----------
+    source : str | Path | UPath | binary file-like object
+        File to be sniffed. A file-like object must be seekable, it is rewound
+        after reading the prefix.
+    nbytes : int, default 65536
+        Size of the prefix to be inspected
+    cache_key : tuple, default None
+        Cache key of a file-like object (e.g. zip member name and CRC), file-like
+        objects are not cached without it
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        ak.sniff_csv(file_path)
+        # SniffResult(encoding='cp1252', bom=False, sep=';', decimal=',', ...)
+    """
+    if isinstance(source, (str, Path)):
+        source = UPath(source) if isinstance(source, str) else source
+        cache_key = _source_key(source)
+    if cache_key is not None and cache_key in _SNIFF_CACHE:
+        _SNIFF_CACHE.move_to_end(cache_key)
+        return _SNIFF_CACHE[cache_key]
+
+    if isinstance(source, Path):
+        with get_session().open(source, "rb") as f:
+            prefix = f.read(nbytes + 1)
+    else:
+        position = source.tell()
+        prefix = source.read(nbytes + 1)
+        source.seek(position)
+    result = sniff_bytes(prefix[:nbytes], complete=len(prefix) <= nbytes)
+
+    if cache_key is not None:
+        _SNIFF_CACHE[cache_key] = result
+        while len(_SNIFF_CACHE) > SNIFF_CACHE_SIZE:
+            _SNIFF_CACHE.popitem(last=False)
+    return result
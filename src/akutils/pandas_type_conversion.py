@@ -1,87 +1,487 @@
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
+import pyarrow as pa  # type: ignore
+import pyarrow.compute as pc  # type: ignore
+from pandas.api.types import is_datetime64_any_dtype
 
 from akutils.os import warn
+from akutils.pandas_parallel import RowBlockExecutor
+from akutils.pandas_profile import get_column_profile, invalidate_profile
+from akutils.pandas_arrow import (
+    DtypeBackend,
+    use_arrow,
+    to_arrow,
+    to_arrow_string,
+    from_arrow
+)
 
 # https://pandas.pydata.org/pandas-docs/stable/user_guide/indexing.html#returning-a-view-versus-a-copy
 pd.options.mode.copy_on_write = True
 
+# Formats tried by columns_to_date(date_format="auto"), in order of preference
+# when several formats parse the same values ("/" separators are normalized to "-")
+EXCEL_FORMAT = "excel"
+AUTO_DATE_FORMATS = [
+    "%Y-%m-%d", "%d-%m-%Y", "%m-%d-%Y", "%Y%m%d", "%d-%m-%y", EXCEL_FORMAT]
+# Day/month orders of AUTO_DATE_FORMATS: a single order is used per column
+_DAY_FIRST_FORMATS: tuple[str, ...] = ("%d-%m-%Y", "%d-%m-%y")
+_MONTH_FIRST_FORMATS: tuple[str, ...] = ("%m-%d-%Y",)
+# rest of a value after the date allowed by the formats of a list or "auto"
+_TIME_PART = r"[ T]"
+# Excel serial numbers: days since 1899-12-30, up to 9999-12-31
+EXCEL_ORIGIN = "1899-12-30"
+EXCEL_MAX_SERIAL = 2958466
+
+# pd.to_numeric like pattern, used to coerce invalid strings to null with Arrow
+_NUMERIC_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+# distinct values converted once when the profile shows at most this share of rows
+_DISTINCT_RATIO = 0.5
+
+
+def _numeric_fast_path(df: pd.DataFrame, column, dtype) -> np.ndarray | None:
+    """
+    Skip the string round trip when the column already is a numpy number
+    """
+    serie = df[column]
+    if serie.dtype.kind in "iuf":
+        return serie.fillna(0).to_numpy(dtype=dtype)
+    return None
+
+
+def _profiled_shortcut(df: pd.DataFrame, column) -> str | None:
+    """
+    Shortcut of the string round trip picked from the cached profile of the column
+    (see ak.profile_df): "null" when it only contains missing values (checked on the
+    data), "distinct" when few values are distinct (converted once, then mapped back
+    to the rows). An outdated profile only changes the speed, not the result.
+    """
+    profile = get_column_profile(df, column)
+    if profile is None:
+        return None
+    if profile.all_null and df[column].isna().all():
+        return "null"
+    if (
+        profile.cardinality is not None
+        and profile.cardinality <= _DISTINCT_RATIO * profile.n_rows
+    ):
+        return "distinct"
+    return None
+
+
+def _convert_distinct(serie: pd.Series, func, **kwargs) -> np.ndarray:
+    """
+    func(str Series, **kwargs) applied to the distinct values of the serie only
+    """
+    codes, uniques = pd.factorize(serie, use_na_sentinel=False)
+    strings = pd.Series(np.asarray(uniques, dtype=object).astype(str))
+    return np.asarray(func(strings, **kwargs))[codes]
+
+
+def _clean_numeric_strings(array: pa.ChunkedArray) -> pa.ChunkedArray:
+    for pattern, replacement in (("\u00a0", ""), (" ", ""), (",", "."), ("%", "")):
+        array = pc.replace_substring(array, pattern, replacement)
+    return array
+
+
+def _arrow_to_float(serie: pd.Series, percent: bool = True) -> pd.Series:
+    array = to_arrow(serie)
+    if pa.types.is_integer(array.type) or pa.types.is_floating(array.type):
+        return from_arrow(pc.fill_null(array.cast(pa.float64()), 0.), like=serie)
+    array = to_arrow_string(serie)
+    had_percent_sign = pc.fill_null(pc.match_substring(array, "%"), False)
+    array = _clean_numeric_strings(array)
+    is_numeric = pc.match_substring_regex(array, _NUMERIC_PATTERN)
+    array = pc.if_else(is_numeric, array, None).cast(pa.float64())
+    array = pc.fill_null(array, 0.)
+    if percent:
+        array = pc.if_else(had_percent_sign, pc.divide(array, 100.), array)
+    return from_arrow(array, like=serie)
+
+
+def _arrow_to_date(serie: pd.Series, date_format: str, date_len: int) -> pd.Series:
+    array = to_arrow(serie)
+    if pa.types.is_timestamp(array.type):
+        return from_arrow(array, like=serie)
+    array = to_arrow_string(serie)
+    array = pc.utf8_slice_codeunits(pc.replace_substring(array, "/", "-"), 0, date_len)
+    array = pc.strptime(array, format=date_format, unit="ns", error_is_null=True)
+    return from_arrow(array, like=serie)
+
+
+def _strings_to_number(strings: pd.Series, dtype, percent: bool = True) -> np.ndarray:
+    had_percent_sign = strings.str.contains("%")
+    strings = (
+        strings
+        .str.replace(" ", "")  # nbsp (%A0). Needed for some CSV files
+        .str.replace(" ", "")  # normal space (%20)
+        .str.replace(",", ".")
+        .str.replace("%", "")
+    )
+    values = pd.to_numeric(strings, errors="coerce").fillna(0).values.astype(dtype)
+    if percent:
+        values[had_percent_sign.to_numpy(dtype=bool)] /= 100
+    return values
+
+
+def _strings_to_date(strings: pd.Series, date_format: str, date_len: int) -> np.ndarray:
+    strings = strings.str.replace("/", "-").str[: date_len]
+    return pd.to_datetime(strings, format=date_format, errors="coerce").to_numpy()
+
 
 def columns_to_float(
     df: pd.DataFrame,
     col_list: list,
-    keep_source: bool = False
+    keep_source: bool = False,
+    dtype_backend: DtypeBackend | None = None,
+    n_jobs: int = 1
 ) -> pd.DataFrame:
+    """
+    Convert string columns to float: spaces removed, comma as decimal separator,
+    values with a '%' sign divided by 100, invalid values set to 0.
+
+    With a cached profile (see ak.profile_df), all-null columns and columns with few
+    distinct values skip the string round trip of every row.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to be converted
+    col_list : list
+        Columns to be converted
+    keep_source : bool, default False
+        Keep the source columns and add the converted ones with a '_flt' suffix
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Convert with Arrow compute kernels ('pyarrow', default for Arrow columns)
+    n_jobs : int, default 1
+        Number of worker processes converting row blocks of huge frames in
+        parallel (-1: all CPUs), see akutils.pandas_parallel.RowBlockExecutor
+    """
     suffixe = "_flt" if keep_source else ""
-    for column in col_list:
-        if column not in df.columns:
-            warn(f"column not found in DataFrame: {column}")
-            continue
-        new_col = f"{column}{suffixe}"
-        df[new_col] = df[column].values.astype(str)
-        had_percent_sign = df[new_col].str.contains("%")
-        df[new_col] = (
-            df[new_col]
-            .str.replace(" ", "")  # nbsp (%A0). Needed for some CSV files
-            .str.replace(" ", "")  # normal space (%20)
-            .str.replace(",", ".")
-            .str.replace("%", "")
-        )
-        df[new_col] = pd.to_numeric(df[new_col], errors="coerce")
-        df[new_col] = df[new_col].fillna(0)
-        df[new_col] = df[new_col].values.astype(float)
-        df.loc[had_percent_sign, new_col] = df.loc[had_percent_sign, new_col] / 100
+    with RowBlockExecutor(n_jobs) as executor:
+        for column in col_list:
+            if column not in df.columns:
+                warn(f"column not found in DataFrame: {column}")
+                continue
+            new_col = f"{column}{suffixe}"
+            if use_arrow(df[column], dtype_backend):
+                df[new_col] = _arrow_to_float(df[column])
+                continue
+            values = _numeric_fast_path(df, column, float)
+            shortcut = _profiled_shortcut(df, column) if values is None else None
+            if shortcut == "null":
+                values = np.zeros(len(df), dtype=float)
+            elif shortcut == "distinct":
+                values = _convert_distinct(df[column], _strings_to_number, dtype=float)
+            if values is not None:
+                df[new_col] = values
+                continue
+            df[new_col] = executor.map(
+                _strings_to_number, df[column].values.astype(str), dtype=float)
+    invalidate_profile(df, [f"{column}{suffixe}" for column in col_list])
     return df
 
 
 def columns_to_int(
     df: pd.DataFrame,
     col_list: list,
-    keep_source: bool = False
+    keep_source: bool = False,
+    dtype_backend: DtypeBackend | None = None,
+    n_jobs: int = 1
 ) -> pd.DataFrame:
+    """
+    Convert string columns to int: spaces removed, comma as decimal separator
+    (decimals truncated), invalid values set to 0.
+
+    With a cached profile (see ak.profile_df), all-null columns and columns with few
+    distinct values skip the string round trip of every row.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to be converted
+    col_list : list
+        Columns to be converted
+    keep_source : bool, default False
+        Keep the source columns and add the converted ones with an '_int' suffix
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Convert with Arrow compute kernels ('pyarrow', default for Arrow columns)
+    n_jobs : int, default 1
+        Number of worker processes converting row blocks of huge frames in
+        parallel (-1: all CPUs), see akutils.pandas_parallel.RowBlockExecutor
+    """
     suffixe = "_int" if keep_source else ""
-    for column in col_list:
-        if column not in df.columns:
-            warn(f"column not found in DataFrame: {column}")
-            continue
-        new_col = f"{column}{suffixe}"
-        df[new_col] = df[column].values.astype(str)
-        df[new_col] = (
-            df[new_col]
-            .str.replace(" ", "")  # nbsp (%A0). Needed for some CSV files
-            .str.replace(" ", "")  # normal space (%20)
-            .str.replace(",", ".")
-            .str.replace("%", "")
-        )
-        df[new_col] = pd.to_numeric(df[new_col], errors="coerce")
-        df[new_col] = df[new_col].fillna(0)
-        df[new_col] = df[new_col].values.astype(int)
+    with RowBlockExecutor(n_jobs) as executor:
+        for column in col_list:
+            if column not in df.columns:
+                warn(f"column not found in DataFrame: {column}")
+                continue
+            new_col = f"{column}{suffixe}"
+            if use_arrow(df[column], dtype_backend):
+                serie = _arrow_to_float(df[column], percent=False)
+                df[new_col] = from_arrow(
+                    to_arrow(serie).cast(pa.int64(), safe=False), like=serie)
+                continue
+            values = _numeric_fast_path(df, column, int)
+            shortcut = _profiled_shortcut(df, column) if values is None else None
+            if shortcut == "null":
+                values = np.zeros(len(df), dtype=int)
+            elif shortcut == "distinct":
+                values = _convert_distinct(
+                    df[column], _strings_to_number, dtype=int, percent=False)
+            if values is not None:
+                df[new_col] = values
+                continue
+            df[new_col] = executor.map(
+                _strings_to_number, df[column].values.astype(str), dtype=int,
+                percent=False)
+    invalidate_profile(df, [f"{column}{suffixe}" for column in col_list])
     return df
 
 
-def columns_to_date(
-    df: pd.DataFrame,
-    col_list: list,
-    date_format: str = "%Y-%m-%d",
-    keep_source: bool = False
-) -> pd.DataFrame:
-    # normalize date format separator
-    date_format = date_format.replace("/", "-")
-    # calculate date_format length in order to remove time if any
-    date_len = (
+def _date_len(date_format: str) -> int:
+    # length of a date in date_format, used to remove the time if any
+    return (
         ("Y" in date_format) * 4
         + ("y" in date_format) * 2
         + ("m" in date_format) * 2
         + ("d" in date_format) * 2
         + ("-" in date_format) * 2
     )
-    # convert to date
+
+
+def _excel_serials_to_date(strings: pd.Series) -> np.ndarray:
+    """
+    Excel serial numbers (days since 1899-12-30, time fraction dropped) to dates
+    """
+    numbers = pd.to_numeric(strings, errors="coerce").to_numpy(dtype=float)
+    is_serial = (numbers >= 1) & (numbers < EXCEL_MAX_SERIAL)
+    values = np.full(len(numbers), np.datetime64("NaT"), dtype="datetime64[ns]")
+    # only valid serials are converted: NaN input may raise FloatingPointError
+    values[is_serial] = pd.to_datetime(
+        np.floor(numbers[is_serial]), unit="D", origin=EXCEL_ORIGIN).to_numpy()
+    return values
+
+
+def _parse_dates(
+    serie: pd.Series,
+    date_format: str,
+    arrow: bool,
+    executor: RowBlockExecutor,
+    distinct: bool = False,
+) -> np.ndarray:
+    """
+    datetime64[ns] values of a serie parsed with a single format, NaT if invalid.
+    Values longer than the format are only a match when the rest is a time part: a
+    4-digit year cut by "%d-%m-%y" ("15-01-2024" -> "15-01-20") is left unparsed
+    for the next formats. With distinct, only the distinct values are parsed.
+    """
+    if date_format == EXCEL_FORMAT and distinct:
+        values = _convert_distinct(serie, _excel_serials_to_date)
+    elif date_format == EXCEL_FORMAT:
+        values = _excel_serials_to_date(serie.astype(str))
+    elif distinct and not arrow:
+        values = _convert_distinct(
+            serie, _strings_to_date, date_format=date_format,
+            date_len=_date_len(date_format))
+    elif arrow:
+        parsed = _arrow_to_date(serie, date_format, _date_len(date_format))
+        values = parsed.astype("datetime64[ns]").to_numpy()
+    else:
+        values = executor.map(
+            _strings_to_date, serie.astype(str), date_format=date_format,
+            date_len=_date_len(date_format))
+    values = np.array(values, dtype="datetime64[ns]")
+    if date_format != EXCEL_FORMAT and not is_datetime64_any_dtype(serie.dtype):
+        rest = serie.astype(str).str[_date_len(date_format):]
+        is_date_only = rest.eq("") | rest.str.match(_TIME_PART)
+        values[~is_date_only.to_numpy(dtype=bool)] = np.datetime64("NaT")
+    return values
+
+
+def _detect_date_formats(
+    serie: pd.Series,
+    executor: RowBlockExecutor,
+    sample_size: int = 1000,
+) -> list[str]:
+    """
+    Formats of AUTO_DATE_FORMATS found in a sample of the serie, ordered greedily:
+    each next format is the one parsing most of the sample values still unparsed,
+    2-digit year formats last.
+
+    Day first and month first formats are never mixed: the order parsing most of
+    the sample is kept (day first on a tie), with a warning when values only match
+    the other order (left unparsed).
+    """
+    sample = serie.dropna()
+    if len(sample) > sample_size:
+        sample = sample.sample(sample_size, random_state=0)
+    parsed = {
+        date_format: ~np.isnat(_parse_dates(sample, date_format, False, executor))
+        for date_format in AUTO_DATE_FORMATS
+    }
+    day_first = np.logical_or.reduce([parsed[f] for f in _DAY_FIRST_FORMATS])
+    month_first = np.logical_or.reduce([parsed[f] for f in _MONTH_FIRST_FORMATS])
+    if day_first.sum() >= month_first.sum():
+        dropped, only_dropped, order = _MONTH_FIRST_FORMATS, month_first, "day first"
+    else:
+        dropped, only_dropped, order = _DAY_FIRST_FORMATS, day_first, "month first"
+    only_dropped = only_dropped & ~np.logical_or.reduce(
+        [is_parsed for f, is_parsed in parsed.items() if f not in dropped])
+    if only_dropped.any():
+        warn(
+            f"column {serie.name}: dates match both day/month orders, {order} kept, "
+            f"{int(only_dropped.sum())} sampled values left unparsed")
+    parsed = {f: is_parsed for f, is_parsed in parsed.items() if f not in dropped}
+    formats: list[str] = []
+    remaining = np.ones(len(sample), dtype=bool)
+    while remaining.any():
+        hits = {
+            date_format: int((is_parsed & remaining).sum())
+            for date_format, is_parsed in parsed.items()
+            if date_format not in formats
+        }
+        best = max(hits, key=hits.__getitem__, default=None)
+        if best is None or hits[best] == 0:
+            break
+        formats.append(best)
+        remaining &= ~parsed[best]
+    # 2-digit years last: the formats only see the values left by the previous ones
+    formats.sort(key=lambda date_format: "%y" in date_format)
+    return formats or [AUTO_DATE_FORMATS[0]]
+
+
+@dataclass
+class DateParseReport:
+    """
+    Formats used by ak.columns_to_date and their hits.
+
+    Attributes
+    ----------
+    formats : dict
+        For each converted column, the formats tried in order
+    hits : dict
+        For each converted column, {format: number of rows parsed by this format}
+    nb_unparsed : dict
+        For each converted column, the number of non-null values left unparsed (NaT)
+    """
+    formats: dict = field(default_factory=dict)
+    hits: dict = field(default_factory=dict)
+    nb_unparsed: dict = field(default_factory=dict)
+
+    def to_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame.from_dict(self.hits, orient="index").fillna(0)
+        frame = frame.astype("int64")
+        frame["unparsed"] = pd.Series(self.nb_unparsed, dtype="int64")
+        return frame
+
+
+def columns_to_date(
+    df: pd.DataFrame,
+    col_list: list,
+    date_format: str | list[str] = "%Y-%m-%d",
+    keep_source: bool = False,
+    dtype_backend: DtypeBackend | None = None,
+    n_jobs: int = 1,
+    return_report: bool = False,
+) -> pd.DataFrame | tuple[pd.DataFrame, DateParseReport]:
+    """
+    Convert string columns to datetime, the time part (if any) is dropped and
+    invalid dates are set to NaT.
+
+    With a cached profile (see ak.profile_df), all-null columns are not parsed and
+    columns with few distinct values only parse the distinct values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to be converted
+    col_list : list
+        Columns to be converted
+    date_format : str | list[str], default "%Y-%m-%d"
+        strftime format of the dates ('/' and '-' separators are equivalent).
+        With a list, formats are tried in order, each one only on the rows left
+        unparsed by the previous ones. "excel" parses Excel serial numbers.
+        "auto" detects the formats (see AUTO_DATE_FORMATS) from a sample of each
+        column, with a single day/month order per column (the one parsing most of
+        the sample).
+    keep_source : bool, default False
+        Keep the source columns and add the converted ones with a '_dt' suffix
+    dtype_backend : {'numpy_nullable', 'pyarrow'}, default None
+        Convert with Arrow compute kernels ('pyarrow', default for Arrow columns)
+    n_jobs : int, default 1
+        Number of worker processes converting row blocks of huge frames in
+        parallel (-1: all CPUs), see akutils.pandas_parallel.RowBlockExecutor
+    return_report : bool, default False
+        Also return the DateParseReport with the rows parsed by each format
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df, report = ak.columns_to_date(
+            df, ["order_date"], date_format=["%Y-%m-%d", "%d/%m/%Y", "excel"],
+            return_report=True)
+        report.to_frame()
+        #             %Y-%m-%d  %d-%m-%Y  excel  unparsed
+        # order_date     81234     15066   3698         2
+    """
+    report = DateParseReport()
     suffixe = "_dt" if keep_source else ""
-    for column in col_list:
-        if column not in df.columns:
-            warn(f"column not found in DataFrame: {column}")
-            continue
-        new_col = f"{column}{suffixe}"
-        df[new_col] = df[column].astype(str)
-        df[new_col] = df[new_col].str.replace("/", "-").str[: date_len]
-        df[new_col] = pd.to_datetime(df[new_col], format=date_format, errors="coerce")
-    return df
+    with RowBlockExecutor(n_jobs) as executor:
+        for column in col_list:
+            if column not in df.columns:
+                warn(f"column not found in DataFrame: {column}")
+                continue
+            new_col = f"{column}{suffixe}"
+            serie = df[column]
+            arrow = use_arrow(serie, dtype_backend)
+            shortcut = None if arrow else _profiled_shortcut(df, column)
+            if isinstance(date_format, str) and date_format != "auto":
+                # normalize date format separator
+                single_format = date_format.replace("/", "-")
+                if arrow:
+                    df[new_col] = _arrow_to_date(
+                        serie, single_format, _date_len(single_format))
+                elif shortcut == "null":
+                    df[new_col] = np.full(
+                        len(serie), np.datetime64("NaT"), "datetime64[ns]")
+                elif shortcut == "distinct":
+                    df[new_col] = _convert_distinct(
+                        serie, _strings_to_date, date_format=single_format,
+                        date_len=_date_len(single_format))
+                else:
+                    df[new_col] = executor.map(
+                        _strings_to_date, serie.astype(str),
+                        date_format=single_format,
+                        date_len=_date_len(single_format))
+                report.formats[column] = [single_format]
+                report.hits[column] = {single_format: int(df[new_col].notna().sum())}
+            else:
+                if date_format == "auto":
+                    formats = _detect_date_formats(serie, executor)
+                else:
+                    formats = [f.replace("/", "-") for f in date_format]
+                values = np.full(len(serie), np.datetime64("NaT"), "datetime64[ns]")
+                remaining = np.arange(0 if shortcut == "null" else len(serie))
+                report.formats[column] = formats
+                report.hits[column] = {}
+                for single_format in formats:
+                    parsed = _parse_dates(
+                        serie.iloc[remaining], single_format, arrow, executor,
+                        distinct=shortcut == "distinct")
+                    is_parsed = ~np.isnat(parsed)
+                    values[remaining[is_parsed]] = parsed[is_parsed]
+                    report.hits[column][single_format] = int(is_parsed.sum())
+                    remaining = remaining[~is_parsed]
+                df[new_col] = (
+                    from_arrow(pa.array(values, from_pandas=True), like=serie)
+                    if arrow else values
+                )
+            report.nb_unparsed[column] = int(
+                (serie.notna() & df[new_col].isna()).sum())
+    invalidate_profile(df, [f"{column}{suffixe}" for column in col_list])
+    return (df, report) if return_report else df
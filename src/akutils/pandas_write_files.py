@@ -0,0 +1,240 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+import pandas as pd
+from upath import UPath
+from akutils.fs_session import get_session
+from akutils.pandas_parallel import _get_n_jobs
+from akutils.utils_functions import timeit
+
+EXCEL_MAX_ROWS = 1_048_576  # rows of an Excel sheet, header included
+EXCEL_MAX_SHEET_NAME = 31
+# rows converted to Python values at once: bounds the memory of the conversion
+_XLSX_BLOCK_ROWS = 10_000
+_COMPRESSION_SUFFIXES = {
+    "gzip": ".gz", "bz2": ".bz2", "zip": ".zip", "xz": ".xz", "zstd": ".zst"}
+
+Frames = pd.DataFrame | Iterable[pd.DataFrame]
+
+
+def _iter_frames(data: Frames) -> Iterator[pd.DataFrame]:
+    if isinstance(data, pd.DataFrame):
+        yield data
+    else:
+        yield from data
+
+
+def _sheet_names(sheet_name: str) -> Iterator[str]:
+    # sheet_name, sheet_name_2, sheet_name_3... (Excel limit of 31 characters)
+    yield sheet_name[:EXCEL_MAX_SHEET_NAME]
+    number = 2
+    while True:
+        suffix = f"_{number}"
+        yield sheet_name[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix
+        number += 1
+
+
+def _excel_rows(df: pd.DataFrame, index: bool) -> Iterator[tuple]:
+    """
+    Rows of Python values writable by openpyxl (missing values as empty cells),
+    converted block by block
+    """
+    if index:
+        df = df.reset_index()
+    for start in range(0, len(df), _XLSX_BLOCK_ROWS):
+        block = df.iloc[start:start + _XLSX_BLOCK_ROWS].astype(object)
+        block = block.where(block.notna(), None)
+        yield from block.itertuples(index=False, name=None)
+
+
+def _write_sheets(
+    workbook,
+    data: Frames,
+    sheet_name: str,
+    index: bool,
+    header: bool,
+    max_rows_per_sheet: int,
+) -> list[str]:
+    names, sheets = _sheet_names(sheet_name), []
+    worksheet: Any = None
+    rows_left, columns = 0, None
+    for df in _iter_frames(data):
+        if columns is None:
+            columns = list((df.iloc[:0].reset_index() if index else df).columns)
+        for row in _excel_rows(df, index):
+            if rows_left == 0:
+                # full (or no) sheet: the rows go on in a new one
+                sheets.append(next(names))
+                worksheet = workbook.create_sheet(sheets[-1])
+                rows_left = max_rows_per_sheet
+                if header:
+                    worksheet.append([str(column) for column in columns])
+                    rows_left -= 1
+            worksheet.append(row)
+            rows_left -= 1
+    if not sheets:
+        sheets.append(next(names))
+        worksheet = workbook.create_sheet(sheets[-1])
+        if header and columns is not None:
+            worksheet.append([str(column) for column in columns])
+    return sheets
+
+
+@timeit
+def write_xlsx(
+    data: Frames | dict[str, Frames],
+    file_path: str | Path | UPath,
+    sheet_name: str = "Sheet1",
+    index: bool = False,
+    header: bool = True,
+    max_rows_per_sheet: int = EXCEL_MAX_ROWS,
+) -> list[str]:
+    """
+    Stream DataFrames to an Excel file with a constant memory usage (openpyxl
+    write-only mode): rows are converted and written block by block, the workbook
+    is never built in memory. Data exceeding the Excel row limit goes on to new
+    sheets (sheet_name_2, sheet_name_3...).
+
+    Parameters
+    ----------
+    data : pd.DataFrame | Iterable[pd.DataFrame] | dict
+        DataFrame or chunks of a DataFrame (e.g. a chunked reader), or
+        {sheet name: DataFrame or chunks} to write several sheets
+    file_path : str | Path | UPath
+        Local or remote (Azure...) path of the xlsx file
+    sheet_name : str, default "Sheet1"
+        Name of the (first) sheet, when data is not a dict
+    index : bool, default False
+        Write the index as first columns
+    header : bool, default True
+        Write the column names as first row of each sheet
+    max_rows_per_sheet : int, default 1_048_576 (Excel limit)
+        Rows per sheet, header included
+
+    Returns
+    -------
+    list[str]
+        Names of the written sheets
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import pandas as pd
+        import akutils as ak
+
+        with pd.read_csv(file_path, sep=";", chunksize=10**5) as reader:
+            sheets = ak.write_xlsx(reader, "sales.xlsx", sheet_name="sales")
+    """
+    from openpyxl import Workbook  # type: ignore
+
+    if max_rows_per_sheet < 1 + header:
+        raise ValueError("max_rows_per_sheet must leave room for a data row")
+    workbook = Workbook(write_only=True)
+    sheets_data = data if isinstance(data, dict) else {sheet_name: data}
+    sheets = []
+    for name, frames in sheets_data.items():
+        sheets += _write_sheets(
+            workbook, frames, name, index, header, max_rows_per_sheet)
+    with get_session().open(file_path, "wb") as file:
+        workbook.save(file)
+    return sheets
+
+
+def _iter_partitions(
+    data: Frames, partition_rows: int | None
+) -> Iterator[pd.DataFrame]:
+    # chunks bigger than partition_rows are split (row slices, no copy)
+    for df in _iter_frames(data):
+        if partition_rows is None or len(df) <= partition_rows:
+            yield df
+            continue
+        for start in range(0, len(df), partition_rows):
+            yield df.iloc[start:start + partition_rows]
+
+
+def _write_csv_partition(
+    df: pd.DataFrame, file_path: UPath, to_csv_kwargs: dict
+) -> UPath:
+    with get_session().open(file_path, "wb") as file:
+        df.to_csv(file, mode="wb", **to_csv_kwargs)
+    return file_path
+
+
+@timeit
+def write_csv_partitions(
+    data: Frames,
+    dir_path: str | Path | UPath,
+    partition_rows: int | None = 10**6,
+    compression: str | None = None,
+    file_prefix: str = "part",
+    n_jobs: int = -1,
+    index: bool = False,
+    **kwargs
+) -> list[UPath]:
+    """
+    Write DataFrames as CSV files of partition_rows rows each (part-00000.csv,
+    part-00001.csv...), the partitions being formatted, compressed and written in
+    parallel. At most n_jobs partitions are pending at once, so the memory usage
+    does not grow with the output size when data is an iterator of chunks.
+
+    Parameters
+    ----------
+    data : pd.DataFrame | Iterable[pd.DataFrame]
+        DataFrame or chunks of a DataFrame (e.g. a chunked reader)
+    dir_path : str | Path | UPath
+        Local or remote (Azure...) output directory, created if missing
+    partition_rows : int | None, default 10**6
+        Maximum rows per file, bigger chunks are split (chunks are never merged),
+        None writes a file per chunk
+    compression : {'gzip', 'bz2', 'zip', 'xz', 'zstd'}, default None
+        Compression of the files, their extension is added to the file names
+    file_prefix : str, default "part"
+        Prefix of the file names
+    n_jobs : int, default -1
+        Partitions written in parallel (-1: number of CPUs). Threads are used:
+        compression and writes release the GIL, the CSV formatting partly does
+    index : bool, default False
+        Write the index
+    **kwargs
+        Pass any argument allowed by pd.DataFrame.to_csv (sep, encoding...)
+
+    Returns
+    -------
+    list[UPath]
+        Paths of the written files, in data order
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        ak.write_csv_partitions(df, dir_path, sep=";", compression="gzip")
+    """
+    n_jobs = _get_n_jobs(n_jobs)
+    dir_path = dir_path if isinstance(dir_path, UPath) else UPath(dir_path)
+    fs, fs_dir_path = get_session().filesystem(dir_path)
+    fs.makedirs(fs_dir_path, exist_ok=True)
+    suffix = ".csv" + (_COMPRESSION_SUFFIXES[compression] if compression else "")
+    to_csv_kwargs = {**kwargs, "index": index, "compression": compression}
+
+    file_paths: list[UPath] = []
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        pending: set[Future] = set()
+        for number, df in enumerate(_iter_partitions(data, partition_rows)):
+            if len(pending) >= n_jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()  # raise the first error without waiting
+            file_path = dir_path / f"{file_prefix}-{number:05d}{suffix}"
+            pending.add(executor.submit(
+                _write_csv_partition, df, file_path, to_csv_kwargs))
+            file_paths.append(file_path)
+        for future in pending:
+            future.result()
+    if file_paths:
+        get_session().invalidate(dir_path)
+    return file_paths
@@ -0,0 +1,207 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Literal
+
+EventKind = Literal["file_start", "chunk", "file_end"]
+
+
+@dataclass
+class ProgressEvent:
+    """
+    Progress of a file read by the akutils readers
+
+    Attributes
+    ----------
+    kind : {'file_start', 'chunk', 'file_end'}
+        Event type: a file is opened, a chunk was processed, a file is fully read
+    source : str
+        File (or zip member) name
+    chunk_index : int | None
+        Index of the processed chunk ('chunk' events)
+    rows : int
+        Rows of the chunk ('chunk' events) or of the file so far
+    total_rows : int
+        Rows read from the file so far
+    bytes_read : int | None
+        Bytes read from the file so far, None when unknown
+    total_bytes : int | None
+        Size of the file, None when unknown
+    elapsed : float
+        Seconds since the file was opened
+    """
+    kind: EventKind
+    source: str
+    chunk_index: int | None = None
+    rows: int = 0
+    total_rows: int = 0
+    bytes_read: int | None = None
+    total_bytes: int | None = None
+    elapsed: float = 0.
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.total_rows / self.elapsed if self.elapsed else 0.
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+def throttle(callback: ProgressCallback, interval: float = 1.0) -> ProgressCallback:
+    """
+    Forward 'chunk' events at most once every interval seconds (per source), file
+    start and end events are always forwarded
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        df = ak.read_multiple_csv_from_dir(
+            dir_path, sep=";", progress=ak.throttle(ak.LoggingProgress(), 10))
+    """
+    last_emit: dict[str, float] = {}
+
+    def throttled(event: ProgressEvent):
+        now = time.monotonic()
+        if event.kind == "chunk" and now - last_emit.get(event.source, 0.) < interval:
+            return
+        last_emit[event.source] = now
+        callback(event)
+
+    return throttled
+
+
+class LoggingProgress:
+    """
+    Progress callback writing events to a logging.Logger
+
+    Parameters
+    ----------
+    logger : logging.Logger, default None
+        Destination logger, default the 'akutils' logger
+    level : int, default logging.INFO
+        Level of the log records
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.INFO):
+        self.logger = logger or logging.getLogger("akutils")
+        self.level = level
+
+    def __call__(self, event: ProgressEvent):
+        if event.kind == "file_start":
+            self.logger.log(self.level, "READ %s", event.source)
+            return
+        self.logger.log(
+            self.level,
+            "%s %s: %d rows (%.0f rows/s, %.1fs)%s",
+            "chunk" if event.kind == "chunk" else "done",
+            event.source if event.chunk_index is None
+            else f"{event.source}[{event.chunk_index}]",
+            event.total_rows,
+            event.rows_per_sec,
+            event.elapsed,
+            "" if event.bytes_read is None else f", {event.bytes_read} bytes read",
+        )
+
+
+class RichProgress:
+    """
+    Progress callback displaying a rich progress bar per file (bytes read when the
+    file size is known, else rows)
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        with ak.RichProgress() as progress:
+            df = ak.read_multiple_csv_from_dir(dir_path, sep=";", progress=progress)
+    """
+
+    def __init__(self, **progress_kwargs) -> None:
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+        from akutils.console_color import get_console
+
+        self.progress = Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TextColumn("{task.fields[rows]} rows"),
+            TextColumn("{task.fields[speed]:.0f} rows/s"),
+            TimeElapsedColumn(),
+            console=get_console(),
+            **progress_kwargs,
+        )
+        self._tasks: dict = {}
+
+    def __enter__(self) -> "RichProgress":
+        self.progress.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.progress.stop()
+
+    def __call__(self, event: ProgressEvent):
+        if event.kind == "file_start":
+            self._tasks[event.source] = self.progress.add_task(
+                event.source, total=event.total_bytes, rows=0, speed=0.)
+            return
+        task_id = self._tasks.get(event.source)
+        if task_id is None:
+            return
+        self.progress.update(
+            task_id,
+            completed=event.bytes_read if event.total_bytes else None,
+            rows=event.total_rows,
+            speed=event.rows_per_sec,
+        )
+        if event.kind == "file_end":
+            total = self.progress.tasks[task_id].total or event.bytes_read or 1
+            self.progress.update(task_id, total=total, completed=total)
+
+
+class _FileProgress:
+    """
+    Emits the events of a file read (no-op without callback)
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None,
+        source: str,
+        total_bytes: int | None = None,
+    ):
+        self.callback, self.source, self.total_bytes = callback, source, total_bytes
+        self.total_rows = 0
+        self._start = time.perf_counter()
+
+    def _emit(self, kind: EventKind, **kwargs):
+        if self.callback is None:
+            return
+        self.callback(ProgressEvent(
+            kind=kind,
+            source=self.source,
+            total_rows=self.total_rows,
+            total_bytes=self.total_bytes,
+            elapsed=time.perf_counter() - self._start,
+            **kwargs,
+        ))
+
+    def start(self):
+        self._emit("file_start")
+
+    def chunk(self, chunk_index: int, rows: int, bytes_read: int | None = None):
+        self.total_rows += rows
+        self._emit("chunk", chunk_index=chunk_index, rows=rows, bytes_read=bytes_read)
+
+    def end(self, bytes_read: int | None = None):
+        self._emit("file_end", rows=self.total_rows, bytes_read=bytes_read)
@@ -0,0 +1,42 @@
+"""
+Import time benchmark of akutils (cold start of short-lived batch tasks).
+
+Usage: python src/akutils/tests/benchmark/bench_import_time.py
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).parents[3]
+SCENARIOS = {
+    "interpreter": "pass",
+    "import akutils": "import akutils",
+    "os utils": "import akutils as ak; ak.list_files_from_dir; ak.warn",
+    "readers": "import akutils as ak; ak.read_multiple_csv_from_dir",
+    "full api": "import akutils as ak; [getattr(ak, name) for name in ak.__all__]",
+}
+
+
+def cumulative_import_time_us(code: str) -> int:
+    """
+    Sum of the cumulative time of top level imports reported by python -X importtime
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        _, cumulative, name = line.split("|")
+        is_top_level = not name.startswith("  ")
+        if is_top_level and cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total
+
+
+if __name__ == "__main__":
+    for scenario, code in SCENARIOS.items():
+        timings = sorted(cumulative_import_time_us(code) for _ in range(5))
+        print(f"{scenario:<15} median {timings[2] / 1000:8.1f} ms")
@@ -0,0 +1,106 @@
+"""
+Read throughput of local files and zip members: buffered vs memory mapped local
+files, TextIOWrapper decode vs binary / in place (STORED) zip members.
+
+Python allocations peak (tracemalloc) shows the intermediate copies: the
+TextIOWrapper path decodes each block into a str that pandas encodes back to utf-8.
+
+Usage: python src/akutils/tests/benchmark/bench_read_files.py
+"""
+import contextlib
+import functools
+import io
+import tempfile
+import time
+import tracemalloc
+import zipfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import akutils as ak
+from akutils.pandas_read_files import _open_zip_member, _zip_buffer
+
+NB_ROWS = 10**6
+CHUNKSIZE = 2 * 10**5
+
+
+def drop_rows(df: pd.DataFrame) -> pd.DataFrame:
+    # chunks are dropped: the allocations peak only shows the reading buffers
+    return df.iloc[:0]
+
+
+READ_ARGS = {"sep": ";", "dtype": None, "chunksize": CHUNKSIZE, "chunk_func": drop_rows}
+
+
+def make_csv(path: Path):
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        "id": np.arange(NB_ROWS),
+        "amount": rng.normal(size=NB_ROWS).round(4),
+        "country": rng.choice(["France", "Germany", "Italy", "Spain"], NB_ROWS),
+        "comment": "lorem ipsum dolor sit amet",
+    }).to_csv(path, sep=";", index=False)
+
+
+def zip_read(zip_path: Path, text: bool):
+    """
+    text=True: previous implementation, members decoded to str by a TextIOWrapper
+    """
+    with _zip_buffer(zip_path) as zip_buffer, zipfile.ZipFile(zip_path) as zip_ref:
+        for file_name in zip_ref.namelist():
+            if text:
+                file = io.TextIOWrapper(zip_ref.open(file_name), encoding="utf-8")
+            else:
+                file = _open_zip_member(zip_ref, file_name, zip_buffer)
+            with file:
+                ak.read_csv_in_chunks(file, **READ_ARGS)
+
+
+def measure(function) -> tuple[float, float]:
+    """
+    (best time over 3 runs in seconds, Python allocations peak in MB)
+    """
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return min(timings), peak / 2**20
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "data.csv"
+        make_csv(csv_path)
+        size_mb = csv_path.stat().st_size / 2**20
+        zip_paths = {}
+        for name, compression in (("stored", zipfile.ZIP_STORED),
+                                  ("deflated", zipfile.ZIP_DEFLATED)):
+            zip_paths[name] = Path(tmp_dir) / f"data_{name}.zip"
+            with zipfile.ZipFile(zip_paths[name], "w", compression=compression) as z:
+                z.write(csv_path, "data.csv")
+
+        scenarios = {
+            "local buffered": lambda: ak.read_csv_in_chunks(
+                csv_path, memory_map=False, **READ_ARGS),
+            "local mmap": lambda: ak.read_csv_in_chunks(csv_path, **READ_ARGS),
+        }
+        for name, zip_path in zip_paths.items():
+            scenarios[f"zip {name} text"] = functools.partial(
+                zip_read, zip_path, text=True)
+            scenarios[f"zip {name} binary"] = functools.partial(
+                zip_read, zip_path, text=False)
+
+        print(f"{NB_ROWS} rows, {size_mb:.1f} MB")
+        for scenario, function in scenarios.items():
+            seconds, peak_mb = measure(function)
+            print(
+                f"{scenario:<22} {seconds:6.2f} s {size_mb / seconds:7.1f} MB/s "
+                f"python alloc peak {peak_mb:7.1f} MB"
+            )
@@ -0,0 +1,81 @@
+"""
+Read throughput of a fixed-width file: pd.read_fwf vs ak.read_fwf_in_chunks, with
+ak.read_csv_in_chunks on the same data as CSV for reference.
+
+Usage: python src/akutils/tests/benchmark/bench_read_fwf.py
+"""
+import contextlib
+import io
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+import akutils as ak
+
+NB_ROWS = 10**6
+CHUNKSIZE = 2 * 10**5
+LAYOUT = {
+    "id": (0, 10, "int64"),
+    "amount": (10, 22, "float64"),
+    "country": (22, 32),
+    "comment": (32, 60),
+}
+
+
+def make_files(fwf_path: Path, csv_path: Path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "id": np.arange(NB_ROWS),
+        "amount": rng.normal(size=NB_ROWS).round(4),
+        "country": rng.choice(["France", "Germany", "Italy", "Spain"], NB_ROWS),
+        "comment": "lorem ipsum dolor sit amet",
+    })
+    df.to_csv(csv_path, sep=";", index=False)
+    lines = (
+        df["id"].astype(str).str.rjust(10)
+        + df["amount"].astype(str).str.rjust(12)
+        + df["country"].str.ljust(10)
+        + df["comment"].str.ljust(28)
+    )
+    fwf_path.write_text("\n".join(lines) + "\n")
+
+
+def best_time(function) -> float:
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fwf_path, csv_path = Path(tmp_dir) / "data.txt", Path(tmp_dir) / "data.csv"
+        make_files(fwf_path, csv_path)
+        colspecs = [(int(spec[0]), int(spec[1])) for spec in LAYOUT.values()]
+        dtypes = {name: spec[2] if len(spec) == 3 else "string"
+                  for name, spec in LAYOUT.items()}
+        runs = {
+            "pd.read_fwf": lambda: pd.read_fwf(
+                fwf_path, colspecs=colspecs, names=list(LAYOUT), dtype=dtypes,
+                chunksize=CHUNKSIZE),
+            "ak.read_fwf_in_chunks": lambda: ak.read_fwf_in_chunks(
+                fwf_path, LAYOUT, chunksize=CHUNKSIZE),
+            "ak.read_csv_in_chunks": lambda: ak.read_csv_in_chunks(
+                csv_path, sep=";", dtype=dtypes, chunksize=CHUNKSIZE),
+            "ak.read_fwf_in_chunks pyarrow": lambda: ak.read_fwf_in_chunks(
+                fwf_path, LAYOUT, chunksize=CHUNKSIZE, dtype_backend="pyarrow"),
+            "ak.read_csv_in_chunks pyarrow": lambda: ak.read_csv_in_chunks(
+                csv_path, sep=";", dtype=dtypes, chunksize=CHUNKSIZE,
+                dtype_backend="pyarrow"),
+        }
+        print(f"{NB_ROWS} rows")
+        for name, run in runs.items():
+            if name == "pd.read_fwf":
+                # the reader only parses when iterated
+                run = (lambda reader: lambda: pd.concat(reader()))(run)
+            print(f"{name:<32}{best_time(run):8.2f}s")
@@ -0,0 +1,87 @@
+"""
+Time, allocations peak (tracemalloc) and result memory of convert_datetimes_to_date
+engines and of fillna_numerical_columns, against their previous implementations.
+
+Arrow buffers are allocated outside of the Python allocator: the allocations peak of
+the date32 engine is only visible in its result memory.
+
+Usage: python src/akutils/tests/benchmark/bench_serie_cleaner.py [nb_rows]
+"""
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+import akutils as ak
+
+NB_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * 10**6
+
+
+def previous_convert_datetimes_to_date(df: pd.DataFrame) -> pd.DataFrame:
+    for col in df.select_dtypes("datetime64").columns:
+        df[col] = df[col].dt.date
+    return df
+
+
+def previous_fillna_numerical_columns(df: pd.DataFrame, filler=0) -> pd.DataFrame:
+    cols = list(df.select_dtypes("number").columns)
+    df[cols] = df[cols].fillna(filler)
+    return df
+
+
+def make_dates(nb_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    start = np.datetime64("2020-01-01T00:00:00", "s").astype("datetime64[ns]")
+    seconds = rng.integers(0, 4 * 365 * 86400, nb_rows).astype("timedelta64[s]")
+    return pd.DataFrame({f"d{i}": start + seconds for i in range(3)})
+
+
+def make_numbers(nb_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(size=(nb_rows, 8)), columns=[f"f{i}" for i in range(8)])
+    # only 2 columns out of 8 hold missing values
+    for col in ("f0", "f1"):
+        df.loc[rng.random(nb_rows) < 0.01, col] = np.nan
+    return df
+
+
+def make_profiled(nb_rows: int) -> pd.DataFrame:
+    df = make_numbers(nb_rows)
+    ak.profile_df(df)  # e.g. computed once after reading
+    return df
+
+
+def measure(function, make_input) -> tuple[float, float, float]:
+    """
+    (seconds, allocations peak in MB, result memory in MB)
+    """
+    df = make_input(NB_ROWS)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(df)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 2**20, result.memory_usage(deep=True).sum() / 2**20
+
+
+if __name__ == "__main__":
+    scenarios = {
+        "dates previous (.dt.date)": (previous_convert_datetimes_to_date, make_dates),
+        "dates engine='object'": (ak.convert_datetimes_to_date, make_dates),
+        "dates engine='date32'": (
+            lambda df: ak.convert_datetimes_to_date(df, engine="date32"), make_dates),
+        "dates engine='normalize'": (
+            lambda df: ak.convert_datetimes_to_date(df, engine="normalize"),
+            make_dates),
+        "fillna previous (block)": (previous_fillna_numerical_columns, make_numbers),
+        "fillna per column": (ak.fillna_numerical_columns, make_numbers),
+        "fillna per column, profiled": (ak.fillna_numerical_columns, make_profiled),
+    }
+    print(f"{NB_ROWS} rows")
+    for scenario, (function, make_input) in scenarios.items():
+        seconds, peak_mb, result_mb = measure(function, make_input)
+        print(f"{scenario:<30} {seconds:6.2f} s  alloc peak {peak_mb:8.1f} MB  "
+              f"result {result_mb:8.1f} MB")
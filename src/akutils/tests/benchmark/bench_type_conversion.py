@@ -0,0 +1,50 @@
+"""
+Speedup of the row block parallel type converters (n_jobs) over the single process
+conversion, on string columns as read by ak.read_csv_in_chunks.
+
+Usage: python src/akutils/tests/benchmark/bench_type_conversion.py [nb_rows]
+"""
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+import akutils as ak
+
+NB_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 5 * 10**6
+
+
+def make_df(nb_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2000-01-01", periods=9000).strftime("%d/%m/%Y")
+    amounts = rng.normal(scale=10**4, size=nb_rows).round(2).astype(str)
+    return pd.DataFrame({
+        "amount": pd.Series(np.char.replace(amounts, ".", ","), dtype="string"),
+        "quantity": pd.Series(
+            rng.integers(0, 10**6, nb_rows).astype(str), dtype="string"),
+        "date": pd.Series(rng.choice(dates, nb_rows), dtype="string"),
+    })
+
+
+def convert(df: pd.DataFrame, n_jobs: int):
+    ak.columns_to_float(df, ["amount"], keep_source=True, n_jobs=n_jobs)
+    ak.columns_to_int(df, ["quantity"], keep_source=True, n_jobs=n_jobs)
+    ak.columns_to_date(
+        df, ["date"], date_format="%d/%m/%Y", keep_source=True, n_jobs=n_jobs)
+
+
+if __name__ == "__main__":
+    df = make_df(NB_ROWS)
+    cpu_count = os.cpu_count() or 1
+    n_jobs_list = sorted({1, *(2**i for i in range(1, 6) if 2**i < cpu_count),
+                          cpu_count})
+    print(f"{NB_ROWS} rows, {cpu_count} CPUs")
+    reference = None
+    for n_jobs in n_jobs_list:
+        start = time.perf_counter()
+        convert(df.copy(), n_jobs)
+        seconds = time.perf_counter() - start
+        reference = reference or seconds
+        print(f"n_jobs={n_jobs:<3} {seconds:6.2f} s "
+              f"speedup x{reference / seconds:.1f}")
@@ -0,0 +1,66 @@
+"""
+Time and allocations peak (tracemalloc) of write_xlsx and write_csv_partitions,
+against pd.DataFrame.to_excel and a single pd.DataFrame.to_csv.
+
+The input frame is built before measuring: the peaks only count the allocations of
+the writers.
+
+Usage: python src/akutils/tests/benchmark/bench_write_files.py [nb_rows]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+import akutils as ak
+
+NB_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 2 * 10**5
+
+
+def make_df(nb_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "id": np.arange(nb_rows),
+        "amount": rng.normal(size=nb_rows).round(2),
+        "country": rng.choice(["France", "Germany", "Italy"], nb_rows),
+        "date": pd.Timestamp("2024-01-31")
+        + pd.to_timedelta(rng.integers(0, 365, nb_rows), unit="D"),
+    })
+
+
+def measure(function) -> tuple[float, float]:
+    """
+    (seconds, allocations peak in MB)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    df = make_df(NB_ROWS)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out = Path(tmp_dir)
+        cases = {
+            "to_excel (openpyxl)": lambda: df.to_excel(out / "a.xlsx", index=False),
+            "write_xlsx": lambda: ak.write_xlsx(df, out / "b.xlsx"),
+            "to_csv gzip": lambda: df.to_csv(
+                out / "a.csv.gz", index=False, compression="gzip"),
+            "write_csv_partitions gzip": lambda: ak.write_csv_partitions(
+                df, out / "parts", partition_rows=NB_ROWS // 8, compression="gzip"),
+        }
+        print(f"{NB_ROWS} rows")
+        for name, function in cases.items():
+            seconds, peak = measure(function)
+            print(f"{name:<28} {seconds:7.2f}s  peak {peak:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
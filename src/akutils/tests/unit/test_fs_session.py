@@ -0,0 +1,193 @@
+import gzip
+import threading
+import time
+import uuid
+import pytest
+import fsspec  # type: ignore
+import pandas as pd
+from azure.core.exceptions import ResourceNotFoundError
+from fsspec.implementations.memory import MemoryFileSystem  # type: ignore
+from upath import UPath
+import akutils as ak
+from akutils import PATH_TO_AKUTILS_PKG
+
+
+class FakeAzureFileSystem(MemoryFileSystem):
+    """
+    In memory "abfs" filesystem taking its account from the url, as adlfs does
+    (abfs://container@account.dfs.core.windows.net/path)
+    """
+    protocol = "abfs"
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        path = str(path).removeprefix("abfs://").removeprefix("abfs:/")
+        if path.startswith("/"):
+            return path.rstrip("/") or "/"
+        container, _, rest = path.partition("/")
+        return "/" + "/".join([container.split("@")[0], rest]).rstrip("/")
+
+    @staticmethod
+    def _get_kwargs_from_urls(url):
+        netloc = url.removeprefix("abfs://").split("/")[0]
+        if "@" not in netloc:
+            return {}
+        return {"account_name": netloc.split("@")[1].split(".")[0]}
+
+
+fsspec.register_implementation("abfs", FakeAzureFileSystem, clobber=True)
+
+
+@pytest.fixture
+def session():
+    session = ak.FileSystemSession(max_concurrency=2, batch_size=10)
+    previous = ak.set_session(session)
+    yield session
+    ak.set_session(previous)
+
+
+@pytest.fixture
+def memory_dir():
+    dir_path = UPath(f"memory:///{uuid.uuid4().hex}")
+    dir_path.mkdir()
+    yield dir_path
+    dir_path.fs.rm(dir_path.path, recursive=True)
+
+
+def count_calls(monkeypatch, fs, method: str) -> list:
+    calls = []
+    original = getattr(fs, method)
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(fs, method, counted)
+    return calls
+
+
+class TestFileSystemSession():
+
+    file_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+
+    def test_shared_filesystem(self, session, memory_dir):
+        fs, fs_path = session.filesystem(memory_dir / "a.csv")
+        other_fs, _ = session.filesystem(UPath(str(memory_dir)) / "b.csv")
+        assert fs is other_fs
+        assert fs_path == f"{memory_dir.path}/a.csv"
+
+    def test_listing_cached(self, session, memory_dir, monkeypatch):
+        for name in ("a.csv", "b.csv", "c.txt"):
+            (memory_dir / name).write_text("x;y\n1;2\n")
+        (memory_dir / "sub").mkdir()
+        fs, _ = session.filesystem(memory_dir)
+        ls_calls = count_calls(monkeypatch, fs, "ls")
+        info_calls = count_calls(monkeypatch, fs, "info")
+
+        files = ak.list_files_from_dir(memory_dir, regex=r"\.csv$")
+        assert sorted(file.name for file in files) == ["a.csv", "b.csv"]
+        assert all(type(file) is type(memory_dir) for file in files)
+        assert [d.name for d in ak.list_dir_from_dir(memory_dir)] == ["sub"]
+        # types and sizes come from the cached listing: no request per file
+        assert ak.file_fingerprint(files[0])[1] == 8
+        assert (len(ls_calls), len(info_calls)) == (1, 0)
+
+        session.invalidate(memory_dir)
+        ak.list_files_from_dir(memory_dir)
+        assert len(ls_calls) == 2
+
+    def test_local_listing_not_cached(self, session, tmp_path):
+        (tmp_path / "a.csv").write_text("x\n1\n")
+        assert len(ak.list_files_from_dir(tmp_path)) == 1
+        (tmp_path / "b.csv").write_text("x\n1\n")
+        assert len(ak.list_files_from_dir(tmp_path)) == 2
+
+    def test_bulk_rm(self, session, memory_dir, monkeypatch):
+        for i in range(25):
+            (memory_dir / f"part_{i}.parquet").write_text("")
+        (memory_dir / "keep.csv").write_text("")
+        assert len(ak.list_files_from_dir(memory_dir)) == 26
+
+        fs, _ = session.filesystem(memory_dir)
+        active, max_active = [0], [0]
+        lock = threading.Lock()
+        original_rm = fs.rm
+
+        def slow_rm(path, recursive=False, **kwargs):
+            with lock:
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+            time.sleep(0.05)
+            original_rm(path, recursive=recursive, **kwargs)
+            with lock:
+                active[0] -= 1
+
+        monkeypatch.setattr(fs, "rm", slow_rm)
+        rm_calls = count_calls(monkeypatch, fs, "rm")
+        ak.remove_files_from_directory(memory_dir, regex="*.parquet")
+        # 25 files by batches of 10, at most max_concurrency batches in parallel
+        assert len(rm_calls) == 3
+        assert max_active[0] == 2
+        # the cached listing was invalidated by the delete
+        assert [f.name for f in ak.list_files_from_dir(memory_dir)] == ["keep.csv"]
+
+    def test_remove_remote_dir(self, session, memory_dir, capsys):
+        sub_dir = memory_dir / "sub"
+        (sub_dir / "nested").mkdir(parents=True)
+        (sub_dir / "nested" / "a.csv").write_text("")
+        (sub_dir / "b.csv").write_text("")
+        assert len(ak.list_dir_from_dir(memory_dir)) == 1
+        ak.remove_dir(sub_dir)
+        assert "REMOVE" in capsys.readouterr().out
+        assert ak.list_dir_from_dir(memory_dir) == []
+
+    def test_read_remote_file(self, session, memory_dir):
+        expected = pd.read_csv(self.file_path, sep=";", dtype="string")
+        with (memory_dir / "sales.csv.gz").open("wb") as f:
+            f.write(gzip.compress(self.file_path.read_bytes()))
+        df = ak.read_multiple_csv_from_dir(memory_dir, sep=";")
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_azure_filesystem_per_account(self, session):
+        """
+        Containers of an account share a filesystem, accounts do not
+        """
+        fs_a, _ = session.filesystem(UPath("abfs://c1@accounta.dfs.core.windows.net/x"))
+        fs_a2, _ = session.filesystem(
+            UPath("abfs://c2@accounta.dfs.core.windows.net/y"))
+        fs_b, _ = session.filesystem(UPath("abfs://c1@accountb.dfs.core.windows.net/x"))
+        assert fs_a is fs_a2
+        assert fs_a is not fs_b
+        assert (fs_a.storage_options, fs_b.storage_options) == (
+            {"account_name": "accounta"}, {"account_name": "accountb"})
+
+    def test_azure_duplicated_path(self, session):
+        dir_path = UPath(f"abfs://c1@accounta.dfs.core.windows.net/{uuid.uuid4().hex}")
+        (dir_path / "a.csv").write_text("x\n1\n")
+        duplicated = UPath(f"{dir_path}/{dir_path}")
+        assert session.filesystem(duplicated)[1] == session.filesystem(dir_path)[1]
+        assert [f.name for f in ak.list_files_from_dir(duplicated)] == ["a.csv"]
+
+    def test_azure_missing_blob_listing(self, session, monkeypatch):
+        """
+        A blob prefix that does not really exist (e.g. empty dir) lists no entry
+        """
+        dir_path = UPath("abfs://c1@accounta.dfs.core.windows.net/empty")
+        fs, _ = session.filesystem(dir_path)
+
+        def ls(path, detail=True, **kwargs):
+            error = ResourceNotFoundError("The specified blob does not exist")
+            error.status_code = 404
+            raise error
+
+        monkeypatch.setattr(fs, "ls", ls)
+        assert ak.list_files_from_dir(dir_path) == []
+        assert ak.list_dir_from_dir(dir_path) == []
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            ak.FileSystemSession(max_concurrency=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import pytest
+import akutils as ak
+from akutils import PATH_TO_AKUTILS_PKG
+
+HEAVY_MODULES = [
+    "pandas", "pyarrow", "azure", "upath", "fsspec", "rich", "pkg_resources"]
+
+
+def _loaded_heavy_modules(code: str) -> list:
+    """
+    Run code in a fresh interpreter and return the heavy modules it imported
+    """
+    script = (
+        f"import sys\n{code}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=str(PATH_TO_AKUTILS_PKG.parent))
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True,
+        check=True)
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+class TestLazyImport():
+
+    def test_import_akutils_is_light(self):
+        assert _loaded_heavy_modules("import akutils") == []
+
+    def test_os_utils_do_not_load_pandas(self):
+        code = "import akutils as ak\nak.list_files_from_dir\nak.warn"
+        assert _loaded_heavy_modules(code) == []
+
+    def test_subsystem_loaded_on_first_use(self):
+        code = "import akutils as ak\nak.read_csv_in_chunks"
+        assert "pandas" in _loaded_heavy_modules(code)
+
+    def test_public_api(self):
+        assert "read_csv_in_chunks" in dir(ak)
+        with pytest.raises(AttributeError):
+            ak.not_an_akutils_function
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
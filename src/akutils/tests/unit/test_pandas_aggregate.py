@@ -0,0 +1,164 @@
+import zipfile
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+from akutils import pandas_aggregate
+
+
+def make_df(nb_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    countries = np.array(["FR", "DE", "IT", None], dtype=object)
+    return pd.DataFrame({
+        "country": rng.choice(countries, nb_rows),
+        "year": rng.integers(2020, 2023, nb_rows),
+        "amount": rng.normal(size=nb_rows).round(2),
+        "customer": rng.integers(0, 5000, nb_rows),
+    })
+
+
+AGGS = {
+    "amount": ["sum", "mean", "min", "max", "count"],
+    "nb_rows": ("amount", "size"),
+}
+
+
+class TestStreamingAggregator():
+
+    @pytest.mark.parametrize("dropna", [True, False])
+    def test_same_as_groupby(self, dropna):
+        df = make_df(10_000)
+        aggregator = ak.StreamingAggregator(["country", "year"], AGGS, dropna=dropna)
+        for start in range(0, len(df), 700):
+            aggregator.update(df.iloc[start:start + 700])
+        df_expected = df.groupby(["country", "year"], dropna=dropna).agg(
+            amount_sum=("amount", "sum"),
+            amount_mean=("amount", "mean"),
+            amount_min=("amount", "min"),
+            amount_max=("amount", "max"),
+            amount_count=("amount", "count"),
+            nb_rows=("amount", "size"),
+        ).reset_index()
+        df_result = aggregator.result().sort_values(["country", "year"])
+        pd.testing.assert_frame_equal(
+            df_result.reset_index(drop=True), df_expected, check_exact=False)
+        assert aggregator.n_rows == len(df)
+
+    def test_nunique_approx(self):
+        df = make_df(50_000)
+        aggregator = ak.StreamingAggregator(
+            "year", {"customers": ("customer", "nunique_approx")})
+        for start in range(0, len(df), 5000):
+            aggregator.update(df.iloc[start:start + 5000])
+        result = aggregator.result().set_index("year")["customers"]
+        expected = df.groupby("year")["customer"].nunique()
+        np.testing.assert_allclose(result.sort_index(), expected, rtol=0.05)
+
+    def test_many_groups(self, monkeypatch):
+        """
+        Buffered partials are merged several times into the state, the registers
+        only hold the non-zero ones
+        """
+        monkeypatch.setattr(pandas_aggregate, "_MIN_REDUCE_SIZE", 1000)
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            "key": rng.integers(0, 5000, 20_000),
+            "amount": rng.normal(size=20_000),
+            "customer": rng.integers(0, 100, 20_000),
+        })
+        aggs = {"amount": ["sum", "min"], "customers": ("customer", "nunique_approx")}
+        aggregator = ak.StreamingAggregator("key", aggs)
+        for start in range(0, len(df), 1000):
+            aggregator.update(df.iloc[start:start + 1000])
+        result = aggregator.result().set_index("key").sort_index()
+        expected = df.groupby("key").agg(
+            amount_sum=("amount", "sum"),
+            amount_min=("amount", "min"),
+            customers=("customer", "nunique"),
+        )
+        pd.testing.assert_frame_equal(result, expected, check_exact=False)
+        keys, _ = aggregator._registers["customer"]
+        assert len(keys) <= len(df)
+
+    def test_merge(self):
+        """
+        Aggregators of separate parts (files, processes) merge into the aggregates
+        of the whole
+        """
+        df = make_df(4000)
+        aggs = {**AGGS, "customers": ("customer", "nunique_approx")}
+        whole = ak.StreamingAggregator("country", aggs).update(df)
+        part_1 = ak.StreamingAggregator("country", aggs).update(df.iloc[:1500])
+        part_2 = ak.StreamingAggregator("country", aggs).update(df.iloc[1500:])
+        pd.testing.assert_frame_equal(
+            part_1.merge(part_2).result().sort_values("country", ignore_index=True),
+            whole.result().sort_values("country", ignore_index=True),
+        )
+
+    def test_string_amounts_converted(self):
+        df = pd.DataFrame(
+            {"key": ["a", "a", "b"], "amount": ["1.5", "x", "2"]}, dtype="string")
+        result = ak.StreamingAggregator("key", {"amount": ["sum", "mean"]}) \
+            .update(df).result()
+        assert result["amount_sum"].tolist() == [1.5, 2.0]
+        assert result["amount_mean"].tolist() == [1.5, 2.0]
+
+    def test_empty(self):
+        aggregator = ak.StreamingAggregator("key", {"amount": "sum"})
+        assert aggregator.result().columns.tolist() == ["key", "amount"]
+
+    def test_invalid_aggregation(self):
+        with pytest.raises(ValueError):
+            ak.StreamingAggregator("key", {"amount": "median"})
+
+
+class TestReadWithAggregate():
+
+    aggregate = {"by": "country", "aggs": {"nb_rows": ("col1", "size"),
+                                           "col1": "sum"}}
+
+    def _expected(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.assign(col1=pd.to_numeric(df["col1"]))
+        return df.groupby("country").agg(
+            nb_rows=("col1", "size"), col1=("col1", "sum")).reset_index()
+
+    def _sort(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.sort_values("country", ignore_index=True)
+
+    def test_read_csv_in_chunks_aggregate(self):
+        file_path = ak.PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+        df = ak.read_csv_in_chunks(
+            file_path, sep=";", chunksize=5, aggregate=self.aggregate)
+        df_expected = self._expected(pd.read_csv(file_path, sep=";", dtype="string"))
+        pd.testing.assert_frame_equal(
+            self._sort(df), df_expected, check_dtype=False)
+
+    def test_read_multiple_csv_from_dir_aggregate(self, tmp_path):
+        (tmp_path / "sales_01.csv").write_text("col1;country\n1;FR\n2;DE\n3;FR\n")
+        (tmp_path / "sales_02.csv").write_text("col1;country\n4;FR\n5;IT\n")
+        df = ak.read_multiple_csv_from_dir(
+            tmp_path, sep=";", chunksize=2, aggregate=self.aggregate)
+        df_expected = pd.DataFrame({
+            "country": ["DE", "FR", "IT"], "nb_rows": [1, 3, 1], "col1": [2, 8, 5]})
+        pd.testing.assert_frame_equal(self._sort(df), df_expected, check_dtype=False)
+
+    def test_read_multiple_csv_from_zip_aggregate(self, tmp_path):
+        zip_path = tmp_path / "sales.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_file:
+            zip_file.writestr("sales_01.csv", "col1;country\n1;FR\n2;DE\n")
+            zip_file.writestr("sales_02.csv", "col1;country\n4;FR\n")
+        df = ak.read_multiple_csv_from_zip(
+            zip_path, sep=";", aggregate=ak.StreamingAggregator(**self.aggregate))
+        df_expected = pd.DataFrame(
+            {"country": ["DE", "FR"], "nb_rows": [1, 2], "col1": [2, 5]})
+        pd.testing.assert_frame_equal(self._sort(df), df_expected, check_dtype=False)
+
+    def test_aggregate_with_sample(self):
+        file_path = ak.PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+        with pytest.raises(ValueError):
+            ak.read_csv_in_chunks(
+                file_path, sep=";", sample=2, aggregate=self.aggregate)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
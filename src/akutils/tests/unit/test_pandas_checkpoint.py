@@ -0,0 +1,229 @@
+import io
+import pytest
+import fsspec  # type: ignore
+import numpy as np
+import pandas as pd
+import akutils as ak
+from fsspec.implementations.local import LocalFileSystem  # type: ignore
+from upath import UPath
+
+
+class _FlakyReader(io.RawIOBase):
+    """
+    Local file raising a transient error on its nth read
+    """
+
+    def __init__(self, file, fail_on_read: int):
+        self.file, self.fail_on_read, self.nb_reads = file, fail_on_read, 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        self.nb_reads += 1
+        if self.nb_reads == self.fail_on_read:
+            raise ConnectionError("injected transient failure")
+        return self.file.readinto(buffer)
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+class FlakyFileSystem(LocalFileSystem):
+    """
+    Local filesystem ("flaky://" protocol) injecting read failures
+    """
+    protocol = "flaky"
+    fail_on_read: dict = {}  # {path: nth read failing}, applies to the next open
+    opened: list = []
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        path = str(path).removeprefix("flaky://").removeprefix("localhost")
+        return super()._strip_protocol(path)
+
+    def _open(self, path, mode="rb", **kwargs):
+        file = super()._open(path, mode, **kwargs)
+        FlakyFileSystem.opened.append(path)
+        fail_on_read = FlakyFileSystem.fail_on_read.pop(path, None)
+        if fail_on_read is None:
+            return file
+        return io.BufferedReader(_FlakyReader(file, fail_on_read), buffer_size=2**16)
+
+
+fsspec.register_implementation("flaky", FlakyFileSystem, clobber=True)
+pytestmark = pytest.mark.filterwarnings("ignore:UPath 'flaky' filesystem")
+
+
+@pytest.fixture
+def flaky_dir(tmp_path):
+    FlakyFileSystem.fail_on_read.clear()
+    FlakyFileSystem.opened.clear()
+    for i in range(3):
+        df = pd.DataFrame({"id": np.arange(i * 100000, (i + 1) * 100000), "file": i})
+        df.to_csv(tmp_path / f"part_{i}.csv", sep=";", index=False)
+    return tmp_path
+
+
+def _expected(dir_path) -> pd.DataFrame:
+    return pd.concat(
+        [pd.read_csv(dir_path / f"part_{i}.csv", sep=";") for i in range(3)],
+        ignore_index=True)
+
+
+class TestRetry():
+
+    def test_read_csv_in_chunks_retry(self, flaky_dir):
+        """
+        The file is reopened after the last completed chunk
+        """
+        path = str(flaky_dir / "part_1.csv")
+        FlakyFileSystem.fail_on_read[path] = 4
+        df = ak.read_csv_in_chunks(
+            f"flaky://localhost{path}", sep=";", dtype=None, chunksize=10000, retries=2,
+            retry_backoff=0)
+        pd.testing.assert_frame_equal(df, pd.read_csv(path, sep=";"))
+        assert FlakyFileSystem.opened == [path, path]
+
+    def test_row_number_after_retry(self, flaky_dir):
+        path = str(flaky_dir / "part_1.csv")
+        FlakyFileSystem.fail_on_read[path] = 4
+        df = ak.read_csv_in_chunks(
+            f"flaky://localhost{path}", sep=";", dtype=None, chunksize=10000, retries=1,
+            retry_backoff=0, add_row_number=True)
+        np.testing.assert_array_equal(df["file_row"], np.arange(100000))
+
+    def test_retry_multiline_quoted_fields(self, tmp_path):
+        """
+        Records spanning several lines (quoted newlines, blank lines) are resumed
+        at the right byte offset
+        """
+        FlakyFileSystem.opened.clear()
+        df_input = pd.DataFrame({
+            "id": np.arange(60000),
+            "text": np.where(np.arange(60000) % 3, "a\n\nb;\"c\"", "plain"),
+        })
+        path = str(tmp_path / "multiline.csv")
+        df_input.to_csv(path, sep=";", index=False)
+        with open(path, "a") as f:
+            f.write("\n\n")
+        FlakyFileSystem.fail_on_read[path] = 4
+        df = ak.read_csv_in_chunks(
+            f"flaky://localhost{path}", sep=";", dtype=None, chunksize=7000, retries=1,
+            retry_backoff=0)
+        pd.testing.assert_frame_equal(df, df_input)
+        assert FlakyFileSystem.opened == [path, path]
+
+    def test_chunk_func_error_not_retried(self, flaky_dir):
+        FlakyFileSystem.opened.clear()
+        path = str(flaky_dir / "part_1.csv")
+
+        def failing_func(df):
+            raise OSError("error of the chunk function")
+
+        with pytest.raises(OSError, match="chunk function"):
+            ak.read_csv_in_chunks(
+                f"flaky://localhost{path}", sep=";", chunksize=10000, retries=2,
+                retry_backoff=0, chunk_func=failing_func)
+        assert FlakyFileSystem.opened == [path]
+
+    def test_unsupported_resume_args(self, flaky_dir):
+        with pytest.raises(ValueError, match="comment"):
+            ak.read_csv_in_chunks(
+                flaky_dir / "part_1.csv", sep=";", retries=1, comment="#")
+
+    def test_no_retry(self, flaky_dir):
+        path = str(flaky_dir / "part_1.csv")
+        FlakyFileSystem.fail_on_read[path] = 4
+        with pytest.raises(ConnectionError):
+            ak.read_csv_in_chunks(f"flaky://localhost{path}", sep=";", chunksize=10000)
+
+
+class TestCheckpoint():
+
+    def test_resume_read_multiple_csv_from_dir(self, flaky_dir, tmp_path_factory):
+        """
+        A rerun loads completed files and chunks from the checkpoint and only reads
+        the rest of the failed file and the following ones
+        """
+        checkpoint_dir = tmp_path_factory.mktemp("checkpoint")
+        dir_path = UPath(f"flaky://localhost{flaky_dir}")
+        failing_file = str(flaky_dir / "part_1.csv")
+        FlakyFileSystem.fail_on_read[failing_file] = 4
+        with pytest.raises(ConnectionError):
+            ak.read_multiple_csv_from_dir(
+                dir_path, sep=";", dtype=None, chunksize=10000,
+                checkpoint=checkpoint_dir)
+        manifest = ak.IngestionCheckpoint(checkpoint_dir).manifest
+        failing_entry = manifest.pop(f"flaky://localhost{failing_file}")
+        assert not failing_entry["done"] and 0 < failing_entry["chunks"] < 10
+        assert all(entry["done"] for entry in manifest.values())
+
+        FlakyFileSystem.opened.clear()
+        df = ak.read_multiple_csv_from_dir(
+            dir_path, sep=";", dtype=None, chunksize=10000, checkpoint=checkpoint_dir)
+        df = df.sort_values("id", ignore_index=True)
+        pd.testing.assert_frame_equal(df, _expected(flaky_dir))
+        # files completed by the first run are not read again
+        files = {str(path) for path in flaky_dir.glob("*.csv")}
+        assert set(FlakyFileSystem.opened) == files - {
+            key.removeprefix("flaky://localhost") for key in manifest}
+
+    def test_resume_at_byte_offset(self, flaky_dir, tmp_path_factory):
+        """
+        The checkpoint records the byte offset following the last record read
+        """
+        checkpoint = ak.IngestionCheckpoint(tmp_path_factory.mktemp("checkpoint"))
+        path = flaky_dir / "part_0.csv"
+        ak.read_csv_in_chunks(
+            path, sep=";", dtype=None, chunksize=30000, nrows=30000,
+            checkpoint=checkpoint)
+        lines = path.read_bytes().splitlines(keepends=True)
+        header_end, offset = checkpoint.resume_offsets(str(path))
+        assert header_end == len(lines[0])
+        assert offset == sum(len(line) for line in lines[:30001])
+
+    def test_modified_file_read_again(self, flaky_dir, tmp_path_factory):
+        checkpoint = ak.IngestionCheckpoint(tmp_path_factory.mktemp("checkpoint"))
+        path = flaky_dir / "part_0.csv"
+        ak.read_csv_in_chunks(path, sep=";", dtype=None, checkpoint=checkpoint)
+        path.write_text("id;file\n1;0\n")
+        df = ak.read_csv_in_chunks(path, sep=";", dtype=None, checkpoint=checkpoint)
+        pd.testing.assert_frame_equal(df, pd.DataFrame({"id": [1], "file": [0]}))
+
+    def test_changed_args_read_again(self, flaky_dir, tmp_path_factory):
+        """
+        Chunks saved with other read arguments or chunk_func are not reused
+        """
+        checkpoint = ak.IngestionCheckpoint(tmp_path_factory.mktemp("checkpoint"))
+        path = flaky_dir / "part_0.csv"
+        ak.read_csv_in_chunks(path, sep=";", dtype=None, checkpoint=checkpoint)
+        df = ak.read_csv_in_chunks(
+            path, sep=";", usecols=["id"], dtype=None, checkpoint=checkpoint)
+        assert df.columns.tolist() == ["id"]
+
+        def first_rows(df):
+            return df.head(2)
+
+        df = ak.read_csv_in_chunks(
+            path, sep=";", usecols=["id"], dtype=None, chunk_func=first_rows,
+            checkpoint=checkpoint)
+        assert len(df) == 2
+        # same arguments: read from the checkpoint
+        FlakyFileSystem.opened.clear()
+        df = ak.read_csv_in_chunks(
+            f"flaky://localhost{path}", sep=";", dtype=None, checkpoint=checkpoint)
+        df = ak.read_csv_in_chunks(
+            f"flaky://localhost{path}", sep=";", dtype=None, checkpoint=checkpoint)
+        assert FlakyFileSystem.opened == [str(path)]
+        pd.testing.assert_frame_equal(df, pd.read_csv(path, sep=";"))
+
+    def test_clear(self, tmp_path):
+        checkpoint = ak.IngestionCheckpoint(tmp_path / "checkpoint")
+        checkpoint.clear()
+        assert not (tmp_path / "checkpoint").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+
+def write_csv(file_path, nb_rows: int, nb_columns: int):
+    df = pd.DataFrame(
+        np.arange(nb_rows * nb_columns).reshape(nb_rows, nb_columns),
+        columns=[f"col_{i}" for i in range(nb_columns)],
+    )
+    df.to_csv(file_path, sep=";", index=False)
+    return df
+
+
+class TestChunkSizer():
+
+    def test_chunks_fit_in_budget(self, tmp_path):
+        """
+        After the probe chunk, each chunk is sized on the measured bytes per row
+        """
+        df = write_csv(tmp_path / "wide.csv", 20_000, 20)
+        sizer = ak.ChunkSizer("1MB", min_rows=10, probe_rows=500)
+        df_read = ak.read_csv_in_chunks(
+            tmp_path / "wide.csv", sep=";", max_chunk_bytes=sizer)
+        pd.testing.assert_frame_equal(df_read, df.astype("string"))
+
+        report = sizer.to_frame()
+        assert report["rows"].sum() == len(df)
+        assert report["chunksize"].iloc[0] == 500
+        assert (report["nbytes"] <= 1.1 * 2**20).all()
+        assert report["chunksize"].iloc[1] == int(2**20 // report["bytes_per_row"][0])
+        assert report["chunk_index"].tolist() == list(range(len(report)))
+
+    def test_narrow_rows_get_bigger_chunks(self, tmp_path):
+        write_csv(tmp_path / "wide.csv", 5000, 40)
+        write_csv(tmp_path / "narrow.csv", 5000, 2)
+        sizes = {}
+        for name in ("wide", "narrow"):
+            sizer = ak.ChunkSizer("256KB", min_rows=10, probe_rows=100)
+            ak.read_csv_in_chunks(
+                tmp_path / f"{name}.csv", sep=";", max_chunk_bytes=sizer)
+            sizes[name] = sizer.next_size()
+        assert sizes["narrow"] > 10 * sizes["wide"]
+
+    def test_shared_across_files(self, tmp_path):
+        write_csv(tmp_path / "part_01.csv", 3000, 5)
+        write_csv(tmp_path / "part_02.csv", 3000, 5)
+        sizer = ak.ChunkSizer("64KB", min_rows=10, probe_rows=100)
+        df = ak.read_multiple_csv_from_dir(tmp_path, sep=";", max_chunk_bytes=sizer)
+        assert len(df) == 6000
+        report = sizer.to_frame()
+        assert report["source"].nunique() == 2
+        # the second file starts with the size learned on the first one
+        second_file = report[report["source"] == report["source"].iloc[-1]]
+        assert second_file["chunksize"].iloc[0] > 100
+
+    def test_bounds(self):
+        sizer = ak.ChunkSizer(10**6, min_rows=100, max_rows=1000)
+        sizer.bytes_per_row = 10**5
+        assert sizer.next_size() == 100
+        sizer.bytes_per_row = 1
+        assert sizer.next_size() == 1000
+        with pytest.raises(ValueError):
+            ak.ChunkSizer(0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
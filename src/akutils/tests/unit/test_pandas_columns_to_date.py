@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+
+class TestColumnsToDate():
+
+    values = [
+        "2024-01-31", "31/01/2024", "45322", "2024-02-29 10:00:00", "bad", None,
+        "29/02/2024", "45351.75",
+    ]
+    expected = pd.to_datetime(pd.Series([
+        "2024-01-31", "2024-01-31", "2024-01-31", "2024-02-29", None, None,
+        "2024-02-29", "2024-02-29",
+    ])).to_numpy()
+
+    def test_single_format_unchanged(self):
+        df = pd.DataFrame({"c1": self.values})
+        ak.columns_to_date(df, ["c1"], keep_source=True)
+        assert df["c1_dt"].notna().tolist() == [
+            True, False, False, True, False, False, False, False]
+
+    @pytest.mark.parametrize("dtype_backend", [None, "pyarrow"])
+    def test_cascade(self, dtype_backend):
+        df = pd.DataFrame({"c1": self.values})
+        df, report = ak.columns_to_date(
+            df, ["c1"], date_format=["%Y-%m-%d", "%d/%m/%Y", "excel"],
+            dtype_backend=dtype_backend, return_report=True)
+        result = df["c1"].astype("datetime64[ns]").to_numpy()
+        np.testing.assert_array_equal(result, self.expected)
+        assert report.formats == {"c1": ["%Y-%m-%d", "%d-%m-%Y", "excel"]}
+        assert report.hits == {"c1": {"%Y-%m-%d": 2, "%d-%m-%Y": 2, "excel": 2}}
+        assert report.nb_unparsed == {"c1": 1}
+        assert report.to_frame().loc["c1"].tolist() == [2, 2, 2, 1]
+
+    def test_later_formats_only_see_leftovers(self):
+        # 01/02/2024 is parsed by the first format only: no second parse as m/d
+        df = pd.DataFrame({"c1": ["01/02/2024", "13/02/2024", "02/13/2024"]})
+        df, report = ak.columns_to_date(
+            df, ["c1"], date_format=["%d/%m/%Y", "%m/%d/%Y"], return_report=True)
+        assert df["c1"].tolist() == [
+            pd.Timestamp("2024-02-01"), pd.Timestamp("2024-02-13"),
+            pd.Timestamp("2024-02-13")]
+        assert report.hits["c1"] == {"%d-%m-%Y": 2, "%m-%d-%Y": 1}
+
+    def test_auto(self):
+        df = pd.DataFrame({
+            "c1": self.values * 50,
+            "c2": ["20240131", "20240229", None, "20240301"] * 100,
+        })
+        df, report = ak.columns_to_date(
+            df, ["c1", "c2"], date_format="auto", return_report=True)
+        np.testing.assert_array_equal(
+            df["c1"].to_numpy(), np.tile(self.expected, 50))
+        assert sorted(report.formats["c1"]) == sorted(
+            ["%Y-%m-%d", "%d-%m-%Y", "excel"])
+        assert report.formats["c2"] == ["%Y%m%d"]
+        assert report.nb_unparsed == {"c1": 50, "c2": 0}
+
+    def test_auto_single_day_month_order(self, capsys):
+        """
+        Ambiguous values follow the day/month order of the column
+        """
+        df = pd.DataFrame({"c1": ["01/02/2024", "02/13/2024"] * 10})
+        df, report = ak.columns_to_date(
+            df, ["c1"], date_format="auto", return_report=True)
+        assert df["c1"].tolist()[:2] == [
+            pd.Timestamp("2024-01-02"), pd.Timestamp("2024-02-13")]
+        assert report.formats["c1"] == ["%m-%d-%Y"]
+        assert "day/month" not in capsys.readouterr().out
+
+        df = pd.DataFrame({"c1": ["01/02/2024", "13/02/2024", "02/13/2024"] * 10})
+        df = ak.columns_to_date(df, ["c1"], date_format="auto")
+        assert df["c1"].tolist()[:3] == [
+            pd.Timestamp("2024-02-01"), pd.Timestamp("2024-02-13"), pd.NaT]
+        assert "day/month orders" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("dtype_backend", [None, "pyarrow"])
+    def test_auto_mixed_year_lengths(self, dtype_backend):
+        """
+        4-digit years are not cut into 2-digit ones by "%d-%m-%y"
+        """
+        df = pd.DataFrame({"c1": ["15/01/24", "16/01/24", "15/01/2024 10:00"] * 10})
+        df, report = ak.columns_to_date(
+            df, ["c1"], date_format="auto", dtype_backend=dtype_backend,
+            return_report=True)
+        assert df["c1"].astype("datetime64[ns]").tolist()[:3] == [
+            pd.Timestamp("2024-01-15"), pd.Timestamp("2024-01-16"),
+            pd.Timestamp("2024-01-15")]
+        assert report.formats["c1"] == ["%d-%m-%Y", "%d-%m-%y"]
+        assert report.nb_unparsed == {"c1": 0}
+
+    def test_report_single_format(self):
+        df = pd.DataFrame({"c1": self.values})
+        _, report = ak.columns_to_date(df, ["c1"], return_report=True)
+        assert report.hits == {"c1": {"%Y-%m-%d": 2}}
+        assert report.nb_unparsed == {"c1": 5}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
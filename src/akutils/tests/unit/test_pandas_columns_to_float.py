@@ -114,6 +114,32 @@ class TestColumnsToFloat():
         ak.columns_to_float(df_input, columns, keep_source=True)
         pd.testing.assert_frame_equal(df_input, df_expected)
 
+    def test_columns_to_float_pyarrow(self):
+        """
+        Arrow compute path gives the same values as the numpy path
+        """
+        columns = ["c1", "c2", "c3", "c4"]
+        data = [
+            ["1", "2,1", "2.01%", "1 000"],
+            ["A", "2.22", "3", "21.2"],
+            ["2.1", None, "test", ""]
+        ]
+        df_input = pd.DataFrame(data=data, columns=columns)
+        df_expected = ak.columns_to_float(df_input.copy(), columns)
+        df = ak.columns_to_float(df_input, columns, dtype_backend="pyarrow")
+        for column in columns:
+            assert df[column].dtype == "double[pyarrow]"
+        pd.testing.assert_frame_equal(df.astype(float), df_expected)
+
+    def test_columns_to_float_pyarrow_mixed_types(self):
+        """
+        Object columns of mixed types (str, int, float) are read as text by Arrow
+        """
+        df_input = pd.DataFrame({"c1": ["1,5", 2, None, 3.25, "x"]})
+        df_expected = ak.columns_to_float(df_input.copy(), ["c1"])
+        df = ak.columns_to_float(df_input, ["c1"], dtype_backend="pyarrow")
+        pd.testing.assert_frame_equal(df.astype(float), df_expected)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
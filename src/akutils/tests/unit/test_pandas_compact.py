@@ -0,0 +1,94 @@
+import json
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+from akutils.pandas_compact import JOURNAL_NAME
+
+
+def write_parts(dir_path, nb_files: int, rows_per_file: int = 100):
+    rng = np.random.default_rng(0)
+    parts = []
+    for i in range(nb_files):
+        df = pd.DataFrame({
+            "id": np.arange(i * rows_per_file, (i + 1) * rows_per_file),
+            "value": rng.normal(size=rows_per_file),
+        })
+        if i % 2:  # schema drift: an extra column in odd files
+            df["comment"] = "odd"
+        df.to_parquet(dir_path / f"part-{i:04d}.parquet", index=False)
+        parts.append(df)
+    return pd.concat(parts, ignore_index=True)
+
+
+class TestCompactParquetDir():
+
+    def test_compact(self, tmp_path):
+        df = write_parts(tmp_path, 40)
+        report = ak.compact_parquet_dir(tmp_path, target_file_size="20KB", sort_by="id")
+        files = sorted(
+            tmp_path.glob("*.parquet"), key=lambda path: int(path.stem.rsplit("-")[-1]))
+        assert report.files_before == 40
+        assert report.files_after == len(files) < 10
+        assert report.rows == len(df)
+        # no staging directory or journal left
+        assert sorted(tmp_path.iterdir()) == sorted(files)
+
+        df_read = pd.concat([pd.read_parquet(path) for path in files])
+        # rows of even files: comment filled with nulls
+        pd.testing.assert_frame_equal(
+            df_read.reset_index(drop=True).fillna({"comment": ""}),
+            df.sort_values("id", ignore_index=True).fillna({"comment": ""}),
+            check_like=True)
+
+    def test_big_files_untouched(self, tmp_path):
+        write_parts(tmp_path, 3)
+        report = ak.compact_parquet_dir(tmp_path, target_file_size=100)
+        assert report.files_before == 0
+        assert len(list(tmp_path.glob("*.parquet"))) == 3
+
+    def test_incompatible_types(self, tmp_path):
+        pd.DataFrame({"code": [1, 2]}).to_parquet(tmp_path / "part-0.parquet")
+        pd.DataFrame({"code": ["A3"]}).to_parquet(tmp_path / "part-1.parquet")
+        report = ak.compact_parquet_dir(tmp_path)
+        assert report.files_after == 1
+        df = pd.read_parquet(next(tmp_path.glob("*.parquet")))
+        assert sorted(df["code"]) == ["1", "2", "A3"]
+
+    def test_orphan_staging_removed(self, tmp_path):
+        """
+        The staging directory of a run interrupted before its journal was written
+        is removed, the files are left as they were
+        """
+        write_parts(tmp_path, 3)
+        staging = tmp_path / "_compaction-abcd"
+        staging.mkdir()
+        (staging / "compacted-abcd-0.parquet").write_bytes(b"partial")
+        ak.compact_parquet_dir(tmp_path, target_file_size=100)
+        assert not staging.exists()
+        assert len(list(tmp_path.glob("*.parquet"))) == 3
+
+    def test_interrupted_swap_recovered(self, tmp_path):
+        """
+        A swap interrupted after the journal was written is finished by the next
+        call: staged files moved in, old files deleted
+        """
+        write_parts(tmp_path, 4)
+        staging = tmp_path / "_compaction-abcd"
+        staging.mkdir()
+        df = pd.concat(
+            [pd.read_parquet(path) for path in sorted(tmp_path.glob("*.parquet"))])
+        df.to_parquet(staging / "compacted-abcd-0.parquet")
+        old = [path.name for path in sorted(tmp_path.glob("*.parquet"))]
+        # first file already deleted when the job stopped
+        (tmp_path / old[0]).unlink()
+        (tmp_path / JOURNAL_NAME).write_text(json.dumps(
+            {"token": "abcd", "old": old, "new": ["compacted-abcd-0.parquet"]}))
+
+        ak.compact_parquet_dir(tmp_path)
+        assert [path.name for path in tmp_path.iterdir()] == [
+            "compacted-abcd-0.parquet"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
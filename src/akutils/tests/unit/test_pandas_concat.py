@@ -0,0 +1,79 @@
+import pytest
+import pandas as pd
+import numpy as np
+import akutils as ak
+
+
+class TestConcatDataframes():
+
+    df_1 = pd.DataFrame({"month": [1, 1], "nb_sales": [1, 2], "country": ["a", "b"]})
+    df_2 = pd.DataFrame({"month": [2], "country": ["c"], "channel": ["web"]})
+
+    def test_concat_dataframes_same_schema(self):
+        """
+        Same result as pd.concat when all schemas match
+        """
+        df_expected = pd.concat([self.df_1, self.df_1], ignore_index=True)
+        df, report = ak.concat_dataframes(
+            [self.df_1, self.df_1], return_report=True)
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert not report.has_drift
+
+    def test_concat_dataframes_fill(self):
+        """
+        Union of schemas, missing values filled and int upcasted like pd.concat
+        """
+        df_expected = pd.concat([self.df_1, self.df_2], ignore_index=True)
+        df, report = ak.concat_dataframes(
+            [self.df_1, self.df_2], sources=["jan", "feb"], return_report=True)
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert report.missing == {"feb": ["nb_sales"]}
+        assert report.extra == {"feb": ["channel"]}
+        assert list(report.to_frame()["issue"]) == ["missing", "extra"]
+
+    def test_concat_dataframes_drop(self):
+        """
+        Columns not shared by every DataFrame are dropped
+        """
+        df = ak.concat_dataframes(
+            [self.df_1, self.df_2], missing_columns="drop", extra_columns="drop")
+        df_expected = pd.DataFrame({"month": [1, 1, 2], "country": ["a", "b", "c"]})
+        pd.testing.assert_frame_equal(df, df_expected)
+
+    def test_concat_dataframes_error(self):
+        with pytest.raises(ValueError):
+            ak.concat_dataframes([self.df_1, self.df_2], extra_columns="error")
+        with pytest.raises(ValueError):
+            ak.concat_dataframes([self.df_1, self.df_2], missing_columns="error")
+
+    def test_concat_dataframes_duplicated_columns(self):
+        df_dup = pd.DataFrame([[1, 2]], columns=["month", "month"])
+        with pytest.raises(ValueError, match="Duplicated column names in feb"):
+            ak.concat_dataframes([self.df_1, df_dup], sources=["jan", "feb"])
+
+    def test_concat_dataframes_extension_dtype_and_normalization(self):
+        """
+        Column names are normalized and extension dtypes are preserved
+        """
+        df_1 = pd.DataFrame({" Country": ["a"], "Nb Sales": [1]}, dtype="string")
+        df_2 = pd.DataFrame({"country": ["b", None]}, dtype="string")
+        df, report = ak.concat_dataframes(
+            [df_1, df_2], normalize_columns=True, return_report=True)
+        df_expected = pd.DataFrame(
+            {"country": ["a", "b", None], "nb_sales": ["1", None, None]},
+            dtype="string"
+        )
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert report.renamed["file_1"] == {
+            " Country": "country", "Nb Sales": "nb_sales"}
+
+    def test_concat_dataframes_upcast(self):
+        df_1 = pd.DataFrame({"c1": [1, 2]})
+        df_2 = pd.DataFrame({"c1": [0.5]})
+        df, report = ak.concat_dataframes([df_1, df_2], return_report=True)
+        assert df["c1"].dtype == np.float64
+        assert report.upcast == {"c1": {"file_1": "int64", "file_2": "float64"}}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+
+class TestRowDeduplicator():
+
+    chunks = [
+        pd.DataFrame({"id": [1, 2, 2, 3], "value": ["a", "b", "b", "c"]}),
+        pd.DataFrame({"id": [3, 4, 1], "value": ["c", "d", "z"]}, index=[4, 5, 6]),
+        pd.DataFrame({"id": [5, 4], "value": ["e", "d"]}, index=[7, 8]),
+    ]
+
+    def _run(self, deduplicator: ak.RowDeduplicator) -> pd.DataFrame:
+        filtered = [deduplicator.filter(chunk) for chunk in self.chunks]
+        return pd.concat(deduplicator.finalize(filtered))
+
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    @pytest.mark.parametrize("subset", [None, ["id"]])
+    def test_same_as_drop_duplicates(self, keep, subset):
+        """
+        Streaming deduplication gives the same rows as drop_duplicates on the
+        concatenated frame
+        """
+        df_expected = pd.concat(self.chunks).drop_duplicates(subset=subset, keep=keep)
+        deduplicator = ak.RowDeduplicator(subset=subset, keep=keep)
+        df = self._run(deduplicator)
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert deduplicator.n_rows == 9
+        assert deduplicator.n_dropped == 9 - len(df_expected)
+
+    def test_spill_to_disk(self, tmp_path):
+        """
+        Seen hashes are spilled to disk past the memory budget, without changing
+        the result
+        """
+        df_expected = pd.concat(self.chunks).drop_duplicates()
+        deduplicator = ak.RowDeduplicator(max_memory=0, spill_dir=tmp_path)
+        df = self._run(deduplicator)
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert len(list(tmp_path.glob("*.npy"))) == len(self.chunks)
+
+    def test_spill_pending_keep_last(self, tmp_path):
+        df_expected = pd.concat(self.chunks).drop_duplicates(keep="last")
+        deduplicator = ak.RowDeduplicator(keep="last", max_memory=0, spill_dir=tmp_path)
+        df = self._run(deduplicator)
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert len(list(tmp_path.glob("*.npy"))) > 0
+
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    def test_many_chunks(self, keep):
+        """
+        Seen hashes merged incrementally over many chunks
+        """
+        rng = np.random.default_rng(0)
+        df_input = pd.DataFrame({"id": rng.integers(0, 500, 3000)})
+        deduplicator = ak.RowDeduplicator(keep=keep)
+        filtered = [
+            deduplicator.filter(df_input.iloc[start: start + 37])
+            for start in range(0, len(df_input), 37)
+        ]
+        df = pd.concat(deduplicator.finalize(filtered))
+        pd.testing.assert_frame_equal(df, df_input.drop_duplicates(keep=keep))
+
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    def test_64_bits_collision(self, keep, monkeypatch):
+        """
+        Different rows with the same first 64 bits hash are not duplicates
+        """
+        hash_rows = ak.RowDeduplicator.hash_rows
+
+        def colliding_hash_rows(self, df):
+            keys = hash_rows(self, df)
+            keys[0] = 0
+            return keys
+
+        monkeypatch.setattr(ak.RowDeduplicator, "hash_rows", colliding_hash_rows)
+        df_expected = pd.concat(self.chunks).drop_duplicates(keep=keep)
+        df = self._run(ak.RowDeduplicator(keep=keep))
+        pd.testing.assert_frame_equal(df, df_expected)
+
+    def test_column_order_and_dtype(self):
+        """
+        The same row read with another column order or dtype is a duplicate
+        """
+        deduplicator = ak.RowDeduplicator()
+        df_1 = pd.DataFrame({"id": [1, 2], "value": ["a", None]})
+        df_2 = pd.DataFrame({
+            "value": pd.array(["a", pd.NA, "c"], dtype="string[pyarrow]"),
+            "id": [1.0, 2.0, 2.5],
+        })
+        assert len(deduplicator.filter(df_1)) == 2
+        assert deduplicator.filter(df_2)["id"].tolist() == [2.5]
+
+    def test_invalid_keep(self):
+        with pytest.raises(ValueError):
+            ak.RowDeduplicator(keep=False)
+
+
+class TestReadWithDeduplicate():
+
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    def test_read_multiple_csv_from_dir_deduplicate(self, tmp_path, keep):
+        """
+        Rows duplicated within and across files are dropped while reading
+        """
+        (tmp_path / "drop_01.csv").write_text("id;value\n1;a\n2;b\n2;b\n3;c\n")
+        (tmp_path / "drop_02.csv").write_text("id;value\n3;c\n4;d\n1;a\n")
+        df = ak.read_multiple_csv_from_dir(
+            tmp_path,
+            sep=";",
+            chunksize=2,
+            deduplicate=ak.RowDeduplicator(keep=keep))
+        df = df.sort_values("id").reset_index(drop=True)
+        df_expected = pd.DataFrame(
+            {"id": ["1", "2", "3", "4"], "value": ["a", "b", "c", "d"]},
+            dtype="string")
+        pd.testing.assert_frame_equal(df, df_expected)
+
+    def test_read_csv_in_chunks_deduplicate(self):
+        file_path = ak.PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+        df_expected = pd.read_csv(file_path, sep=";", dtype="string")
+        df_expected = df_expected.drop_duplicates(subset=["country"])
+        df = ak.read_csv_in_chunks(
+            file_path,
+            sep=";",
+            chunksize=5,
+            deduplicate=ak.RowDeduplicator(subset=["country"]))
+        pd.testing.assert_frame_equal(df, df_expected.reset_index(drop=True))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
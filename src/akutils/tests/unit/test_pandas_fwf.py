@@ -0,0 +1,168 @@
+import gzip
+import io
+import zipfile
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+LAYOUT = {
+    "id": (0, 4),
+    "country": (5, 15),
+    "qty": (15, 20, "Int64"),
+    "amount": (21, 27, "float64"),
+    "date": (28, 38, "datetime64[ns]"),
+}
+LINES = [
+    "A001 France    +0012   1.50 2024-01-31",
+    "A002 Germany   -0003        2024-02-01",
+    "A003 Spain",
+    "A004 France    00007 -12.25 2024-03-15",
+]
+
+
+def write_fwf(file_path, lines=LINES, newline="\n"):
+    file_path.write_bytes((newline.join(lines) + newline).encode())
+    return file_path
+
+
+def expected_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": pd.array(["A001", "A002", "A003", "A004"], dtype="string"),
+        "country": pd.array(["France", "Germany", "Spain", "France"], dtype="string"),
+        "qty": pd.array([12, -3, None, 7], dtype="Int64"),
+        "amount": [1.5, np.nan, np.nan, -12.25],
+        "date": pd.to_datetime(["2024-01-31", "2024-02-01", "NaT", "2024-03-15"]),
+    })
+
+
+class TestReadFwfInChunks():
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_layout_types(self, tmp_path, newline):
+        """
+        Fields are sliced, trimmed and cast, short lines are padded with blanks
+        """
+        file_path = write_fwf(tmp_path / "data.txt", newline=newline)
+        df = ak.read_fwf_in_chunks(file_path, LAYOUT, chunksize=3)
+        pd.testing.assert_frame_equal(df, expected_df())
+
+    def test_matches_pd_read_fwf(self, tmp_path):
+        lines = [f"{i:>6}{'abcdefghij'[i % 10] * (i % 7):<8}{i / 8:>9}"
+                 for i in range(1000)]
+        file_path = write_fwf(tmp_path / "data.txt", lines)
+        layout = {"id": (0, 6, "int64"), "code": (6, 14), "value": (14, 23, "float64")}
+        df = ak.read_fwf_in_chunks(file_path, layout, chunksize=128)
+        df_pandas = pd.read_fwf(
+            file_path, colspecs=[spec[:2] for spec in layout.values()],
+            names=list(layout), dtype={"code": "string"}, header=None)
+        pd.testing.assert_frame_equal(df, df_pandas)
+
+    def test_dtype_argument_and_backends(self, tmp_path):
+        file_path = write_fwf(tmp_path / "data.txt")
+        df = ak.read_fwf_in_chunks(
+            file_path, LAYOUT, dtype={"country": "category", "qty": "float64"})
+        assert isinstance(df["country"].dtype, pd.CategoricalDtype)
+        assert df["qty"].dtype == "float64"
+
+        df = ak.read_fwf_in_chunks(file_path, LAYOUT, dtype_backend="pyarrow")
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+        assert df["qty"].tolist()[:2] == [12, -3]
+
+        df = ak.read_fwf_in_chunks(file_path, LAYOUT, dtype_backend="numpy_nullable")
+        assert df["amount"].dtype == "Float64"
+
+    def test_invalid_field_names_the_column(self, tmp_path):
+        file_path = write_fwf(tmp_path / "data.txt", ["A001 France    12x45"])
+        with pytest.raises(ValueError, match="Column 'qty'"):
+            ak.read_fwf_in_chunks(file_path, LAYOUT)
+        with pytest.raises(ValueError, match="Invalid layout of 'id'"):
+            ak.read_fwf_in_chunks(file_path, {"id": (4, 2)})
+
+    def test_record_length_ebcdic(self):
+        """
+        Records without line terminator, in a single byte encoding other than utf-8
+        """
+        records = ["0001Zürich    ", "0002Genève    ", "0003          "]
+        data = io.BytesIO("".join(records).encode("cp500"))
+        df = ak.read_fwf_in_chunks(
+            data, [("id", 0, 4, "int32"), ("city", 4, 14)], record_length=14,
+            encoding="cp500", chunksize=2)
+        assert df["id"].tolist() == [1, 2, 3]
+        assert df["city"].tolist() == ["Zürich", "Genève", pd.NA]
+
+    def test_chunk_func_skiprows_nrows_row_number(self, tmp_path):
+        file_path = write_fwf(tmp_path / "data.txt", ["HEADER"] + LINES)
+
+        def filter_country(df, country):
+            return df[df["country"] == country]
+
+        df = ak.read_fwf_in_chunks(
+            file_path, LAYOUT, skiprows=1, chunksize=2, chunk_func=filter_country,
+            chunk_func_kwarg={"country": "France"}, add_row_number=True)
+        assert df["id"].tolist() == ["A001", "A004"]
+        assert df["file_row"].tolist() == [0, 3]
+
+        df = ak.read_fwf_in_chunks(file_path, LAYOUT, skiprows=1, nrows=2)
+        assert df["id"].tolist() == ["A001", "A002"]
+
+    def test_gzip_and_chunk_sizer(self, tmp_path):
+        lines = [f"{i:08d}{'x' * 40}" for i in range(5000)]
+        file_path = tmp_path / "data.txt.gz"
+        file_path.write_bytes(gzip.compress(("\n".join(lines) + "\n").encode()))
+        sizer = ak.ChunkSizer("64KB", min_rows=100, probe_rows=500)
+        df = ak.read_fwf_in_chunks(
+            file_path, {"id": (0, 8, "int64"), "text": (8, 48)},
+            max_chunk_bytes=sizer)
+        assert df["id"].tolist() == list(range(5000))
+        assert sizer.to_frame()["rows"].sum() == 5000
+        assert sizer.to_frame()["chunksize"].iloc[0] == 500
+
+    def test_aggregate(self, tmp_path):
+        file_path = write_fwf(tmp_path / "data.txt")
+        df = ak.read_fwf_in_chunks(
+            file_path, LAYOUT, chunksize=2,
+            aggregate={"by": "country", "aggs": {"qty": "sum"}})
+        result = df.set_index("country")["qty"]
+        assert result.to_dict() == {"France": 19, "Germany": -3, "Spain": 0}
+
+    def test_empty_file(self, tmp_path):
+        file_path = write_fwf(tmp_path / "empty.txt", [], newline="")
+        df = ak.read_fwf_in_chunks(file_path, LAYOUT)
+        assert list(df.columns) == list(LAYOUT) and len(df) == 0
+        assert df["qty"].dtype == "Int64"
+
+
+class TestReadMultipleFwf():
+
+    def test_read_multiple_fwf_from_dir(self, tmp_path):
+        write_fwf(tmp_path / "a.txt", LINES[:2])
+        write_fwf(tmp_path / "b.dat", LINES[2:])
+        write_fwf(tmp_path / "c.csv", LINES)
+        df = ak.read_multiple_fwf_from_dir(tmp_path, LAYOUT, add_source=True)
+        df = df.sort_values("id", ignore_index=True)  # files in listing order
+        pd.testing.assert_frame_equal(df.drop(columns="file_source"), expected_df())
+        assert df["file_source"].tolist() == ["a.txt"] * 2 + ["b.dat"] * 2
+
+    def test_read_multiple_fwf_from_dir_deduplicate(self, tmp_path):
+        write_fwf(tmp_path / "a.txt", LINES)
+        write_fwf(tmp_path / "b.txt", LINES)
+        df = ak.read_multiple_fwf_from_dir(tmp_path, LAYOUT, deduplicate=True)
+        pd.testing.assert_frame_equal(df, expected_df())
+
+    @pytest.mark.parametrize(
+        "compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_read_multiple_fwf_from_zip(self, tmp_path, compression):
+        zip_path = tmp_path / "extract.zip"
+        with zipfile.ZipFile(zip_path, "w", compression=compression) as zip_ref:
+            zip_ref.writestr("a.txt", "\n".join(LINES[:2]) + "\n")
+            zip_ref.writestr("b.txt", "\n".join(LINES[2:]))
+            zip_ref.writestr("readme.md", "not a fixed-width file")
+        df = ak.read_multiple_fwf_from_zip(
+            zip_path, LAYOUT, add_source="category", chunksize=1)
+        pd.testing.assert_frame_equal(df.drop(columns="file_source"), expected_df())
+        assert df["file_source"].tolist() == ["a.txt"] * 2 + ["b.txt"] * 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
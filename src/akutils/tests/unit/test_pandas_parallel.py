@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+import akutils.pandas_parallel as pandas_parallel
+from akutils.pandas_parallel import RowBlockExecutor
+
+
+def make_df(nb_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    amounts = rng.choice(np.array(
+        ["1 234,5", "12%", "3.5", "-7", "abc", "", None, "1 000"],
+        dtype=object), nb_rows)
+    dates = rng.choice(np.array(
+        ["2024-01-31", "31/01/2024", "2024/02/29 10:00:00", "bad", None], dtype=object),
+        nb_rows)
+    return pd.DataFrame({
+        "amount": pd.Series(amounts, dtype=object),
+        "quantity": pd.Series(amounts, dtype="string"),
+        "date": pd.Series(dates, dtype="string"),
+    })
+
+
+class TestRowBlockExecutor():
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        monkeypatch.setattr(pandas_parallel, "MIN_BLOCK_ROWS", 100)
+
+    @pytest.mark.parametrize("keep_source", [False, True])
+    def test_same_result_as_single_process(self, keep_source):
+        df = make_df(2000)
+        expected = df.copy()
+        ak.columns_to_float(expected, ["amount"], keep_source=keep_source)
+        ak.columns_to_int(expected, ["quantity"], keep_source=keep_source)
+        ak.columns_to_date(
+            expected, ["date"], date_format="%Y-%m-%d", keep_source=keep_source)
+
+        ak.columns_to_float(df, ["amount"], keep_source=keep_source, n_jobs=2)
+        ak.columns_to_int(df, ["quantity"], keep_source=keep_source, n_jobs=2)
+        ak.columns_to_date(
+            df, ["date"], date_format="%Y-%m-%d", keep_source=keep_source, n_jobs=2)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_blocks_reassembled_in_order(self):
+        strings = np.array([str(i) for i in range(1000)])
+        with RowBlockExecutor(n_jobs=2) as executor:
+            values = executor.map(pd.to_numeric, strings)
+            assert executor._pool is not None
+            # no fork of a process running pyarrow threads
+            assert executor._pool._mp_context.get_start_method() == "spawn"
+        np.testing.assert_array_equal(values, np.arange(1000))
+
+    def test_small_frame_not_shipped(self):
+        with RowBlockExecutor(n_jobs=2) as executor:
+            executor.map(pd.to_numeric, np.array(["1", "2"]))
+            assert executor._pool is None
+
+    def test_n_jobs(self):
+        assert RowBlockExecutor(n_jobs=-1).n_jobs >= 1
+        with pytest.raises(ValueError):
+            RowBlockExecutor(n_jobs=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
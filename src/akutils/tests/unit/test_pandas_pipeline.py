@@ -0,0 +1,77 @@
+import pytest
+import pandas as pd
+import numpy as np
+import akutils as ak
+from akutils import PATH_TO_AKUTILS_PKG
+
+
+class TestCleaningPipeline():
+
+    steps = [
+        {"op": "strip"},
+        {"op": "remove_accent", "cols": ["c1", "c2"]},
+        {"op": "capitalise", "cols": ["c1", "c3"]},
+        {"op": "to_float", "col_list": ["c4"]},
+        {"op": "strip", "cols": ["c2"]},
+    ]
+    data = {
+        "c1": ["  Éléphant ", None, "çà ", np.nan],
+        "c2": [" ab ", "  ", None, "é "],
+        "c3": [1, 2, None, 4],
+        "c4": [" 1,5", "2%", None, "x"],
+    }
+
+    @staticmethod
+    def _run_sequentially(df: pd.DataFrame) -> pd.DataFrame:
+        df = ak.strip_columns(df)
+        df = ak.remove_accent_from_cols(df, ["c1", "c2"])
+        df = ak.capitalise_cols(df, ["c1", "c3"])
+        df = ak.columns_to_float(df, ["c4"])
+        return ak.strip_columns(df, ["c2"])
+
+    @pytest.mark.parametrize("dtype", [None, "string", "string[pyarrow]"])
+    def test_pipeline_same_result_as_sequential_steps(self, dtype):
+        df_input = pd.DataFrame(self.data)
+        if dtype:
+            df_input = df_input.astype({"c1": dtype, "c2": dtype})
+        df_expected = self._run_sequentially(df_input.copy())
+        df = ak.CleaningPipeline(self.steps)(df_input.copy())
+        pd.testing.assert_frame_equal(df, df_expected)
+
+    def test_pipeline_explain(self):
+        pipeline = ak.CleaningPipeline(self.steps)
+        assert len(pipeline.stages) == 3
+        assert pipeline.explain().splitlines() == [
+            "Stage 1: fused, single write back per column",
+            "    *: strip",
+            "    c1: remove_accent -> capitalise",
+            "    c2: remove_accent",
+            "    c3: capitalise",
+            "Stage 2: to_float(col_list=['c4'])",
+            "Stage 3: fused, single write back per column",
+            "    c2: strip",
+        ]
+
+    def test_pipeline_from_yaml_as_chunk_func(self, tmp_path):
+        yaml_path = tmp_path / "pipeline.yaml"
+        yaml_path.write_text(
+            "steps:\n"
+            "  - op: capitalise\n"
+            "    cols: [country]\n"
+            "  - op: to_int\n"
+            "    col_list: [col1]\n"
+        )
+        pipeline = ak.CleaningPipeline.from_yaml(yaml_path)
+        with pytest.raises(ValueError):
+            ak.CleaningPipeline([{"op": "unknown"}])
+        file_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+        df = ak.read_csv_in_chunks(
+            file_path, sep=";", chunksize=5, chunk_func=pipeline)
+        df_expected = pd.read_csv(file_path, sep=";", dtype="string")
+        df_expected["country"] = df_expected["country"].str.upper().astype(object)
+        df_expected["col1"] = df_expected["col1"].astype(int)
+        pd.testing.assert_frame_equal(df, df_expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,123 @@
+import pytest
+import pandas as pd
+import numpy as np
+import akutils as ak
+from akutils.pandas_profile import get_column_profile
+
+
+class TestProfileDf():
+
+    df_input = pd.DataFrame({
+        "c1": ["1,5", "2", None, "2"],
+        "c2": ["Éa", "", "b", "b"],
+        "c3": [np.nan, np.nan, np.nan, np.nan],
+        "c4": ["", "", "", ""],
+        "c5": ["2024-01-01", "2024/02/01", "", None],
+        "c6": [1.0, np.nan, 3.0, 4.0],
+    })
+
+    def test_profile_df(self):
+        df = self.df_input.copy()
+        profile = ak.profile_df(df)
+        c1, c2, c3 = (profile.columns[col] for col in ["c1", "c2", "c3"])
+        assert (c1.null_count, c1.empty_count, c1.cardinality) == (1, 0, 2)
+        assert (c1.min, c1.max, c1.shape, c1.is_ascii) == ("1,5", "2", "numeric", True)
+        assert (c2.empty_count, c2.is_ascii, c2.shape) == (1, False, "string")
+        assert c3.is_empty and profile.columns["c4"].is_empty
+        assert profile.columns["c5"].shape == "date"
+        assert (profile.columns["c6"].null_count, profile.columns["c6"].max) == (1, 4.)
+        assert ak.get_profile(df) is profile
+        assert len(profile.to_frame()) == len(df.columns)
+
+    def test_profile_df_not_propagated(self):
+        """
+        The profile only applies to the profiled frame, not to derived frames
+        """
+        df = self.df_input.copy()
+        ak.profile_df(df)
+        assert ak.get_profile(df.fillna(0)) is None
+        ak.invalidate_profile(df, ["c1"])
+        assert "c1" not in ak.get_profile(df).columns
+
+    def test_remove_empty_cols_from_df(self):
+        df = ak.remove_empty_cols_from_df(self.df_input.copy())
+        assert list(df.columns) == ["c1", "c2", "c5", "c6"]
+        # same result from the cached profile
+        df_profiled = self.df_input.copy()
+        ak.profile_df(df_profiled)
+        df = ak.remove_empty_cols_from_df(df_profiled)
+        assert list(df.columns) == ["c1", "c2", "c5", "c6"]
+
+    def test_fillna_numerical_columns_skip_profiled(self):
+        df = pd.DataFrame({"c1": [1.0, np.nan], "c2": [1.0, 2.0]})
+        ak.profile_df(df)
+        df = ak.fillna_numerical_columns(df)
+        assert df["c1"].tolist() == [1.0, 0.0]
+        assert ak.get_profile(df) is None or "c1" not in ak.get_profile(df).columns
+
+    def test_cleaners_do_not_cache(self):
+        """
+        Columns changed after a cleaner call are seen by the next call
+        """
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": [np.nan, np.nan], "c": ["x", "y"]})
+        assert list(ak.remove_empty_cols_from_df(df).columns) == ["a", "c"]
+        assert ak.get_profile(df) is None
+        df["b"] = ["filled", "filled"]
+        assert list(ak.remove_empty_cols_from_df(df).columns) == ["a", "b", "c"]
+
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+        df = ak.fillna_numerical_columns(df)
+        df.loc[0, "a"] = np.nan
+        assert ak.fillna_numerical_columns(df)["a"].tolist() == [0.0, 2.0]
+
+    def test_replaced_column_profile_outdated(self):
+        df = pd.DataFrame({"a": [1.0, 2.0], "b": [np.nan, np.nan]})
+        ak.profile_df(df)
+        assert get_column_profile(df, "b").all_null
+        df["b"] = [1.0, 2.0]  # same dtype and length, new data
+        assert get_column_profile(df, "b") is None
+        assert get_column_profile(df, "a") is not None
+        assert not ak.profile_df(df).columns["b"].all_null
+
+
+class TestConvertersWithProfile():
+
+    df_input = pd.DataFrame({
+        "num": ["1,5", "2%", None, "1,5", "x", "2%", "1,5", "1,5"],
+        "date": ["2024-01-15", "15/01/2024", None, "2024-01-15 10:00", "",
+                 "2024-01-15", "2024-01-15", "15/01/2024"],
+        "empty": [None] * 8,
+    })
+
+    @pytest.mark.parametrize("convert, kwargs", [
+        (ak.columns_to_float, {}),
+        (ak.columns_to_int, {}),
+        (ak.columns_to_date, {"date_format": "%Y-%m-%d"}),
+        (ak.columns_to_date, {"date_format": ["%Y-%m-%d", "%d-%m-%Y"]}),
+        (ak.columns_to_date, {"date_format": "auto"}),
+    ])
+    def test_same_result_as_unprofiled(self, convert, kwargs):
+        """
+        All-null and low cardinality columns take the profiled shortcuts, with the
+        same result
+        """
+        cols = ["date", "empty"] if convert is ak.columns_to_date else ["num", "empty"]
+        df_expected = convert(self.df_input.copy(), cols, **kwargs)
+        df = self.df_input.copy()
+        ak.profile_df(df)
+        pd.testing.assert_frame_equal(convert(df, cols, **kwargs), df_expected)
+
+    def test_outdated_profile(self):
+        """
+        A column modified in place without invalidation is still converted
+        """
+        df = self.df_input.copy()
+        ak.profile_df(df)
+        df.loc[0, "empty"] = "3"
+        df.loc[0, "num"] = "7"
+        df = ak.columns_to_float(df, ["empty", "num"])
+        assert (df.loc[0, "empty"], df.loc[0, "num"]) == (3.0, 7.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,7 +1,11 @@
 import pytest
+import zipfile
 import pandas as pd
+import pyarrow as pa  # type: ignore
 import akutils as ak
+from io import BytesIO
 from akutils import PATH_TO_AKUTILS_PKG
+from akutils.pandas_read_files import _MemoryViewReader, _open_zip_member, _zip_buffer
 
 
 class TestReadCsvInChunks():
@@ -74,6 +78,18 @@ class TestReadCsvInChunks():
         )
         pd.testing.assert_frame_equal(df, df_expected)
 
+    def test_read_csv_in_chunk_pyarrow(self):
+        """
+        Arrow backend: chunks are kept as pyarrow ChunkedArray
+        """
+        file_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+        df_expected = pd.read_csv(file_path, sep=";", dtype="string")
+        df = ak.read_csv_in_chunks(
+            file_path, sep=";", chunksize=5, dtype_backend="pyarrow")
+        assert (df.dtypes == "string[pyarrow]").all()
+        assert df["country"].array.__arrow_array__().num_chunks > 1
+        pd.testing.assert_frame_equal(df.astype("string"), df_expected)
+
 
 class TestReadMultipleCsvFromDir():
 
@@ -99,6 +115,19 @@ class TestReadMultipleCsvFromDir():
         df = df.sort_values("nb_sales").reset_index(drop=True)
         pd.testing.assert_frame_equal(df, df_expected)
 
+    def test_read_multiple_csv_from_dir_schema_drift_report(self):
+        """
+        The schema drift report is attached to the result, with file names as source
+        """
+        dir_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales_per_month"
+        df = ak.read_multiple_csv_from_dir(
+            dir_path, sep=";", dtype=None, normalize_columns=str.upper)
+        report = ak.SchemaDriftReport(**df.attrs["schema_drift"])
+        assert not report.has_drift
+        assert list(df.columns) == ["MONTH", "NB_SALES", "COUNTRY"]
+        assert set(report.renamed) == {
+            "sales_01.csv", "sales_02.CSV", "Sales_03.txt"}
+
     def test_read_multiple_csv_from_dir_with_filter_files(self):
         """
         Case with file name filter (the dir containing also not text file extension)
@@ -152,6 +181,98 @@ class TestReadMultipleCsvFromDir():
         pd.testing.assert_frame_equal(df, df_expected)
 
 
+class TestReadMultipleCsvFromZip():
+
+    dir_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales_per_month"
+    files = ["sales_01.csv", "sales_02.CSV", "Sales_03.txt"]
+
+    def _write_zip(self, zip_path, compression):
+        with zipfile.ZipFile(zip_path, "w", compression=compression) as zip_ref:
+            for file in self.files:
+                zip_ref.write(self.dir_path / file, f"data/{file}")
+            zip_ref.writestr("data/latin.csv", "month;nb_sales;country\n9;9;Sète\n"
+                             .encode("cp1252"))
+
+    @pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+    def test_read_multiple_csv_from_zip(self, tmp_path, compression):
+        """
+        STORED members are read in place from the memory mapped zip, deflated ones
+        are streamed: both give the same DataFrame
+        """
+        zip_path = tmp_path / "sales.zip"
+        self._write_zip(zip_path, compression)
+        df = ak.read_multiple_csv_from_zip(
+            zip_path, sep=";", dtype=None, encoding="cp1252", add_source=True)
+        df = df.sort_values("nb_sales").reset_index(drop=True)
+        assert df["country"].tolist()[-1] == "Sète"
+        df_expected = pd.concat(
+            [pd.read_csv(self.dir_path / file, sep=";") for file in self.files])
+        pd.testing.assert_frame_equal(
+            df.iloc[:-1, :3], df_expected.sort_values("nb_sales", ignore_index=True))
+        assert set(df["file_source"]) == {f"data/{file}" for file in self.files} | {
+            "data/latin.csv"}
+
+    @pytest.mark.parametrize("from_bytes", [False, True])
+    def test_stored_member_read_in_place(self, tmp_path, from_bytes):
+        zip_path = tmp_path / "sales.zip"
+        self._write_zip(zip_path, zipfile.ZIP_STORED)
+        source = BytesIO(zip_path.read_bytes()) if from_bytes else zip_path
+        with _zip_buffer(source) as zip_buffer, zipfile.ZipFile(source) as zip_ref:
+            for file_name in zip_ref.namelist():
+                with _open_zip_member(zip_ref, file_name, zip_buffer) as file:
+                    assert isinstance(file, _MemoryViewReader)
+                    assert file.read() == zip_ref.read(file_name)
+
+
+class TestFileProvenance():
+
+    file_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+    dir_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales_per_month"
+
+    def test_source_category(self):
+        df_expected = ak.read_multiple_csv_from_dir(
+            self.dir_path, sep=";", add_source=True)
+        df = ak.read_multiple_csv_from_dir(
+            self.dir_path, sep=";", add_source="category")
+        assert isinstance(df["file_source"].dtype, pd.CategoricalDtype)
+        assert df["file_source"].cat.codes.dtype == "int8"
+        pd.testing.assert_frame_equal(
+            df.astype({"file_source": "string"}),
+            df_expected.astype({"file_source": "string"}))
+
+    def test_source_index(self):
+        df_expected = ak.read_multiple_csv_from_dir(
+            self.dir_path, sep=";", add_source=True)
+        df = ak.read_multiple_csv_from_dir(self.dir_path, sep=";", add_source="index")
+        assert "file_source" not in df.columns
+        assert df["file_index"].dtype == "int16"
+        lookup = ak.file_source_lookup(df)
+        assert list(lookup) == df.attrs["file_index"]
+        assert (df["file_index"].map(lookup) == df_expected["file_source"]).all()
+
+    def test_no_lookup(self):
+        with pytest.raises(ValueError):
+            ak.file_source_lookup(pd.DataFrame({"a": [1]}))
+
+    def test_row_number_chunked_and_filtered(self):
+        def filter_chunk(df: pd.DataFrame) -> pd.DataFrame:
+            return df[df["country"] == "Spain"]
+
+        df_full = pd.read_csv(self.file_path, sep=";", dtype="string")
+        df = ak.read_csv_in_chunks(
+            self.file_path, sep=";", chunksize=4, chunk_func=filter_chunk,
+            add_row_number=True)
+        assert df["file_row"].tolist() == df_full.index[
+            df_full["country"] == "Spain"].tolist()
+
+    def test_row_number_per_file(self):
+        df = ak.read_multiple_csv_from_dir(
+            self.dir_path, sep=";", chunksize=2, add_source="index",
+            add_row_number=True)
+        for _, file_df in df.groupby("file_index"):
+            assert file_df["file_row"].tolist() == list(range(len(file_df)))
+
+
 class TestReadMultipleXlsxFromDir():
 
     df_expected = pd.DataFrame(
@@ -179,5 +300,92 @@ class TestReadMultipleXlsxFromDir():
         pd.testing.assert_frame_equal(df, df_expected)
 
 
+class TestReadMultipleParquetFromDir():
+
+    @pytest.fixture
+    def dir_path(self, tmp_path):
+        pd.DataFrame({
+            "month": [1, 1, 2],
+            "country": ["Italy", "France", "Italy"],
+            "amount": [1.5, 2.5, 3.5],
+        }).to_parquet(tmp_path / "sales_01.parquet", row_group_size=1)
+        # schema drift: no amount, an extra column and month as int32
+        pd.DataFrame({
+            "month": pd.Series([3, 4], dtype="int32"),
+            "country": ["Germany", "France"],
+            "channel": ["web", "shop"],
+        }).to_parquet(tmp_path / "sales_02.parquet")
+        (tmp_path / "notes.txt").write_text("not a parquet file")
+        return tmp_path
+
+    def test_read_multiple_parquet_from_dir(self, dir_path):
+        df = ak.read_multiple_parquet_from_dir(dir_path)
+        df_expected = pd.DataFrame({
+            "month": [1, 1, 2, 3, 4],
+            "country": ["Italy", "France", "Italy", "Germany", "France"],
+            "amount": [1.5, 2.5, 3.5, None, None],
+            "channel": [None, None, None, "web", "shop"],
+        })
+        pd.testing.assert_frame_equal(df, df_expected)
+        drift = df.attrs["schema_drift"]
+        assert drift["missing"] == {"sales_02.parquet": ["amount"]}
+        assert drift["extra"] == {"sales_02.parquet": ["channel"]}
+        assert drift["upcast"] == {
+            "month": {"sales_01.parquet": "int64", "sales_02.parquet": "int32"}}
+
+    def test_column_policies(self, dir_path):
+        df = ak.read_multiple_parquet_from_dir(
+            dir_path, missing_columns="drop", extra_columns="drop")
+        assert df.columns.tolist() == ["month", "country"]
+        with pytest.raises(ValueError):
+            ak.read_multiple_parquet_from_dir(dir_path, extra_columns="error")
+
+    @pytest.mark.parametrize("filters", [
+        [("month", "<=", 1)],
+        [[("month", "==", 1)]],
+    ])
+    def test_projection_and_filters(self, dir_path, filters):
+        df = ak.read_multiple_parquet_from_dir(
+            dir_path, columns=["country", "amount"], filters=filters)
+        pd.testing.assert_frame_equal(
+            df, pd.DataFrame({"country": ["Italy", "France"], "amount": [1.5, 2.5]}))
+
+    @pytest.mark.parametrize("add_source", [True, "category", "index"])
+    def test_add_source(self, dir_path, add_source):
+        df = ak.read_multiple_parquet_from_dir(
+            dir_path, regex="sales", add_source=add_source, dtype_backend="pyarrow")
+        if add_source == "index":
+            sources = df["file_index"].map(ak.file_source_lookup(df))
+        else:
+            sources = df["file_source"].astype(str)
+        assert sources.tolist() == ["sales_01.parquet"] * 3 + ["sales_02.parquet"] * 2
+        assert isinstance(df["country"].dtype, pd.ArrowDtype)
+
+    def test_incompatible_types(self, tmp_path):
+        """
+        Columns without common type are read as strings and reported as drift
+        """
+        pd.DataFrame({"code": [1, 2]}).to_parquet(tmp_path / "sales_01.parquet")
+        pd.DataFrame({"code": ["A3"]}).to_parquet(tmp_path / "sales_02.parquet")
+        df = ak.read_multiple_parquet_from_dir(tmp_path)
+        assert df["code"].tolist() == ["1", "2", "A3"]
+        assert df.attrs["schema_drift"]["upcast"] == {
+            "code": {"sales_01.parquet": "int64", "sales_02.parquet": "string"}}
+
+    def test_named_index_kept(self, tmp_path):
+        df_input = pd.DataFrame(
+            {"amount": [1.5, 2.5]}, index=pd.Index([10, 20], name="id"))
+        df_input.to_parquet(tmp_path / "sales_01.parquet")
+        df = ak.read_multiple_parquet_from_dir(tmp_path)
+        pd.testing.assert_frame_equal(df, df_input.reset_index())
+
+    def test_iterator(self, dir_path):
+        batches = ak.read_multiple_parquet_from_dir(
+            dir_path, iterator=True, add_source=True, batch_size=2)
+        table = pa.Table.from_batches(list(batches))
+        assert table.num_rows == 5
+        assert table.column("file_source").to_pylist()[-1] == "sales_02.parquet"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
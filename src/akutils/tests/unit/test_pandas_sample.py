@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+
+class TestRowSampler():
+
+    chunks = [
+        pd.DataFrame({"id": range(0, 4)}),
+        pd.DataFrame({"id": range(4, 7)}, index=range(4, 7)),
+        pd.DataFrame({"id": range(7, 10)}, index=range(7, 10)),
+    ]
+
+    def _run(self, sampler: ak.RowSampler) -> pd.DataFrame:
+        filtered = [sampler.filter(chunk) for chunk in self.chunks]
+        return pd.concat(sampler.finalize(filtered))
+
+    def test_sample_size_and_order(self):
+        """
+        The sample has n rows, kept in reading order
+        """
+        df = self._run(ak.RowSampler(3, random_state=0))
+        assert len(df) == 3
+        assert df["id"].is_monotonic_increasing
+        assert set(df["id"]) <= set(range(10))
+
+    def test_sample_bigger_than_data(self):
+        df = self._run(ak.RowSampler(20))
+        pd.testing.assert_frame_equal(df, pd.concat(self.chunks))
+
+    def test_reproducible(self):
+        df_1 = self._run(ak.RowSampler(3, random_state=42))
+        df_2 = self._run(ak.RowSampler(3, random_state=42))
+        pd.testing.assert_frame_equal(df_1, df_2)
+
+    def test_compact_bounded(self):
+        """
+        Rows evicted from the reservoir are dropped after each chunk
+        """
+        sampler = ak.RowSampler(10, random_state=0)
+        held: list[pd.DataFrame] = []
+        for start in range(0, 10_000, 100):
+            held.append(sampler.filter(pd.DataFrame({"id": range(start, start + 100)})))
+            held = sampler.compact(held)
+            assert sum(len(df) for df in held) == 10
+        df = pd.concat(sampler.finalize(held))
+        assert len(df) == 10 and df["id"].is_monotonic_increasing
+
+    def test_uniform(self):
+        """
+        Each row is sampled with probability n / total rows
+        """
+        rng = np.random.default_rng(0)
+        counts = np.zeros(10)
+        nb_runs = 3000
+        for _ in range(nb_runs):
+            counts[self._run(ak.RowSampler(3, random_state=rng))["id"]] += 1
+        np.testing.assert_allclose(counts / nb_runs, 0.3, atol=0.04)
+
+
+class TestReadWithSampleAndPreview():
+
+    dir_path = ak.PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales_per_month"
+
+    def test_read_multiple_csv_from_dir_sample(self):
+        df = ak.read_multiple_csv_from_dir(
+            self.dir_path,
+            sep=";",
+            chunksize=2,
+            add_source=True,
+            sample=ak.RowSampler(4, random_state=0))
+        assert len(df) == 4
+        files = {"sales_01.csv", "sales_02.CSV", "Sales_03.txt"}
+        assert set(df["file_source"]) <= files
+
+    def test_read_multiple_csv_from_dir_preview(self):
+        df = ak.read_multiple_csv_from_dir(
+            self.dir_path, sep=";", add_source=True, preview=1)
+        assert len(df) == 3
+        assert df["file_source"].is_unique
+
+    def test_read_multiple_xlsx_from_dir_preview(self):
+        df = ak.read_multiple_xlsx_from_dir(self.dir_path, preview=1)
+        assert len(df) == 4
+
+    def test_sample_with_deduplicate_last(self):
+        with pytest.raises(ValueError):
+            ak.read_multiple_csv_from_dir(
+                self.dir_path,
+                sep=";",
+                sample=2,
+                deduplicate=ak.RowDeduplicator(keep="last"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -45,6 +45,162 @@ class TestStripColumns():
         df = ak.strip_columns(df_input, cols=["c1", "c2", "c4"])
         pd.testing.assert_frame_equal(df, df_expected)
 
+    def test_strip_columns_pyarrow(self):
+        columns = ["c1", "c2"]
+        data = [["  1  ", 2.1], ["  3", np.nan], [None, 2.2]]
+        df_input = pd.DataFrame(data=data, columns=columns)
+        df = ak.strip_columns(df_input, dtype_backend="pyarrow")
+        assert df["c1"].dtype == "string[pyarrow]"
+        assert df["c1"].tolist() == ["1", "3", pd.NA]
+        assert df["c2"].dtype == np.float64
+
+
+class TestArrowCleaners():
+
+    def test_remove_accent_and_capitalise_pyarrow(self):
+        df_input = pd.DataFrame({"c1": ["Éléphant", "çà", None]})
+        df = ak.remove_accent_from_cols(df_input, ["c1"], dtype_backend="pyarrow")
+        df = ak.capitalise_cols(df, ["c1"])
+        assert df["c1"].dtype == "string[pyarrow]"
+        assert df["c1"].tolist() == ["ELEPHANT", "CA", "NONE"]
+
+    def test_capitalise_same_result_on_both_backends(self):
+        """
+        Missing values and mixed types give the same text on Arrow and numpy
+        """
+        for data in (["a", None, np.nan, 1], pd.array(["a", None], dtype="string")):
+            df_numpy = ak.capitalise_cols(pd.DataFrame({"c1": data}), ["c1"])
+            df_arrow = ak.capitalise_cols(
+                pd.DataFrame({"c1": data}), ["c1"], dtype_backend="pyarrow")
+            assert df_arrow["c1"].tolist() == df_numpy["c1"].tolist()
+
+    def test_convert_datetimes_to_date_pyarrow(self):
+        df_input = pd.DataFrame({"c1": ["2024-01-05 10:00", "2024/02/01"]})
+        df = ak.columns_to_date(df_input, ["c1"], dtype_backend="pyarrow")
+        df = ak.convert_datetimes_to_date(df)
+        assert df["c1"].dtype == "date32[day][pyarrow]"
+        assert df["c1"].astype(str).tolist() == ["2024-01-05", "2024-02-01"]
+
+
+class TestConvertDatetimesToDate():
+
+    def make_df(self) -> pd.DataFrame:
+        values = pd.to_datetime(
+            pd.Series(["2024-01-05 10:00", None, "2024-02-01 00:00"]))
+        return pd.DataFrame({
+            "c1": values,
+            "c2": values.astype("timestamp[ns][pyarrow]"),
+        })
+
+    def test_object(self):
+        df = ak.convert_datetimes_to_date(self.make_df())
+        assert df["c1"].tolist()[0] == datetime(2024, 1, 5).date()
+        assert df["c2"].dtype == "date32[day][pyarrow]"
+
+    def test_date32(self):
+        df = ak.convert_datetimes_to_date(self.make_df(), engine="date32")
+        for col in ("c1", "c2"):
+            assert df[col].dtype == "date32[day][pyarrow]"
+            assert df[col].isna().tolist() == [False, True, False]
+            assert df[col].astype(str).tolist()[0] == "2024-01-05"
+
+    def test_normalize(self):
+        df_input = self.make_df()
+        dtypes = df_input.dtypes
+        df = ak.convert_datetimes_to_date(df_input, engine="normalize")
+        pd.testing.assert_series_equal(df.dtypes, dtypes)
+        expected = pd.to_datetime(pd.Series(["2024-01-05", None, "2024-02-01"]))
+        pd.testing.assert_series_equal(df["c1"], expected, check_names=False)
+        assert (df["c2"].astype("datetime64[ns]") == df["c1"]).sum() == 2
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            ak.convert_datetimes_to_date(self.make_df(), engine="python")
+
+
+class TestFillnaNumericalColumns():
+
+    def test_dtypes_kept(self):
+        df = pd.DataFrame({
+            "f32": pd.Series([1.5, np.nan], dtype="float32"),
+            "i64": pd.Series([1, None], dtype="Int64"),
+            "arrow": pd.Series([1.5, None], dtype="double[pyarrow]"),
+            "text": ["a", None],
+        })
+        dtypes = df.dtypes
+        df = ak.fillna_numerical_columns(df, filler=0)
+        pd.testing.assert_series_equal(df.dtypes, dtypes)
+        assert df[["f32", "i64", "arrow"]].sum().tolist() == [1.5, 1, 1.5]
+        assert df["text"].isna().sum() == 1
+
+    def test_complete_columns_not_copied(self):
+        df = pd.DataFrame({"full": [1.5, 2.5], "holes": [1.5, np.nan]})
+        full_values = df["full"].to_numpy()
+        ak.profile_df(df)
+        df = ak.fillna_numerical_columns(df)
+        assert np.shares_memory(df["full"].to_numpy(), full_values)
+        # the profile of untouched columns stays valid
+        assert ak.get_profile(df).columns["full"].null_count == 0
+        assert df["holes"].tolist() == [1.5, 0.]
+
+
+class TestMapColsAndInsertNext():
+
+    df_input = pd.DataFrame({
+        "c1": ["FR", "DE", "XX", None],
+        "c2": [1, 2, 2, 3],
+        "c3": ["FR", "FR", "DE", "DE"],
+    })
+    countries = {"FR": "France", "DE": "Germany"}
+
+    def test_map_col_and_insert_next(self):
+        df_input = self.df_input.copy()
+        df = ak.map_col_and_insert_next(df_input, "c1", self.countries)
+        assert list(df.columns) == ["c1", "c1_lib", "c2", "c3"]
+        assert df["c1_lib"].tolist() == ["France", "Germany", "unknown", "unknown"]
+
+    def test_map_col_and_insert_next_none_mapper_value(self):
+        """
+        A key mapped to None is unknown, as with serie.map(dict)
+        """
+        df_input = pd.DataFrame({"c1": ["x", "y", "z"]})
+        mapper = {"x": "ex", "y": None}
+        df_expected = df_input.assign(
+            c1_lib=df_input["c1"].map(mapper).fillna("unknown"))
+        df = ak.map_col_and_insert_next(df_input.copy(), "c1", mapper)
+        pd.testing.assert_frame_equal(df, df_expected)
+        df, report = ak.map_cols_and_insert_next(
+            df_input, {"c1": mapper}, return_report=True)
+        assert df["c1_lib"].tolist() == ["ex", "unknown", "unknown"]
+        assert report.nb_unknown == {"c1": 2}
+
+    def test_map_cols_and_insert_next(self):
+        """
+        Several columns mapped at once, a mapper shared by two columns
+        """
+        df, report = ak.map_cols_and_insert_next(
+            self.df_input,
+            mappers={
+                "c1": self.countries,
+                "c2": ak.MapperIndex({1: "one", 2: "two"}),
+                "c3": self.countries,
+            },
+            return_report=True
+        )
+        df_expected = self.df_input.copy()
+        for col, mapper in (("c1", self.countries), ("c2", {1: "one", 2: "two"})):
+            df_expected = ak.map_col_and_insert_next(df_expected, col, mapper)
+        df_expected = ak.map_col_and_insert_next(df_expected, "c3", self.countries)
+        pd.testing.assert_frame_equal(df, df_expected)
+        assert report.nb_unknown == {"c1": 2, "c2": 1}
+        assert report.unknown_values["c2"] == [3]
+
+    def test_map_cols_and_insert_next_replace_existing(self):
+        df = self.df_input.assign(c3_lib="old")
+        df = ak.map_cols_and_insert_next(df, {"c3": self.countries})
+        assert list(df.columns) == ["c1", "c2", "c3", "c3_lib"]
+        assert df["c3_lib"].tolist() == ["France", "France", "Germany", "Germany"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,121 @@
+import pytest
+import zipfile
+import pandas as pd
+import akutils as ak
+from akutils import pandas_sniff
+from akutils.pandas_sniff import _SNIFF_CACHE
+
+
+class TestSniffBytes():
+
+    def test_latin_semicolon_comma_decimal(self):
+        prefix = "ville;montant\nSète;1,5\nNîmes;2,25\n".encode("cp1252")
+        result = ak.sniff_bytes(prefix, complete=True)
+        assert result == ak.SniffResult(encoding="cp1252", sep=";", decimal=",")
+
+    def test_utf8_bom_tab(self):
+        prefix = "\ufeffcity\tamount\nParis\t1.5\nLyon\t2\n".encode("utf-8")
+        result = ak.sniff_bytes(prefix, complete=True)
+        assert result == ak.SniffResult(encoding="utf-8-sig", bom=True, sep="\t")
+
+    def test_preamble_and_quoted_delimiters(self):
+        prefix = (
+            b"Export of 2024-01-01\n\n"
+            b'city,comment\nParis,"a;b;c"\nLyon,"d;e"\nNice,f\n'
+        )
+        result = ak.sniff_bytes(prefix, complete=True)
+        assert (result.sep, result.skiprows, result.has_header) == (",", 1, True)
+
+    def test_no_header(self):
+        result = ak.sniff_bytes(b"1|2.5\n3|4.5\n", complete=True)
+        assert (result.sep, result.has_header) == ("|", False)
+        assert result.read_csv_kwargs()["header"] is None
+
+    def test_trailing_delimiter(self):
+        """
+        The header has one field less than the data lines: it is not a preamble
+        """
+        result = ak.sniff_bytes(b"city;amount\nParis;1;\nLyon;2;\n", complete=True)
+        assert (result.sep, result.skiprows, result.has_header) == (";", 0, True)
+        assert result.trailing_sep
+        assert result.read_csv_kwargs()["index_col"] is False
+
+    def test_truncated_prefix(self):
+        """
+        The last line (and character) of a prefix may be truncated
+        """
+        prefix = "a;b\né;1\nè;2\né".encode("utf-8")[:-1]
+        result = ak.sniff_bytes(prefix)
+        assert (result.encoding, result.sep) == ("utf-8", ";")
+
+
+class TestReadWithSniff():
+
+    df_expected = pd.DataFrame(
+        {"city": ["Sète", "Nîmes", "Paris"], "amount": ["1,5", "2,25", "3.5"]},
+        dtype="string",
+    )
+
+    def _write_files(self, dir_path):
+        (dir_path / "sniff_01.csv").write_bytes(
+            "city;amount\nSète;1,5\nNîmes;2,25\n".encode("cp1252"))
+        (dir_path / "sniff_02.csv").write_bytes(
+            "\ufeffcity,amount\nParis,3.5\n".encode("utf-8"))
+
+    def test_read_multiple_csv_from_dir_mixed_dialects(self, tmp_path):
+        self._write_files(tmp_path)
+        df = ak.read_multiple_csv_from_dir(tmp_path, sniff=True)
+        df = df.sort_values("amount").reset_index(drop=True)
+        pd.testing.assert_frame_equal(df, self.df_expected)
+
+    def test_read_multiple_csv_from_zip_mixed_dialects(self, tmp_path):
+        self._write_files(tmp_path)
+        zip_path = tmp_path / "sniff.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_ref:
+            for file in ("sniff_01.csv", "sniff_02.csv"):
+                zip_ref.write(tmp_path / file, file)
+        df = ak.read_multiple_csv_from_zip(zip_path, sniff=True)
+        df = df.sort_values("amount").reset_index(drop=True)
+        pd.testing.assert_frame_equal(df, self.df_expected)
+
+    def test_explicit_args_win(self, tmp_path):
+        self._write_files(tmp_path)
+        df = ak.read_csv_in_chunks(
+            tmp_path / "sniff_01.csv", sniff=True, sep=",", encoding="latin-1")
+        assert list(df.columns) == ["city;amount"]
+
+    def test_read_trailing_delimiter(self, tmp_path):
+        (tmp_path / "trailing.csv").write_text("city;amount\nParis;1;\nLyon;2;\n")
+        df = ak.read_csv_in_chunks(tmp_path / "trailing.csv", sniff=True)
+        pd.testing.assert_frame_equal(df, pd.DataFrame(
+            {"city": ["Paris", "Lyon"], "amount": ["1", "2"]}, dtype="string"))
+
+    def test_explicit_delimiter(self, tmp_path):
+        """
+        The sniffed sep is not passed along an explicit delimiter
+        """
+        self._write_files(tmp_path)
+        df = ak.read_csv_in_chunks(tmp_path / "sniff_01.csv", sniff=True, delimiter=",")
+        assert list(df.columns) == ["city;amount"]
+
+    def test_cache(self, tmp_path):
+        self._write_files(tmp_path)
+        _SNIFF_CACHE.clear()
+        result = ak.sniff_csv(tmp_path / "sniff_01.csv")
+        assert ak.sniff_csv(tmp_path / "sniff_01.csv") is result
+        assert len(_SNIFF_CACHE) == 1
+
+    def test_cache_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(pandas_sniff, "SNIFF_CACHE_SIZE", 2)
+        self._write_files(tmp_path)
+        (tmp_path / "sniff_03.csv").write_bytes(b"a,b\n1,2\n")
+        _SNIFF_CACHE.clear()
+        for file in ("sniff_01.csv", "sniff_02.csv", "sniff_01.csv", "sniff_03.csv"):
+            ak.sniff_csv(tmp_path / file)
+        assert len(_SNIFF_CACHE) == 2
+        assert [key[0] for key in _SNIFF_CACHE] == [
+            str(tmp_path / "sniff_01.csv"), str(tmp_path / "sniff_03.csv")]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,86 @@
+import gzip
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+
+def make_df(nb_rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": np.arange(nb_rows),
+        "amount": np.where(np.arange(nb_rows) % 3 == 0, np.nan, 1.5),
+        "country": pd.Series(["FR", None] * (nb_rows // 2), dtype="string"),
+        "date": pd.Timestamp("2024-01-31"),
+    })
+
+
+class TestWriteXlsx():
+
+    def test_roundtrip(self, tmp_path):
+        df = make_df(10)
+        file_path = tmp_path / "out.xlsx"
+        assert ak.write_xlsx(df, file_path, sheet_name="sales") == ["sales"]
+        df_read = pd.read_excel(file_path, sheet_name="sales")
+        df_expected = df.assign(
+            country=df["country"].to_numpy(dtype=object, na_value=np.nan))
+        pd.testing.assert_frame_equal(df_read, df_expected, check_dtype=False)
+
+    def test_chunks_split_across_sheets(self, tmp_path):
+        """
+        Chunks are streamed one after the other, a full sheet goes on in a new one
+        """
+        df = make_df(10)
+        chunks = (df.iloc[start:start + 3] for start in range(0, 10, 3))
+        file_path = tmp_path / "out.xlsx"
+        sheets = ak.write_xlsx(chunks, file_path, max_rows_per_sheet=5)
+        assert sheets == ["Sheet1", "Sheet1_2", "Sheet1_3"]
+        df_read = pd.concat(pd.read_excel(file_path, sheet_name=None).values())
+        assert df_read["id"].tolist() == list(range(10))
+
+    def test_several_sheets_and_index(self, tmp_path):
+        file_path = tmp_path / "out.xlsx"
+        df = make_df(4).set_index("id")
+        ak.write_xlsx(
+            {"first": df, "second": [df.iloc[:2], df.iloc[2:]]}, file_path, index=True)
+        sheets = pd.read_excel(file_path, sheet_name=None, index_col=0)
+        assert list(sheets) == ["first", "second"]
+        pd.testing.assert_frame_equal(sheets["first"], sheets["second"])
+        assert sheets["first"].index.tolist() == [0, 1, 2, 3]
+
+    def test_empty(self, tmp_path):
+        file_path = tmp_path / "out.xlsx"
+        ak.write_xlsx(make_df(0), file_path)
+        assert pd.read_excel(file_path).columns.tolist() == [
+            "id", "amount", "country", "date"]
+
+
+class TestWriteCsvPartitions():
+
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_roundtrip(self, tmp_path, compression):
+        df = make_df(1000)
+        file_paths = ak.write_csv_partitions(
+            df, tmp_path / "out", partition_rows=300, compression=compression,
+            n_jobs=2, sep=";")
+        suffix = ".csv.gz" if compression else ".csv"
+        assert [path.name for path in file_paths] == [
+            f"part-0000{i}{suffix}" for i in range(4)]
+        df_read = pd.concat(
+            [pd.read_csv(path, sep=";") for path in file_paths], ignore_index=True)
+        assert df_read["id"].tolist() == df["id"].tolist()
+        if compression:
+            with gzip.open(file_paths[0], "rt") as file:
+                assert file.readline() == "id;amount;country;date\n"
+
+    def test_file_per_chunk(self, tmp_path):
+        chunks = [make_df(4), make_df(6)]
+        file_paths = ak.write_csv_partitions(chunks, tmp_path, partition_rows=None)
+        assert [len(pd.read_csv(path)) for path in file_paths] == [4, 6]
+
+    def test_error_raised(self, tmp_path):
+        with pytest.raises(KeyError):
+            ak.write_csv_partitions(make_df(4), tmp_path, columns=["missing"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,69 @@
+import pytest
+import logging
+import zipfile
+import akutils as ak
+from akutils import PATH_TO_AKUTILS_PKG
+
+
+class TestProgress():
+
+    file_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales.csv"
+    dir_path = PATH_TO_AKUTILS_PKG / "tests" / "_fixtures" / "sales_per_month"
+
+    def test_events(self, capsys):
+        """
+        Structured events instead of printed chunk numbers
+        """
+        events = []
+        ak.read_csv_in_chunks(
+            self.file_path, sep=";", chunksize=5, progress=events.append)
+        assert "Chunk number" not in capsys.readouterr().out
+        assert [event.kind for event in events] == (
+            ["file_start"] + ["chunk"] * 6 + ["file_end"])
+        assert [event.chunk_index for event in events[1:-1]] == list(range(6))
+        file_size = self.file_path.stat().st_size
+        end = events[-1]
+        assert (end.total_rows, end.total_bytes, end.bytes_read) == (
+            30, file_size, file_size)
+        assert end.rows_per_sec > 0
+
+    def test_quiet_by_default(self, capsys, caplog, tmp_path):
+        """
+        Nothing is printed, the duration of a read is logged at DEBUG level
+        """
+        zip_path = tmp_path / "sales.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_ref:
+            for file in self.dir_path.glob("*.csv"):
+                zip_ref.write(file, file.name)
+        with caplog.at_level(logging.DEBUG, logger="akutils"):
+            ak.read_multiple_csv_from_dir(self.dir_path, sep=";")
+            ak.read_multiple_csv_from_zip(zip_path, sep=";")
+        assert capsys.readouterr().out == ""
+        assert any(
+            message.startswith("read_multiple_csv_from_dir took")
+            for message in caplog.messages)
+
+    def test_throttle(self):
+        events = []
+        ak.read_csv_in_chunks(
+            self.file_path, sep=";", chunksize=5,
+            progress=ak.throttle(events.append, interval=60))
+        assert [event.kind for event in events] == ["file_start", "file_end"]
+
+    def test_logging_progress(self, caplog):
+        with caplog.at_level(logging.INFO, logger="akutils"):
+            ak.read_multiple_csv_from_dir(
+                self.dir_path, sep=";", progress=ak.LoggingProgress())
+        assert sum("READ" in message for message in caplog.messages) == 3
+        assert sum(message.startswith("done") for message in caplog.messages) == 3
+
+    def test_rich_progress(self):
+        with ak.RichProgress(disable=True) as progress:
+            ak.read_multiple_xlsx_from_dir(self.dir_path, progress=progress)
+        tasks = progress.progress.tasks
+        assert len(tasks) == 4
+        assert all(task.finished for task in tasks)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
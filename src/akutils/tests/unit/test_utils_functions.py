@@ -0,0 +1,108 @@
+import time
+import pytest
+import numpy as np
+import pandas as pd
+import akutils as ak
+
+
+class Unhashable:
+    pass
+
+
+class TestPersistCache():
+
+    @pytest.fixture
+    def calls(self):
+        return []
+
+    @pytest.fixture
+    def load(self, tmp_path, calls):
+        @ak.persist_cache(cache_dir=tmp_path / "store")
+        def load(file_path, countries, df=None, option=None):
+            calls.append(file_path)
+            result = pd.read_csv(file_path, sep=";", dtype="string")
+            return result[result["country"].isin(countries)]
+        return load
+
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        file_path = tmp_path / "sales.csv"
+        file_path.write_text("id;country\n1;FR\n2;DE\n3;FR\n")
+        return file_path
+
+    def test_hit(self, load, calls, file_path):
+        df = load(file_path, ["FR"])
+        df_cached = load(file_path, countries=["FR"])
+        pd.testing.assert_frame_equal(df_cached, df)
+        assert len(calls) == 1
+        info = load.cache_info()
+        assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+        assert info.nbytes > 0
+
+    def test_changed_arguments_miss(self, load, calls, file_path):
+        load(file_path, ["FR"])
+        load(file_path, ["DE"])
+        load(file_path, ["FR"], df=pd.DataFrame({"a": [1, 2]}))
+        load(file_path, ["FR"], df=pd.DataFrame({"a": [1, 3]}))
+        assert len(calls) == 4
+        assert load.cache_info().hits == 0
+
+    def test_changed_file_miss(self, load, calls, file_path):
+        load(file_path, ["FR"])
+        time.sleep(0.01)
+        file_path.write_text("id;country\n1;FR\n")
+        assert len(load(file_path, ["FR"])) == 1
+        assert len(calls) == 2
+
+    def test_changed_str_path_miss(self, load, calls, file_path):
+        load(str(file_path), ["FR"])
+        time.sleep(0.01)
+        file_path.write_text("id;country\n1;FR\n")
+        assert len(load(str(file_path), ["FR"])) == 1
+        assert len(calls) == 2
+
+    def test_bypassed(self, load, calls, file_path, tmp_path):
+        load(file_path, ["FR"], option=Unhashable())
+        load(file_path, ["FR"], option=Unhashable())
+        assert load.cache_info().bypassed == 2
+        load(file_path, ["FR"], df=pd.DataFrame({"a": [[1], [2]]}))
+        assert load.cache_info().bypassed == 3
+
+        @ak.persist_cache(cache_dir=tmp_path / "store")
+        def not_a_frame(value):
+            return value * 2
+        assert not_a_frame(2) == not_a_frame(2) == 4
+        assert not_a_frame.cache_info().bypassed == 2
+
+    def test_series(self, tmp_path):
+        @ak.persist_cache(cache_dir=tmp_path)
+        def squares(nb):
+            return pd.Series(np.arange(nb) ** 2)
+        pd.testing.assert_series_equal(squares(5), squares(5))
+        assert squares.cache_info().hits == 1
+
+    def test_lru_eviction(self, tmp_path):
+        @ak.persist_cache(cache_dir=tmp_path, max_size=350_000)
+        def make(seed):
+            return pd.DataFrame(
+                {"a": np.random.default_rng(seed).normal(size=10**4)})
+        for seed in range(3):
+            make(seed)
+            time.sleep(0.01)
+        make(0)  # used again: seed 1 is now the least recently used
+        for seed in range(3, 5):
+            make(seed)
+            time.sleep(0.01)
+        assert make.cache_info().nbytes <= 350_000
+        make(0)
+        make(1)
+        assert (make.cache_info().hits, make.cache_info().misses) == (2, 6)
+
+    def test_cache_clear(self, load, file_path):
+        load(file_path, ["FR"])
+        load.cache_clear()
+        assert load.cache_info() == ak.CacheInfo()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
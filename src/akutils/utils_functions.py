@@ -1,8 +1,20 @@
-import pandas as pd
+import hashlib
+import inspect
+import logging
+import os
+import time
+import re
+import threading
+from dataclasses import dataclass
 from functools import wraps
 from datetime import datetime
+from pathlib import Path
 
-from akutils.os import warn
+from akutils.os import file_fingerprint, is_local_path, warn
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("AKUTILS_CACHE_DIR", Path.home() / ".cache" / "akutils"))
+_SERIES = "__series__"  # column of a cached unnamed Series
 
 
 def timeit(func):
@@ -17,6 +29,292 @@ def timeit(func):
     return timeit_wrapper
 
 
+def _log_duration(func):
+    """
+    Log the duration of each call at DEBUG level on the 'akutils' logger (quiet
+    counterpart of timeit for the library readers)
+    """
+    logger = logging.getLogger("akutils")
+
+    @wraps(func)
+    def log_duration_wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        result = func(*args, **kwargs)
+        logger.debug("%s took %.3fs", func.__name__, time.perf_counter() - start_time)
+        return result
+    return log_duration_wrapper
+
+
+def parse_bytes(size: int | str) -> int:
+    """
+    Convert a human readable size to bytes: parse_bytes("512MB") -> 536870912
+    """
+    if isinstance(size, int):
+        return size
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?i?b?)\s*", size.lower())
+    if match is None:
+        raise ValueError(f"Invalid size: '{size}'")
+    unit = match.group(2).rstrip("b").rstrip("i")
+    return int(float(match.group(1)) * 1024 ** " kmgt".index(unit or " "))
+
+
+class _Unhashable(Exception):
+    """
+    Argument without a stable fingerprint: the call is not cached
+    """
+
+
+def _existing_path(value: str) -> Path | None:
+    """
+    Path of a string naming an existing local or remote file or directory, None
+    otherwise
+    """
+    if is_local_path(value):
+        return Path(value) if os.path.exists(value) else None
+    from upath import UPath
+
+    try:
+        path = UPath(value)
+        return path if path.exists() else None
+    except Exception:  # not a path (unknown protocol) or unreachable
+        return None
+
+
+def _fingerprint(value, digest):
+    """
+    Feed a stable fingerprint of a function argument to a hashlib digest: files by
+    (path, size, modification time or etag), DataFrames and Series by a hash of
+    their content, containers recursively
+    """
+    import numpy as np
+    import pandas as pd
+
+    digest.update(type(value).__qualname__.encode())
+    path = _existing_path(value) if isinstance(value, str) else None
+    if path is not None:  # str naming a file or directory: fingerprinted as a Path
+        _fingerprint(path, digest)
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, Path):  # UPath included
+        if value.is_dir():
+            for file_path in sorted(value.iterdir(), key=str):
+                _fingerprint(file_path, digest)
+        else:
+            digest.update(repr(file_fingerprint(value)).encode())
+    elif isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        digest.update(repr(
+            value.columns if isinstance(value, pd.DataFrame) else value.name).encode())
+        digest.update(repr(value.dtypes.to_dict() if value.ndim == 2
+                           else value.dtype).encode())
+        try:
+            hashes = pd.util.hash_pandas_object(value, index=True)
+        except TypeError as error:  # unhashable values (lists, dicts...)
+            raise _Unhashable(repr(error)) from error
+        digest.update(hashes.to_numpy())
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(repr((value.dtype, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value, key=repr)
+        for item in value:
+            _fingerprint(item, digest)
+        digest.update(b")")
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            _fingerprint(key, digest)
+            _fingerprint(value[key], digest)
+        digest.update(b"}")
+    elif callable(value) and hasattr(value, "__qualname__"):
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+    else:
+        text = repr(value)
+        if " at 0x" in text:  # default repr: identity, not content
+            raise _Unhashable(text)
+        digest.update(text.encode())
+
+
+@dataclass
+class CacheInfo:
+    """
+    Statistics of a function decorated with ak.persist_cache
+
+    Attributes
+    ----------
+    hits : int
+        Calls answered from the store
+    misses : int
+        Calls computed and stored
+    bypassed : int
+        Calls computed but not stored (argument without fingerprint, result not a
+        DataFrame or not writable as Parquet)
+    entries : int
+        Results of the function in the store
+    nbytes : int
+        Size of these results in bytes
+    """
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    entries: int = 0
+    nbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses + self.bypassed
+        return self.hits / calls if calls else 0.
+
+
+def _evict(cache_dir: Path, max_size: int):
+    """
+    Remove the least recently used results until the store fits in max_size
+    """
+    entries = []
+    for file_path in cache_dir.glob("*.parquet"):
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:  # evicted by another process
+            continue
+        entries.append((stat.st_mtime, stat.st_size, file_path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, file_path in sorted(entries):
+        if total <= max_size:
+            break
+        file_path.unlink(missing_ok=True)
+        total -= size
+
+
+def persist_cache(
+    func=None,
+    *,
+    cache_dir: str | Path | None = None,
+    max_size: int | str = "2GB",
+):
+    """
+    Memoize a function returning a DataFrame (or a Series) on disk, across runs.
+
+    The arguments are fingerprinted: paths (Path and UPath objects, strings naming
+    an existing file or directory) by size and modification time (etag for remote
+    files, the files of a directory), DataFrames by a hash of their content, other
+    values by their repr. The result of an unchanged call is read back from a local
+    Parquet store instead of being computed again. The function code is part of the
+    key, so editing the function invalidates its results. When the store exceeds
+    max_size, the least recently used results are evicted.
+
+    Calls with an argument without stable fingerprint (an object whose repr is its
+    memory address, a DataFrame holding lists) or whose result is not a DataFrame
+    are computed, not stored.
+
+    Parameters
+    ----------
+    cache_dir : str | Path, default None
+        Local directory of the store, default $AKUTILS_CACHE_DIR or
+        ~/.cache/akutils
+    max_size : int | str, default "2GB"
+        Maximum size of the store (shared by all the functions using it)
+
+    Exemple
+    -------
+
+    .. code-block:: python
+
+        import akutils as ak
+
+        @ak.persist_cache(max_size="10GB")
+        def load_sales(dir_path, countries):
+            df = ak.read_multiple_csv_from_dir(dir_path, sep=";")
+            return df[df["country"].isin(countries)]
+
+        df = load_sales(dir_path, ["France"])  # computed
+        df = load_sales(dir_path, ["France"])  # read from the store
+        load_sales.cache_info()  # CacheInfo(hits=1, misses=1, ...)
+    """
+    if func is None:
+        return lambda func: persist_cache(
+            func, cache_dir=cache_dir, max_size=max_size)
+
+    store = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    max_bytes = parse_bytes(max_size)
+    signature = inspect.signature(func)
+    try:
+        code = inspect.getsource(func)
+    except (OSError, TypeError):
+        code = func.__code__.co_code.hex()
+    prefix = f"{func.__module__}.{func.__qualname__}".replace("<", "").replace(">", "")
+    stats = CacheInfo()
+    lock = threading.Lock()
+
+    def _count(counter: str):
+        with lock:
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    @wraps(func)
+    def persist_cache_wrapper(*args, **kwargs):
+        import pandas as pd
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        digest = hashlib.blake2b(code.encode(), digest_size=16)
+        try:
+            _fingerprint(dict(bound.arguments), digest)
+        except _Unhashable:
+            _count("bypassed")
+            return func(*args, **kwargs)
+        file_path = store / f"{prefix}-{digest.hexdigest()}.parquet"
+
+        if file_path.exists():
+            try:
+                result = pd.read_parquet(file_path)
+                os.utime(file_path)  # most recently used
+            except (OSError, ValueError):  # evicted or partially written
+                pass
+            else:
+                _count("hits")
+                if result.attrs.pop("persist_cache_series", False):
+                    series = result.iloc[:, 0]
+                    return series.rename(None) if series.name == _SERIES else series
+                return result
+
+        result = func(*args, **kwargs)
+        if not isinstance(result, (pd.DataFrame, pd.Series)):
+            _count("bypassed")
+            return result
+        if isinstance(result, pd.Series):
+            frame = result.to_frame(_SERIES if result.name is None else result.name)
+        else:
+            frame = result.copy(deep=False)  # own attrs, data not copied
+        frame.attrs["persist_cache_series"] = isinstance(result, pd.Series)
+        store.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            frame.to_parquet(tmp_path)
+        except Exception as error:  # e.g. mixed types in an object column
+            tmp_path.unlink(missing_ok=True)
+            warn(f"[WARNING] {prefix} result not cached: {error!r}")
+            _count("bypassed")
+            return result
+        os.replace(tmp_path, file_path)  # readers never see a partial file
+        _count("misses")
+        _evict(store, max_bytes)
+        return result
+
+    def cache_info() -> CacheInfo:
+        sizes = [path.stat().st_size for path in store.glob(f"{prefix}-*.parquet")]
+        with lock:
+            return CacheInfo(
+                stats.hits, stats.misses, stats.bypassed, len(sizes), sum(sizes))
+
+    def cache_clear():
+        for path in store.glob(f"{prefix}-*.parquet"):
+            path.unlink(missing_ok=True)
+        with lock:
+            stats.hits = stats.misses = stats.bypassed = 0
+
+    persist_cache_wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    persist_cache_wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return persist_cache_wrapper
+
+
 def contruct_function_args_from_locals(function, locals_args):
     specified_args = {
         key: value for key, value in locals_args.items() if key not in ["kwargs"]
@@ -56,6 +354,8 @@ def sanitize_function_args_from_locals(function, locals_args):
 
 
 def control_if_usecols_exist_in_df(**read_csv_args):
+    import pandas as pd
+
     if "usecols" not in read_csv_args:
         return read_csv_args
     read_csv_args_header = read_csv_args.copy()